@@ -0,0 +1,254 @@
+"""Benchmark the stages of loading a spec, on synthetic specs of a chosen shape.
+
+Every stage is timed over several runs, then run once more under
+tracemalloc for its peak traced memory and the number of memory blocks it
+leaves allocated. Results are printed (or written) as JSON, and can be
+compared against a previous result to fail on regressions::
+
+    python -m benchmarks.load --paths 2000 --output current.json
+    python -m benchmarks.load --paths 2000 --baseline current.json
+"""
+
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import click
+import msgspec
+
+from benchmarks.synthetic_spec import SpecShape, synthetic_spec
+from src.service.server import MockServer
+from src.utils.decoder import CustomDecoder
+from src.utils.open_api_parser import OpenAPIParser
+from src.utils.spec_cache import SpecCache, _dymock_version
+from src.utils.spec_decoder import SpecDecoder
+from src.utils.spec_index import SpecIndex
+
+
+DEFAULT_SHAPE = SpecShape()
+
+
+class Stage(NamedTuple):
+    """A measured step: ``setup`` builds its input, untimed, ``run`` consumes it."""
+
+    name: str
+    setup: Callable[[], Any]
+    run: Callable[[Any], Any]
+
+
+def _quiet(function: Callable[..., Any], *args: Any) -> Any:
+    """Call a function with its progress messages silenced."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args)
+
+
+def _stages(spec_path: Path, cache_dir: Path) -> List[Stage]:
+    data = spec_path.read_bytes()
+    document = msgspec.json.decode(data)
+    spec = OpenAPIParser().parse(data)
+    cache = SpecCache(cache_dir)
+    key = cache.key(data, path=spec_path)
+    cache.store(key, spec)
+
+    def server(lazy: bool) -> Callable[[], MockServer]:
+        return lambda: _quiet(partial(MockServer, str(spec_path), lazy=lazy))
+
+    return [
+        Stage("json_parse", SpecDecoder, lambda decoder: decoder.parse(data)),
+        Stage("open_api_parser", OpenAPIParser, lambda parser: parser.parse(data)),
+        Stage(
+            "open_api_parser_lazy",
+            OpenAPIParser,
+            lambda parser: parser.parse(data, lazy=True),
+        ),
+        Stage(
+            "custom_decoder",
+            CustomDecoder,
+            lambda decoder: decoder.decode_openapi(document),
+        ),
+        Stage("spec_cache_load", lambda: cache, lambda cache: cache.load(key)),
+        Stage("spec_index", lambda: spec, SpecIndex),
+        Stage(
+            "register_routes",
+            server(lazy=False),
+            lambda server: _quiet(server._register_routes, server._mock_spec),
+        ),
+        Stage(
+            "register_routes_lazy",
+            server(lazy=True),
+            lambda server: _quiet(server._register_routes, server._mock_spec),
+        ),
+    ]
+
+
+def measure(stage: Stage, repeat: int) -> Dict[str, Any]:
+    """Wall time over ``repeat`` runs, then memory over one traced run."""
+    times = []
+    for _ in range(repeat):
+        state = stage.setup()
+        start = time.perf_counter()
+        stage.run(state)
+        times.append(time.perf_counter() - start)
+
+    state = stage.setup()
+    tracemalloc.start()
+    blocks = sys.getallocatedblocks()
+    result = stage.run(state)
+    retained_blocks = sys.getallocatedblocks() - blocks
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {
+        "wall_seconds": {
+            "min": min(times),
+            "median": statistics.median(times),
+            "max": max(times),
+        },
+        "peak_bytes": peak,
+        "retained_blocks": retained_blocks,
+    }
+
+
+def run_benchmarks(
+    shape: SpecShape, repeat: int = 5, stages: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Generate a spec of the given shape and measure every (or the named) stage."""
+    document = msgspec.json.encode(synthetic_spec(shape))
+    with tempfile.TemporaryDirectory() as directory:
+        spec_path = Path(directory) / "synthetic.json"
+        spec_path.write_bytes(document)
+        results = {}
+        for stage in _stages(spec_path, Path(directory) / "cache"):
+            if stages is None or stage.name in stages:
+                results[stage.name] = measure(stage, repeat)
+    return {
+        "shape": shape.to_dict(),
+        "spec_bytes": len(document),
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "dymock": _dymock_version(),
+        "stages": results,
+    }
+
+
+def regressions(
+    current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Stages whose median time or peak memory grew by more than ``tolerance``."""
+    found = []
+    for name, result in current["stages"].items():
+        previous = baseline.get("stages", {}).get(name)
+        if previous is None:
+            continue
+        metrics = (
+            (
+                "median time",
+                result["wall_seconds"]["median"],
+                previous["wall_seconds"]["median"],
+            ),
+            ("peak memory", result["peak_bytes"], previous["peak_bytes"]),
+        )
+        for metric, value, reference in metrics:
+            if reference and value > reference * (1 + tolerance):
+                found.append(
+                    f"{name}: {metric} {value:.4g} vs {reference:.4g} "
+                    f"(+{value / reference - 1:.0%})"
+                )
+    return found
+
+
+@click.command()
+@click.option("--paths", default=DEFAULT_SHAPE.paths, type=click.IntRange(min=1))
+@click.option(
+    "--operations-per-path",
+    default=DEFAULT_SHAPE.operations_per_path,
+    type=click.IntRange(1, 8),
+)
+@click.option(
+    "--schema-depth", default=DEFAULT_SHAPE.schema_depth, type=click.IntRange(min=0)
+)
+@click.option(
+    "--schema-width", default=DEFAULT_SHAPE.schema_width, type=click.IntRange(min=1)
+)
+@click.option(
+    "--ref-density",
+    default=DEFAULT_SHAPE.ref_density,
+    type=click.FloatRange(0, 1),
+    help="Fraction of nested and body schemas that are $ref to components.",
+)
+@click.option(
+    "--components", default=DEFAULT_SHAPE.components, type=click.IntRange(min=0)
+)
+@click.option("--seed", default=DEFAULT_SHAPE.seed, type=int)
+@click.option(
+    "--repeat", default=5, type=click.IntRange(min=1), help="Timed runs per stage."
+)
+@click.option(
+    "--stage", "stages", multiple=True, help="Only run this stage. Repeatable."
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False),
+    help="Write the JSON results to this file.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Previous results; exit with status 1 if a stage regressed.",
+)
+@click.option(
+    "--tolerance",
+    default=0.25,
+    type=click.FloatRange(min=0),
+    help="Allowed growth over the baseline before a stage counts as a regression.",
+)
+def main(
+    paths,
+    operations_per_path,
+    schema_depth,
+    schema_width,
+    ref_density,
+    components,
+    seed,
+    repeat,
+    stages,
+    output,
+    baseline,
+    tolerance,
+):
+    """Measure how loading a spec scales with its size and structure."""
+    shape = SpecShape(
+        paths=paths,
+        operations_per_path=operations_per_path,
+        schema_depth=schema_depth,
+        schema_width=schema_width,
+        ref_density=ref_density,
+        components=components,
+        seed=seed,
+    )
+    results = run_benchmarks(shape, repeat=repeat, stages=list(stages) or None)
+    encoded = json.dumps(results, indent=2)
+    if output:
+        Path(output).write_text(encoded + "\n")
+    else:
+        click.echo(encoded)
+
+    if baseline:
+        found = regressions(results, json.loads(Path(baseline).read_text()), tolerance)
+        for regression in found:
+            click.echo(f"Regression: {regression}", err=True)
+        if found:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import random
+from typing import Any, Dict, List, NamedTuple
+
+from src.utils.spec_decoder import HTTP_METHODS
+
+# Methods that carry a request body in generated operations
+_BODY_METHODS = {"post", "put", "patch"}
+_LEAF_SCHEMAS = (
+    {"type": "string"},
+    {"type": "string", "format": "email"},
+    {"type": "string", "format": "date-time"},
+    {"type": "integer", "minimum": 0, "maximum": 1000},
+    {"type": "number"},
+    {"type": "boolean"},
+    {"type": "string", "enum": ["active", "inactive", "pending"]},
+)
+
+
+class SpecShape(NamedTuple):
+    """Size and structure of a generated spec.
+
+    ``ref_density`` is the fraction of nested and response schemas that
+    are ``$ref`` to a component schema instead of inline objects.
+    """
+
+    paths: int = 100
+    operations_per_path: int = 2
+    schema_depth: int = 2
+    schema_width: int = 5
+    ref_density: float = 0.3
+    components: int = 20
+    seed: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+class _Generator:
+    def __init__(self, shape: SpecShape):
+        if not 1 <= shape.operations_per_path <= len(HTTP_METHODS):
+            raise ValueError(
+                f"operations_per_path must be between 1 and {len(HTTP_METHODS)}"
+            )
+        if not 0 <= shape.ref_density <= 1:
+            raise ValueError("ref_density must be between 0 and 1")
+        self.shape = shape
+        self.rng = random.Random(shape.seed)
+
+    def ref(self, lowest: int = 0) -> Dict[str, str]:
+        target = self.rng.randrange(lowest, self.shape.components)
+        return {"$ref": f"#/components/schemas/Model{target}"}
+
+    def schema(self, depth: int, lowest: int = 0) -> Dict[str, Any]:
+        """An object schema nested ``depth`` levels deep.
+
+        References only target components from ``lowest`` up, so components
+        reference later ones and the generated document has no cycles.
+        """
+        properties = {}
+        for position in range(self.shape.schema_width):
+            name = f"field{position}"
+            if depth > 0 and position % 2 == 0:
+                if lowest < self.shape.components and (
+                    self.rng.random() < self.shape.ref_density
+                ):
+                    properties[name] = self.ref(lowest)
+                elif position % 4 == 0:
+                    properties[name] = {
+                        "type": "array",
+                        "items": self.schema(depth - 1, lowest),
+                    }
+                else:
+                    properties[name] = self.schema(depth - 1, lowest)
+            else:
+                properties[name] = dict(self.rng.choice(_LEAF_SCHEMAS))
+        return {
+            "type": "object",
+            "required": list(properties)[: max(1, len(properties) // 2)],
+            "properties": properties,
+        }
+
+    def body_schema(self) -> Dict[str, Any]:
+        if self.shape.components and self.rng.random() < self.shape.ref_density:
+            return self.ref()
+        return self.schema(self.shape.schema_depth)
+
+    def operation(self, method: str, number: int, templated: bool) -> Dict[str, Any]:
+        parameters: List[Dict[str, Any]] = [
+            {
+                "name": "limit",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "integer", "minimum": 1, "maximum": 100},
+            }
+        ]
+        operation: Dict[str, Any] = {
+            "operationId": f"{method}Resource{number}",
+            "tags": [f"group{number % 10}"],
+            "parameters": parameters,
+            "responses": {
+                "200": {
+                    "description": "Success",
+                    "content": {"application/json": {"schema": self.body_schema()}},
+                },
+                "404": {"description": "Not found"},
+            },
+        }
+        if templated:
+            parameters.append(
+                {
+                    "name": "id",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "integer"},
+                }
+            )
+        if method in _BODY_METHODS:
+            operation["requestBody"] = {
+                "required": True,
+                "content": {"application/json": {"schema": self.body_schema()}},
+            }
+        return operation
+
+    def document(self) -> Dict[str, Any]:
+        shape = self.shape
+        schemas = {
+            f"Model{number}": self.schema(shape.schema_depth, lowest=number + 1)
+            for number in range(shape.components)
+        }
+        paths = {}
+        for number in range(shape.paths):
+            templated = number % 2 == 1
+            path = f"/resources{number}/{{id}}" if templated else f"/resources{number}"
+            paths[path] = {
+                method: self.operation(method, number, templated)
+                for method in HTTP_METHODS[: shape.operations_per_path]
+            }
+        return {
+            "openapi": "3.0.3",
+            "info": {"title": "Synthetic API", "version": "1.0.0"},
+            "paths": paths,
+            "components": {"schemas": schemas},
+        }
+
+
+def synthetic_spec(shape: SpecShape = SpecShape()) -> Dict[str, Any]:
+    """Generate an OpenAPI document of the given shape, identical for a given seed."""
+    return _Generator(shape).document()
@@ -1,7 +1,38 @@
 import click
 import uvicorn
 
+from src.service.request_body import DEFAULT_MAX_BODY_SIZE
+from src.service.router import FASTAPI_ROUTER, RADIX_ROUTER, ROUTERS
 from src.service.server import MockServer
+from src.service.validation_policy import ValidationPolicy
+from src.utils.spec_cache import default_cache_dir
+
+
+def _parse_formats(ctx, param, values):
+    formats = {}
+    for value in values:
+        name, _, provider = value.partition("=")
+        if not name or not provider:
+            raise click.BadParameter(f"expected NAME=PROVIDER, got '{value}'")
+        formats[name] = provider
+    return formats
+
+
+def _parse_validation(ctx, param, value):
+    try:
+        return ValidationPolicy.parse(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+def _parse_tag_validation(ctx, param, values):
+    policies = {}
+    for value in values:
+        tag, _, mode = value.partition("=")
+        if not tag or not mode:
+            raise click.BadParameter(f"expected TAG=MODE, got '{value}'")
+        policies[tag] = _parse_validation(ctx, param, mode)
+    return policies
 
 
 @click.group()
@@ -20,12 +51,152 @@ def cli():
 )
 @click.option("--host", "-h", default="127.0.0.1", help="Host to run the server on.")
 @click.option("--port", "-p", default=8000, type=int, help="Port to run the server on.")
-def run(spec, host, port):
+@click.option(
+    "--max-ref-depth",
+    default=3,
+    type=click.IntRange(min=0),
+    help="How many times recursive schemas are expanded in generated data.",
+)
+@click.option(
+    "--pool-size",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Pre-encoded responses kept per operation (0 disables pooling).",
+)
+@click.option(
+    "--pool-refresh",
+    default=0.0,
+    type=click.FloatRange(min=0),
+    help="Seconds between background regenerations of each pool (0 never refreshes).",
+)
+@click.option(
+    "--seed",
+    default=None,
+    type=int,
+    help="Global seed making responses deterministic per request identity.",
+)
+@click.option(
+    "--seed-param",
+    "seed_params",
+    multiple=True,
+    help="Query parameter included in the request identity (default: all). Repeatable.",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Stream array responses incrementally instead of building them in memory.",
+)
+@click.option(
+    "--format",
+    "formats",
+    multiple=True,
+    callback=_parse_formats,
+    metavar="NAME=PROVIDER",
+    help="Generate string format NAME with a Faker provider, e.g. phone=phone_number. Repeatable.",
+)
+@click.option(
+    "--example-first",
+    is_flag=True,
+    help="Serve the spec's response examples, when present, instead of generated data.",
+)
+@click.option(
+    "--max-body-size",
+    default=DEFAULT_MAX_BODY_SIZE,
+    type=click.IntRange(min=0),
+    help="Largest request body accepted, in bytes (larger bodies get a 413).",
+)
+@click.option(
+    "--validation",
+    default=ValidationPolicy.STRICT,
+    callback=_parse_validation,
+    metavar="MODE",
+    help="Request validation: strict, sampled:RATE, log-only or off.",
+)
+@click.option(
+    "--tag-validation",
+    multiple=True,
+    callback=_parse_tag_validation,
+    metavar="TAG=MODE",
+    help="Request validation of the operations tagged TAG, e.g. search=sampled:0.01. Repeatable.",
+)
+@click.option(
+    "--spec-cache",
+    default=default_cache_dir,
+    type=click.Path(file_okay=False),
+    show_default="~/.cache/dymock",
+    help="Directory caching decoded specs, so unchanged specs are not parsed again.",
+)
+@click.option(
+    "--no-spec-cache",
+    is_flag=True,
+    help="Always parse the spec, without reading or writing the spec cache.",
+)
+@click.option(
+    "--lazy",
+    is_flag=True,
+    help="Decode and compile each operation on its first request, for very large specs.",
+)
+@click.option(
+    "--router",
+    default=FASTAPI_ROUTER,
+    type=click.Choice(ROUTERS),
+    show_default=True,
+    help="Dispatch spec operations with FastAPI's routes, or with one radix tree (faster for large specs).",
+)
+@click.option(
+    "--fast-path",
+    is_flag=True,
+    help="Serve spec operations from a plain ASGI app, bypassing FastAPI per request (implies --router radix).",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Reload the spec when it or a file it references changes, updating only the affected routes.",
+)
+def run(
+    spec,
+    host,
+    port,
+    max_ref_depth,
+    pool_size,
+    pool_refresh,
+    seed,
+    seed_params,
+    stream,
+    formats,
+    example_first,
+    max_body_size,
+    validation,
+    tag_validation,
+    spec_cache,
+    no_spec_cache,
+    lazy,
+    router,
+    fast_path,
+    watch,
+):
     """Run the mock API server."""
     try:
         click.echo(f"Loading OpenAPI specification from: {spec}")
-        server = MockServer(spec_path=spec)
-        app = server.create_app()
+        server = MockServer(
+            spec_path=spec,
+            max_ref_depth=max_ref_depth,
+            pool_size=pool_size,
+            pool_refresh=pool_refresh,
+            seed=seed,
+            seed_query_params=seed_params or None,
+            stream=stream,
+            formats=formats,
+            example_first=example_first,
+            max_body_size=max_body_size,
+            validation=validation,
+            tag_validation=tag_validation,
+            spec_cache=None if no_spec_cache else spec_cache,
+            lazy=lazy,
+            watch=watch,
+            router=RADIX_ROUTER if fast_path else router,
+        )
+        app = server.create_asgi_app() if fast_path else server.create_app()
         click.echo(f"Starting mock server on http://{host}:{port}")
         click.echo("Press Ctrl+C to stop the server")
         uvicorn.run(app, host=host, port=port)
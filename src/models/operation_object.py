@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Mapping, Optional, Union
+from typing import Any, Dict, Mapping, Optional, Union
 
 from msgspec import field
 
@@ -33,3 +33,4 @@ class OperationObject(BaseStruct):
     deprecated: bool = False
     security: Optional[list[SecurityRequirementObject]] = field(default_factory=list)
     servers: Optional[list[ServerObject]] = field(default_factory=list)
+    extensions: Optional[Dict[str, Any]] = field(default_factory=dict)
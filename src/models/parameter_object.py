@@ -20,8 +20,8 @@ class ParameterObject(BaseStruct):
     deprecated: Optional[bool] = None
     allowEmptyValue: Optional[bool] = None
     style: Optional[str] = None
-    explode: Optional[str] = None
-    allowReserved: Optional[str] = None
+    explode: Optional[bool] = None
+    allowReserved: Optional[bool] = None
     schema: Optional[SchemaObject] = None
     example: Optional[Any] = None
     examples: Optional[list[Mapping[str, ExampleObject | ReferenceObject]]] = field(
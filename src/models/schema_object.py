@@ -18,7 +18,18 @@ class SchemaObject(BaseStruct):
     oneOf: Optional[List["SchemaObject"]] = None
     additionalProperties: Optional[bool] = None
     default: Optional[Any] = None
+    example: Optional[Any] = None
     pattern: Optional[str] = None
     maxLength: Optional[int] = None
     minLength: Optional[int] = None
     format: Optional[str] = None
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    # OpenAPI 3.0 uses booleans modifying minimum/maximum, 3.1 uses the bound itself
+    exclusiveMinimum: Optional[bool | float] = None
+    exclusiveMaximum: Optional[bool | float] = None
+    multipleOf: Optional[float] = None
+    minItems: Optional[int] = None
+    maxItems: Optional[int] = None
+    uniqueItems: Optional[bool] = None
+    nullable: Optional[bool] = None
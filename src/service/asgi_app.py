@@ -0,0 +1,68 @@
+from fastapi import Request
+from starlette._utils import get_route_path
+from starlette.exceptions import HTTPException
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.service.responses import MsgspecJSONResponse, has_body
+from src.service.router import Endpoint, SpecRouter
+
+
+def _error_response(exc: HTTPException) -> Response:
+    """The response FastAPI's default handler gives an HTTPException."""
+    if not has_body(exc.status_code):
+        return Response(status_code=exc.status_code, headers=exc.headers)
+    return MsgspecJSONResponse(
+        {"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers
+    )
+
+
+class FastPathApp:
+    """Plain ASGI application answering spec operations without FastAPI.
+
+    A request whose path and method match a spec operation goes straight
+    from the radix router to the operation's compiled handler, and the
+    response it returns, pre-encoded pool entry or freshly encoded body, is
+    written with two ``send`` calls: no middleware stack, dependency
+    solving or response model plumbing. Everything else (introspection,
+    docs, 404 and 405 answers, lifespan) is passed to the FastAPI app.
+    """
+
+    def __init__(self, router: SpecRouter, fallback: ASGIApp):
+        self._router = router
+        self._fallback = fallback
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            found = self._router.lookup(get_route_path(scope))
+            if found is not None:
+                _, endpoints, params = found
+                endpoint = endpoints.get(scope["method"])
+                if endpoint is not None:
+                    scope["path_params"] = params
+                    await self._dispatch(endpoint, scope, receive, send)
+                    return
+        await self._fallback(scope, receive, send)
+
+    @staticmethod
+    async def _dispatch(
+        endpoint: Endpoint, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        try:
+            response = await endpoint(Request(scope, receive, send))
+        except HTTPException as e:
+            response = _error_response(e)
+
+        body = getattr(response, "body", None)
+        if body is None:
+            # Streamed responses write their own chunks
+            await response(scope, receive, send)
+            return
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": response.raw_headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
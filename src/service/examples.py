@@ -0,0 +1,62 @@
+from typing import Any, Dict, Optional
+
+from src.models.example_object import ExampleObject
+from src.models.media_type_object import MediaTypeObject
+from src.models.schema_object import SchemaObject
+from src.utils.ref_resolver import RefResolver
+
+# Query parameter selecting a named example, for clients that cannot set headers
+EXAMPLE_QUERY_PARAM = "__example"
+
+# Name given to the single example of MediaTypeObject.example, schema example or default
+DEFAULT_EXAMPLE = "default"
+
+_MISSING = object()
+
+
+def collect_examples(
+    media: Optional[MediaTypeObject], resolver: RefResolver
+) -> Dict[str, Any]:
+    """Collect the example values of a response's media type, by name.
+
+    Named ``examples`` come first, in document order, then the media type's
+    ``example``, then the ``example`` or ``default`` of its schema. The first
+    entry is the one served when no example is requested by name. Examples
+    that only have an ``externalValue`` are skipped.
+    """
+    if media is None:
+        return {}
+
+    examples: Dict[str, Any] = {}
+    for name, example in (media.examples or {}).items():
+        example = resolver.resolve(example)
+        if isinstance(example, ExampleObject) and example.value is not None:
+            examples[name] = example.value
+
+    value = _single_example(media, resolver)
+    if value is not _MISSING:
+        examples.setdefault(DEFAULT_EXAMPLE, value)
+    return examples
+
+
+def _single_example(media: MediaTypeObject, resolver: RefResolver) -> Any:
+    if media.example is not None:
+        return media.example
+    schema = resolver.resolve(media.schema)
+    if isinstance(schema, SchemaObject):
+        if schema.example is not None:
+            return schema.example
+        if schema.default is not None:
+            return schema.default
+    return _MISSING
+
+
+def requested_example(prefer: str, query: Optional[str]) -> Optional[str]:
+    """Name of the example asked for by a ``Prefer: example=name`` header or query."""
+    if query:
+        return query
+    for preference in prefer.replace(";", ",").split(","):
+        key, _, value = preference.partition("=")
+        if key.strip().lower() == "example":
+            return value.strip().strip('"') or None
+    return None
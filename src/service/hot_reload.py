@@ -0,0 +1,115 @@
+import asyncio
+import os
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+)
+
+from src.utils.ref_resolver import RefResolver
+from src.utils.spec_decoder import LazyPaths
+from src.utils.spec_index import RouteKey, SpecIndex
+
+# Seconds between two checks of the watched files
+DEFAULT_WATCH_INTERVAL = 0.5
+
+
+class RouteDiff(NamedTuple):
+    """Routes to add, remove and rebuild to go from one spec to the next."""
+
+    added: List[RouteKey]
+    removed: List[RouteKey]
+    replaced: List[RouteKey]
+
+
+def route_definitions(index: SpecIndex) -> Dict[RouteKey, Any]:
+    """What defines each operation of a spec, comparable between two loads.
+
+    That is the operation with its path-level parameters, decoded, or raw
+    for lazily decoded paths so that diffing does not decode them.
+    """
+    paths = index.paths
+    if isinstance(paths, LazyPaths):
+        return {
+            (method, path): (paths.raw[path][method], paths.raw[path].get("parameters"))
+            for method, path in index.routes
+        }
+    return {
+        (method, path): (getattr(paths[path], method), paths[path].parameters)
+        for method, path in index.routes
+    }
+
+
+def changed_components(old: SpecIndex, new: SpecIndex) -> Set[str]:
+    """References of the components added, removed or modified between two specs."""
+    return {
+        ref
+        for ref in old.refs.keys() | new.refs.keys()
+        if old.refs.get(ref) != new.refs.get(ref)
+    }
+
+
+def diff_routes(old: SpecIndex, new: SpecIndex, resolver: RefResolver) -> RouteDiff:
+    """Compare the operations of two specs.
+
+    An operation is replaced when its own definition changed, or when one
+    of the components it uses, directly or through other components, did.
+    ``resolver`` resolves the references of the new spec.
+    """
+    old_routes = route_definitions(old)
+    new_routes = route_definitions(new)
+    changed = changed_components(old, new)
+
+    replaced = []
+    for key in old_routes.keys() & new_routes.keys():
+        definition = new_routes[key]
+        if old_routes[key] != definition or (
+            changed and not changed.isdisjoint(resolver.reachable_refs(definition))
+        ):
+            replaced.append(key)
+    return RouteDiff(
+        added=[key for key in new_routes if key not in old_routes],
+        removed=[key for key in old_routes if key not in new_routes],
+        replaced=sorted(replaced),
+    )
+
+
+class SpecWatcher:
+    """Polls the modification times of a spec and of the files it was bundled from."""
+
+    def __init__(
+        self,
+        files: Callable[[], Iterable[str]],
+        on_change: Callable[[], Awaitable[Any]],
+        interval: float = DEFAULT_WATCH_INTERVAL,
+    ):
+        self._files = files
+        self._on_change = on_change
+        self.interval = interval
+
+    def snapshot(self) -> Dict[str, Optional[int]]:
+        """Modification time of every watched file, None for missing files."""
+        mtimes: Dict[str, Optional[int]] = {}
+        for path in self._files():
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[path] = None
+        return mtimes
+
+    async def run(self) -> None:
+        seen = await asyncio.to_thread(self.snapshot)
+        while True:
+            await asyncio.sleep(self.interval)
+            current = await asyncio.to_thread(self.snapshot)
+            if current != seen:
+                await self._on_change()
+                # The set of watched files may have changed with the spec
+                current = await asyncio.to_thread(self.snapshot)
+            seen = current
@@ -0,0 +1,47 @@
+from typing import Any, Dict, Iterable
+
+from src.service.route_plan import RoutePlan
+from src.service.validation_policy import ValidationPolicy
+from src.utils.spec_index import RouteKey, SpecIndex
+
+# Prefix of the mock server's own endpoints, kept out of the way of spec paths
+INTROSPECTION_PREFIX = "/__dymock"
+STATS_PATH = f"{INTROSPECTION_PREFIX}/stats"
+VALIDATION_PATH = f"{INTROSPECTION_PREFIX}/validation/{{operation_id}}"
+
+
+def route_stats(plans: Iterable[RoutePlan]) -> Dict[str, Any]:
+    """Validation policy and counters of every registered route."""
+    return {
+        "routes": [
+            {
+                "operationId": plan.operation_id,
+                "method": plan.method.upper(),
+                "path": plan.path,
+                "validation": plan.validation.to_dict(),
+                **plan.validation_stats.to_dict(),
+            }
+            for plan in plans
+        ]
+    }
+
+
+def update_validation(
+    plans: Dict[RouteKey, RoutePlan], index: SpecIndex, operation_id: str, policy: Any
+) -> Dict[str, Any]:
+    """Replace the validation policy of one operation, or of all of them with ``*``.
+
+    The operation is found through the spec index's operationId table.
+    Raises ValueError for an invalid policy and KeyError for an unknown operation.
+    """
+    policy = ValidationPolicy.parse(policy)
+    if operation_id == "*":
+        targets = list(plans.values())
+    else:
+        plan = plans.get(index.operation_ids.get(operation_id))
+        targets = [plan] if plan is not None else []
+    if not targets:
+        raise KeyError(operation_id)
+    for plan in targets:
+        plan.validation = policy
+    return route_stats(targets)
@@ -0,0 +1,269 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import math
+
+import msgspec
+from fastapi import Request
+
+from src.models.parameter_object import ParameterObject
+from src.models.schema_object import SchemaObject
+from src.utils.ref_resolver import RefResolver
+from src.utils.schema_validator import ValidationError, ValidatorCompiler
+
+# Request scope key holding the coerced parameters, by location then name
+PARAMS_SCOPE_KEY = "dymock.params"
+
+# Coerced parameters of a request: {"path": {...}, "query": {...}, ...}
+Parameters = Dict[str, Dict[str, Any]]
+
+# Turns the raw string(s) of one parameter into a typed value
+CoerceFn = Callable[[List[str]], Any]
+
+LOCATIONS = ("path", "query", "header", "cookie")
+
+# Default serialization style of each parameter location
+_DEFAULT_STYLES = {
+    "path": "simple",
+    "query": "form",
+    "header": "simple",
+    "cookie": "form",
+}
+_DELIMITERS = {"form": ",", "simple": ",", "spaceDelimited": " ", "pipeDelimited": "|"}
+
+_MISSING = object()
+
+
+class ParameterError(ValueError):
+    """A request parameter that is missing or does not match its schema."""
+
+
+class ParameterCoercer:
+    """Coerces the path, query, header and cookie parameters of one operation.
+
+    Every parameter's location, style, explode flag and schema are resolved
+    when the route is registered, into one coercer and one compiled
+    validator per parameter, so a request only parses the values it has.
+    """
+
+    def __init__(
+        self,
+        parameters: Iterable[ParameterObject],
+        resolver: Optional[RefResolver] = None,
+        validators: Optional[ValidatorCompiler] = None,
+    ):
+        self._resolver = resolver
+        validators = validators or ValidatorCompiler(resolver)
+        # One (location, name, required, default, read, coerce, validate) per parameter
+        self._steps: List[tuple] = []
+        for parameter in parameters:
+            location = parameter.param_in
+            if location not in LOCATIONS or not parameter.name:
+                continue
+            schema, coerce = self._compile_coercer(parameter)
+            resolved = self._resolve_schema(schema)
+            default = _MISSING
+            if isinstance(resolved, SchemaObject) and resolved.default is not None:
+                default = resolved.default
+            self._steps.append(
+                (
+                    location,
+                    parameter.name,
+                    # Path parameters are always required
+                    bool(parameter.required) or location == "path",
+                    default,
+                    self._compile_reader(parameter, location, schema),
+                    coerce,
+                    validators.compile(schema) if schema is not None else None,
+                )
+            )
+
+    def __bool__(self) -> bool:
+        return bool(self._steps)
+
+    def coerce(self, request: Request) -> Parameters:
+        """Parse, type and validate the request's parameters, raising ParameterError."""
+        sources = {
+            "path": request.path_params,
+            "query": request.query_params,
+            "header": request.headers,
+            "cookie": request.cookies,
+        }
+        parameters: Parameters = {location: {} for location in LOCATIONS}
+        for location, name, required, default, read, coerce, validate in self._steps:
+            raw = read(sources[location])
+            if raw is None:
+                if required:
+                    raise ParameterError(
+                        f"Missing required {location} parameter '{name}'"
+                    )
+                if default is not _MISSING:
+                    parameters[location][name] = default
+                continue
+            try:
+                value = coerce(raw)
+                if validate is not None:
+                    validate(value)
+            except (ValueError, msgspec.DecodeError) as e:
+                raise ParameterError(
+                    f"Invalid {location} parameter '{name}': {e}"
+                ) from e
+            parameters[location][name] = value
+        return parameters
+
+    def _resolve_schema(self, schema: Any) -> Any:
+        return self._resolver.resolve(schema) if self._resolver else schema
+
+    def _compile_coercer(self, parameter: ParameterObject) -> Tuple[Any, CoerceFn]:
+        """Return the parameter's schema and the coercer of its raw values."""
+        if parameter.content:
+            # Parameters with content carry a serialized (JSON) value
+            media = next(iter(parameter.content.values()))
+            schema = getattr(media, "schema", None)
+            return schema, lambda raw: msgspec.json.decode(raw[0])
+
+        schema = parameter.schema
+        resolved = self._resolve_schema(schema)
+        if not isinstance(resolved, SchemaObject):
+            return schema, lambda raw: raw[0]
+
+        style, explode = _style(parameter)
+        if resolved.type == "array":
+            coerce_item = _scalar_coercer(self._resolve_schema(resolved.items))
+            delimiter = _DELIMITERS.get(style, ",")
+            if explode and style == "form":
+                # Repeated keys: ?id=1&id=2
+                return schema, lambda raw: [coerce_item(item) for item in raw]
+            return schema, lambda raw: [
+                coerce_item(item) for item in raw[0].split(delimiter)
+            ]
+        if resolved.type == "object":
+            return schema, self._object_coercer(resolved, style, explode)
+        return schema, _first(_scalar_coercer(resolved))
+
+    def _object_coercer(
+        self, schema: SchemaObject, style: str, explode: bool
+    ) -> CoerceFn:
+        properties = {
+            name: _scalar_coercer(self._resolve_schema(prop_schema))
+            for name, prop_schema in (schema.properties or {}).items()
+        }
+
+        def coerce_pairs(pairs: Iterable[Tuple[str, str]]) -> Dict[str, Any]:
+            return {
+                key: properties[key](value) if key in properties else value
+                for key, value in pairs
+            }
+
+        if style == "deepObject" or (explode and style == "form"):
+            # The reader already collected the key/value pairs
+            return lambda raw: coerce_pairs(raw)
+        if explode:
+            # simple, exploded: "role=admin,firstName=Alex"
+            return lambda raw: coerce_pairs(
+                item.partition("=")[::2] for item in raw[0].split(",")
+            )
+
+        def coerce_flat(raw: List[str]) -> Dict[str, Any]:
+            # "role,admin,firstName,Alex"
+            items = raw[0].split(",")
+            if len(items) % 2:
+                raise ValueError("Expected key,value pairs")
+            return coerce_pairs(zip(items[::2], items[1::2]))
+
+        return coerce_flat
+
+    def _compile_reader(
+        self, parameter: ParameterObject, location: str, schema: Any
+    ) -> Callable[[Any], Optional[List[str]]]:
+        """Compile the lookup of a parameter's raw values in its request source."""
+        name = parameter.name
+        resolved = self._resolve_schema(schema)
+        style, explode = _style(parameter)
+
+        # Parameters with content are a single serialized value, whatever their schema
+        if (
+            location == "query"
+            and not parameter.content
+            and isinstance(resolved, SchemaObject)
+        ):
+            if resolved.type == "object" and style == "deepObject":
+                prefix = f"{name}["
+                return lambda source: (
+                    [
+                        (key[len(prefix) : -1], value)
+                        for key, value in source.multi_items()
+                        if key.startswith(prefix) and key.endswith("]")
+                    ]
+                    or None
+                )
+            if resolved.type == "object" and style == "form" and explode:
+                names = set(resolved.properties or ())
+                return lambda source: (
+                    [
+                        (key, value)
+                        for key, value in source.multi_items()
+                        if key in names
+                    ]
+                    or None
+                )
+            if resolved.type == "array" and explode and style == "form":
+                return lambda source: source.getlist(name) or None
+
+        def read(source: Any) -> Optional[List[str]]:
+            value = source.get(name)
+            return None if value is None else [value]
+
+        return read
+
+
+def _style(parameter: ParameterObject) -> Tuple[str, bool]:
+    """Serialization style of a parameter and whether it is exploded."""
+    style = parameter.style or _DEFAULT_STYLES[parameter.param_in]
+    explode = parameter.explode if parameter.explode is not None else style == "form"
+    return style, explode
+
+
+def _first(coerce: Callable[[str], Any]) -> CoerceFn:
+    return lambda raw: coerce(raw[0])
+
+
+def _scalar_coercer(schema: Any) -> Callable[[str], Any]:
+    """Coercer of one raw string into the primitive type of its schema."""
+    schema_type = schema.type if isinstance(schema, SchemaObject) else None
+    if schema_type == "integer":
+        return _parse_integer
+    if schema_type == "number":
+        return _parse_number
+    if schema_type == "boolean":
+        return _parse_boolean
+    return str
+
+
+def _parse_integer(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise ValidationError(f"Expected integer, got {value!r}") from None
+
+
+def _parse_number(value: str) -> float:
+    try:
+        number = float(value)
+    except ValueError:
+        number = math.nan
+    if not math.isfinite(number):
+        raise ValidationError(f"Expected number, got {value!r}")
+    return number
+
+
+def _parse_boolean(value: str) -> bool:
+    lowered = value.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    raise ValidationError(f"Expected boolean, got {value!r}")
+
+
+def parsed_parameters(request: Request) -> Parameters:
+    """Return the coerced parameters stored in the request scope."""
+    return request.scope.get(PARAMS_SCOPE_KEY) or {}
@@ -0,0 +1,62 @@
+from typing import Any
+
+import msgspec
+from fastapi import HTTPException, Request
+
+# Request scope key holding the decoded body, shared by every stage of a request
+BODY_SCOPE_KEY = "dymock.body"
+# Set while the stored body is still the raw bytes, not decoded yet
+_RAW_SCOPE_KEY = "dymock.body.raw"
+
+# Largest request body accepted by default, in bytes
+DEFAULT_MAX_BODY_SIZE = 10 * 1024 * 1024
+
+
+async def read_body(request: Request, max_size: int) -> bytes:
+    """Read the raw request body once, rejecting it as soon as it exceeds ``max_size``.
+
+    A declared Content-Length over the limit is refused before reading
+    anything; otherwise the body is streamed and counted chunk by chunk.
+    """
+    declared = request.headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > max_size:
+        raise _too_large(max_size)
+
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_size:
+            raise _too_large(max_size)
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def store_body(request: Request, body: Any, raw: bool = False) -> None:
+    """Attach the request body to the request scope, decoded or as raw JSON bytes."""
+    request.scope[BODY_SCOPE_KEY] = body
+    request.scope[_RAW_SCOPE_KEY] = raw
+
+
+def parsed_body(request: Request) -> Any:
+    """Return the decoded request body stored in the request scope, or None.
+
+    Bodies validated by a typed decoder, or not validated at all, are kept
+    as raw bytes and decoded to plain JSON values on first access. Typed
+    decoding drops unknown fields and converts formats, so it is not reused
+    here, and requests that never look at the body skip the second decode.
+    """
+    scope = request.scope
+    if scope.pop(_RAW_SCOPE_KEY, False):
+        try:
+            scope[BODY_SCOPE_KEY] = msgspec.json.decode(scope[BODY_SCOPE_KEY])
+        except msgspec.DecodeError:
+            # Unvalidated bodies may not be JSON at all, they stay raw bytes
+            pass
+    return scope.get(BODY_SCOPE_KEY)
+
+
+def _too_large(max_size: int) -> HTTPException:
+    return HTTPException(
+        status_code=413, detail=f"Request body exceeds {max_size} bytes"
+    )
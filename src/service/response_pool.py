@@ -0,0 +1,102 @@
+import asyncio
+from typing import Any, Callable, List, Tuple
+
+from src.service.responses import (
+    JSON_CONTENT_TYPE,
+    RawHeader,
+    content_length,
+    encoder,
+)
+
+# An encoded body with its complete, pre-built header list
+PooledBody = Tuple[bytes, List[RawHeader]]
+
+
+class ResponsePool:
+    """A ring buffer of pre-generated, pre-encoded response bodies for one operation.
+
+    Requests are answered from the buffer in round-robin order, so neither data
+    generation nor JSON encoding happens on the request path. A background task
+    periodically regenerates the buffer to keep the served data varied.
+    """
+
+    # Bodies regenerated between two yields to the event loop while refreshing
+    REFRESH_BATCH = 32
+    # Pool size used when an operation opts in without giving a size
+    DEFAULT_SIZE = 64
+
+    def __init__(
+        self,
+        generate: Callable[[], Any],
+        size: int,
+        refresh_interval: float = 0.0,
+    ):
+        if size < 1:
+            raise ValueError("Response pool size must be at least 1")
+        self._generate = generate
+        self._encode = encoder.encode
+        self.size = size
+        self.refresh_interval = refresh_interval
+        self._bodies: List[PooledBody] = [self._render() for _ in range(size)]
+        self._cursor = 0
+
+    def next_body(self) -> PooledBody:
+        """Return the next encoded body in the ring and its raw headers."""
+        cursor = self._cursor
+        self._cursor = (cursor + 1) % self.size
+        return self._bodies[cursor]
+
+    async def refresh_forever(self) -> None:
+        """Regenerate the whole pool every refresh interval until cancelled."""
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh()
+
+    async def refresh(self) -> None:
+        """Regenerate every slot, yielding to in-flight requests between batches."""
+        for start in range(0, self.size, self.REFRESH_BATCH):
+            for slot in range(start, min(start + self.REFRESH_BATCH, self.size)):
+                self._bodies[slot] = self._render()
+            await asyncio.sleep(0)
+
+    def _render(self) -> PooledBody:
+        body = self._encode(self._generate())
+        return body, [content_length(body), JSON_CONTENT_TYPE]
+
+    @classmethod
+    def settings_from_extension(
+        cls, extension: Any, size: int, refresh_interval: float
+    ) -> tuple[int, float]:
+        """Merge an operation's ``x-dymock-pool`` extension over the global settings.
+
+        The extension may be ``false`` to disable pooling, ``true`` to enable
+        it with the default size, a size, or an object with optional ``size``
+        and ``refresh`` keys.
+        """
+        if extension is None:
+            return size, refresh_interval
+        if isinstance(extension, bool):
+            return (size or cls.DEFAULT_SIZE) if extension else 0, refresh_interval
+        if isinstance(extension, int):
+            extension = {"size": extension}
+        if not isinstance(extension, dict):
+            raise ValueError(
+                "x-dymock-pool must be a boolean, a pool size or an object "
+                "with 'size' and 'refresh'"
+            )
+
+        pool_size = extension.get("size", size or cls.DEFAULT_SIZE)
+        refresh = extension.get("refresh", refresh_interval)
+        if (
+            isinstance(pool_size, bool)
+            or not isinstance(pool_size, int)
+            or pool_size < 0
+        ):
+            raise ValueError("x-dymock-pool size must be a non-negative integer")
+        if (
+            isinstance(refresh, bool)
+            or not isinstance(refresh, (int, float))
+            or refresh < 0
+        ):
+            raise ValueError("x-dymock-pool refresh must be a non-negative number")
+        return pool_size, float(refresh)
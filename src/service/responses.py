@@ -0,0 +1,82 @@
+import threading
+from typing import Any, List, Mapping, Optional, Tuple
+
+import msgspec
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+RawHeader = Tuple[bytes, bytes]
+
+JSON_CONTENT_TYPE: RawHeader = (b"content-type", b"application/json")
+
+# Shared by every response; msgspec encoders are safe to use from several threads
+encoder = msgspec.json.Encoder()
+
+_local = threading.local()
+
+
+def has_body(status_code: int) -> bool:
+    return not (status_code < 200 or status_code in (204, 304))
+
+
+def content_length(body: bytes) -> RawHeader:
+    return (b"content-length", str(len(body)).encode("latin-1"))
+
+
+def encoded_headers(
+    body: bytes, status_code: int, content_type: RawHeader
+) -> List[RawHeader]:
+    """Raw headers of an encoded body; statuses without a body get no Content-Length."""
+    if has_body(status_code):
+        return [content_length(body), content_type]
+    return [content_type]
+
+
+class MsgspecJSONResponse(Response):
+    """JSON response encoded by the shared msgspec encoder.
+
+    Bodies are encoded into a reusable per-thread buffer, so the encoder does
+    not grow a fresh buffer for every response. Routes pass their pre-built
+    ``content-type`` header, leaving only ``content-length`` to compute.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any = None,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        content_type: Optional[RawHeader] = None,
+    ):
+        self._content_type = content_type
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        if not has_body(self.status_code):
+            return b""
+        buffer = getattr(_local, "buffer", None)
+        if buffer is None:
+            buffer = _local.buffer = bytearray(4096)
+        encoder.encode_into(content, buffer)
+        return bytes(buffer)
+
+    def init_headers(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        if headers is not None or self._content_type is None:
+            return super().init_headers(headers)
+        self.raw_headers = encoded_headers(
+            self.body, self.status_code, self._content_type
+        )
+
+
+class EncodedResponse(Response):
+    """Response for a body encoded ahead of time, with headers built ahead of time."""
+
+    def __init__(self, body: bytes, status_code: int, raw_headers: List[RawHeader]):
+        self.status_code = status_code
+        self.background = None
+        self.body = body if has_body(status_code) else b""
+        # Shared across responses, each gets a list it may append headers to
+        self.raw_headers = list(raw_headers)
@@ -0,0 +1,52 @@
+import random
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import msgspec
+
+from src.service.parameters import ParameterCoercer
+from src.service.response_pool import PooledBody, ResponsePool
+from src.service.responses import JSON_CONTENT_TYPE, RawHeader
+from src.service.validation_policy import ValidationPolicy, ValidationStats
+from src.utils.spec_index import operation_name
+
+
+class RoutePlan:
+    """Everything resolved at registration time to answer one operation."""
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        operation: Any,
+        status_code: int,
+        generate: Callable[[random.Random], Any],
+    ):
+        self.method = method
+        self.path = path
+        self.operation = operation
+        self.operation_id = operation_name(method, path, operation.operationId)
+        self.status_code = status_code
+        self.generate = generate
+        self.media_type = "application/json"
+        # Pre-built content-type header of materialized (non-streamed) JSON bodies
+        self.content_type: RawHeader = JSON_CONTENT_TYPE
+        self.pool: Optional[ResponsePool] = None
+        # Chunked item generator for array responses, and whether to always stream it
+        self.chunks: Optional[Callable[[random.Random], Iterator[List[Any]]]] = None
+        self.stream = False
+        # Spec examples encoded at registration, by name, and the one served by default
+        self.examples: Dict[str, PooledBody] = {}
+        self.example: Optional[PooledBody] = None
+        # Request body checks compiled from the operation's requestBody
+        self.has_body = False
+        self.body_is_json = False
+        self.body_required = False
+        # Typed msgspec decoder checking the body while parsing it, when expressible
+        self.body_decoder: Optional[msgspec.json.Decoder] = None
+        self.validate_body: Optional[Callable[[Any], None]] = None
+        # How many requests get validated, and what happened to them
+        self.validation = ValidationPolicy()
+        self.validation_stats = ValidationStats()
+        # Parameter coercion, and path parameters copied into generated objects
+        self.parameters: Optional[ParameterCoercer] = None
+        self.echo_params: List[str] = []
@@ -0,0 +1,94 @@
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import Request
+from starlette._utils import get_route_path
+from starlette.exceptions import HTTPException
+from starlette.routing import BaseRoute, Match, NoMatchFound
+from starlette.types import Receive, Scope, Send
+
+from src.utils.spec_index import SpecIndex
+
+# Routing modes of the mock server
+FASTAPI_ROUTER = "fastapi"
+RADIX_ROUTER = "radix"
+ROUTERS = (FASTAPI_ROUTER, RADIX_ROUTER)
+
+Endpoint = Callable[[Request], Awaitable[Any]]
+
+# Child scope key of the template a request matched
+_TEMPLATE_SCOPE_KEY = "dymock.template"
+
+
+class SpecRouter(BaseRoute):
+    """One Starlette route dispatching every spec operation through the spec's trie.
+
+    Starlette tries its routes one by one, each with a regular expression,
+    so dispatch slows down with every operation of a large spec. Here the
+    request path walks the ``PathTrie`` of the spec index in O(path
+    segments), static segments before parameters, and the method is then a
+    dict lookup. A path matching a template without the request's method is
+    a 405 listing the allowed methods; other paths fall through to the next
+    routes and end in a 404.
+    """
+
+    def __init__(self, index: Optional[SpecIndex] = None):
+        # Path templates are matched with the index of the spec being served
+        self.index = index
+        # OpenAPI path -> HTTP method -> endpoint
+        self._endpoints: Dict[str, Dict[str, Endpoint]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(methods) for methods in self._endpoints.values())
+
+    def add(self, method: str, path: str, endpoint: Endpoint) -> None:
+        """Serve an operation, replacing any previous endpoint for it."""
+        self._endpoints.setdefault(path, {})[method.upper()] = endpoint
+
+    def remove(self, method: str, path: str) -> None:
+        methods = self._endpoints.get(path)
+        if methods is None:
+            return
+        methods.pop(method.upper(), None)
+        if not methods:
+            del self._endpoints[path]
+
+    def lookup(
+        self, path: str
+    ) -> Optional[Tuple[str, Dict[str, Endpoint], Dict[str, str]]]:
+        """The template matching a request path, its endpoints by method, and its parameters."""
+        found = self.index.match(path) if self.index is not None else None
+        if found is None:
+            return None
+        template, params = found
+        endpoints = self._endpoints.get(template)
+        if endpoints is None:
+            # None of the template's operations could be served
+            return None
+        return template, endpoints, params
+
+    def matches(self, scope: Scope) -> Tuple[Match, Scope]:
+        if scope["type"] != "http":
+            return Match.NONE, {}
+        found = self.lookup(get_route_path(scope))
+        if found is None:
+            return Match.NONE, {}
+        template, endpoints, params = found
+        endpoint = endpoints.get(scope["method"])
+        child_scope = {
+            "endpoint": endpoint,
+            "path_params": {**scope.get("path_params", {}), **params},
+            _TEMPLATE_SCOPE_KEY: template,
+        }
+        return (Match.FULL if endpoint is not None else Match.PARTIAL), child_scope
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        endpoint = scope["endpoint"]
+        if endpoint is None:
+            allowed = ", ".join(self._endpoints[scope[_TEMPLATE_SCOPE_KEY]])
+            raise HTTPException(status_code=405, headers={"Allow": allowed})
+        response = await endpoint(Request(scope, receive, send))
+        await response(scope, receive, send)
+
+    def url_path_for(self, name: str, /, **path_params: Any):
+        # Spec operations are not named routes
+        raise NoMatchFound(name, path_params)
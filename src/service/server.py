@@ -1,79 +1,450 @@
+import asyncio
+import hashlib
+import random
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Optional
+from functools import partial
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncGenerator,
+    Collection,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import msgspec
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response, StreamingResponse
+from fastapi.routing import APIRoute
 
 from src.models.open_api_object import OpenAPIObject
+from src.service.asgi_app import FastPathApp
+from src.service.examples import (
+    EXAMPLE_QUERY_PARAM,
+    collect_examples,
+    requested_example,
+)
+from src.service.hot_reload import (
+    DEFAULT_WATCH_INTERVAL,
+    RouteDiff,
+    SpecWatcher,
+    diff_routes,
+)
+from src.service.introspection import (
+    STATS_PATH,
+    VALIDATION_PATH,
+    route_stats,
+    update_validation,
+)
+from src.service.parameters import (
+    PARAMS_SCOPE_KEY,
+    ParameterCoercer,
+    ParameterError,
+    parsed_parameters,
+)
+from src.service.request_body import DEFAULT_MAX_BODY_SIZE, read_body, store_body
+from src.service.response_pool import ResponsePool
+from src.service.responses import (
+    EncodedResponse,
+    MsgspecJSONResponse,
+    encoded_headers,
+    encoder,
+    has_body,
+)
+from src.service.route_plan import RoutePlan
+from src.service.router import FASTAPI_ROUTER, RADIX_ROUTER, ROUTERS, SpecRouter
+from src.service.validation_policy import ValidationPolicy
+from src.service.streaming import (
+    NDJSON_MEDIA_TYPE,
+    STREAM_THRESHOLD,
+    stream_json_array,
+    stream_ndjson,
+    wants_ndjson,
+)
+from src.utils.bundler import Bundler
 from src.utils.config import Config
+from src.utils.spec_cache import SpecCache
+from src.utils.spec_decoder import LazyPaths
+from src.utils.spec_index import RouteKey, SpecIndex, operation_name
+from src.utils.format_registry import FormatFn
 from src.utils.mock_data_generator import MockDataGenerator
+from src.utils.ref_resolver import RefResolver
+from src.utils.schema_compiler import ChunkFn, GeneratorFn
+from src.utils.schema_validator import ValidationError, ValidatorCompiler
+from src.utils.struct_builder import StructBuilder
 
 
 class MockServer:
-    def __init__(self, spec_path: str):
+    def __init__(
+        self,
+        spec_path: str,
+        max_ref_depth: int = 3,
+        pool_size: int = 0,
+        pool_refresh: float = 0.0,
+        seed: Optional[int] = None,
+        seed_query_params: Optional[Collection[str]] = None,
+        stream: bool = False,
+        formats: Optional[Mapping[str, FormatFn | str]] = None,
+        example_first: bool = False,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+        validation: Any = ValidationPolicy.STRICT,
+        tag_validation: Optional[Mapping[str, Any]] = None,
+        spec_cache: Optional[str | Path] = None,
+        lazy: bool = False,
+        watch: bool = False,
+        watch_interval: float = DEFAULT_WATCH_INTERVAL,
+        router: str = FASTAPI_ROUTER,
+    ):
+        if router not in ROUTERS:
+            raise ValueError(
+                f"Unknown router '{router}', expected one of {', '.join(ROUTERS)}"
+            )
         self._spec_path = spec_path
+        self._spec_cache = SpecCache(spec_cache) if spec_cache is not None else None
+        # Lazily loaded specs decode and compile each operation on its first request
+        self._lazy = lazy
         try:
-            self._mock_spec: Optional[OpenAPIObject] = Config.get_spec(self._spec_path)
+            spec, self._watched_files = self._load_spec()
         except (FileNotFoundError, PermissionError, ValueError) as e:
             raise ValueError(f"Failed to load OpenAPI specification: {e}") from e
-
-        self._app = FastAPI(lifespan=self._lifespan)
-        self._data_generator = MockDataGenerator()
+        self._mock_spec: Optional[OpenAPIObject] = spec
+
+        self._app = FastAPI(
+            lifespan=self._lifespan, default_response_class=MsgspecJSONResponse
+        )
+        self._max_ref_depth = max_ref_depth
+        # Custom string formats: generator callables or Faker provider names
+        self._formats = dict(formats or {})
+        self._init_compilers(self._mock_spec)
+        # Pre-encoded response pools, 0 disables pooling unless x-dymock-pool opts in
+        self._pool_size = pool_size
+        self._pool_refresh = pool_refresh
+        self._pools: List[ResponsePool] = []
+        self._refresh_tasks: Dict[ResponsePool, asyncio.Task] = {}
+        # Deterministic mode: identical requests get identical bodies for a given seed
+        self._seed = seed
+        self._seed_query_params = (
+            frozenset(seed_query_params) if seed_query_params is not None else None
+        )
+        # Stream every array response instead of only very large or NDJSON ones
+        self._stream = stream
+        # Serve the spec's examples, when a response has one, instead of generated data
+        self._example_first = example_first
+        # Request bodies over this many bytes are refused with a 413
+        self._max_body_size = max_body_size
+        # Validation policies: global, per tag, and per operation via x-dymock-validation
+        self._validation = ValidationPolicy.parse(validation)
+        self._tag_validation = {
+            tag: ValidationPolicy.parse(policy)
+            for tag, policy in (tag_validation or {}).items()
+        }
+        # Compiled plans by (method, path); lazy operations appear once requested
+        self._plans: Dict[RouteKey, RoutePlan] = {}
+        # Spec routes by (method, path), so a reload can swap them one by one
+        self._routes: Dict[RouteKey, APIRoute] = {}
+        # Watch mode: reload the spec whenever it or a file it references changes
+        self._watch = watch
+        self._watch_interval = watch_interval
+        # Radix mode dispatches every spec operation through one trie-based route
+        self._spec_router = SpecRouter(self._index) if router == RADIX_ROUTER else None
 
     def create_app(self) -> FastAPI:
         """Returns the FastAPI application instance."""
         return self._app
 
-    def _create_handler(self, method: str, path: str, operation):
+    def create_asgi_app(self) -> FastPathApp:
+        """Returns a plain ASGI application answering spec operations without FastAPI.
+
+        Requires the radix router; other requests are served by the FastAPI app.
+        """
+        if self._spec_router is None:
+            raise ValueError("The ASGI fast path requires router='radix'")
+        return FastPathApp(self._spec_router, self._app)
+
+    def _load_spec(self) -> Tuple[OpenAPIObject, List[str]]:
+        """Load the spec, with the files it was read from."""
+        bundler = Bundler(self._spec_path)
+        spec = Config.get_spec(
+            self._spec_path, cache=self._spec_cache, lazy=self._lazy, bundler=bundler
+        )
+        return spec, [self._spec_path, *bundler.dependencies]
+
+    def _init_compilers(self, spec: OpenAPIObject) -> None:
+        """Build the resolver and the compilers of a spec."""
+        # Operations, path templates and components, indexed once per load
+        self._index = SpecIndex(spec)
+        # Link every $ref once at load so requests never look references up
+        self._resolver = RefResolver(
+            spec, max_depth=self._max_ref_depth, index=self._index
+        )
+        previous = getattr(self, "_data_generator", None)
+        self._data_generator = MockDataGenerator(resolver=self._resolver)
+        if previous is not None:
+            # Pools keep drawing from the same randomness across reloads
+            self._data_generator.random = previous.random
+        self._validators = ValidatorCompiler(resolver=self._resolver)
+        self._structs = StructBuilder(resolver=self._resolver)
+        for name, generator in self._formats.items():
+            self._data_generator.register_format(name, generator)
+
+    def _create_handler(self, plan: RoutePlan):
         # Methods that may have request bodies
         body_methods = {"post", "put", "patch"}
 
-        if method.lower() in body_methods:
+        if plan.method.lower() in body_methods:
 
             async def handler(request: Request):
-                # Validate request body against operation's requestBody schema
-                await self._validate_request_body(request, operation)
-
-                # Generate appropriate response based on status codes
-                status_code, mock_data = self._generate_mock_response(method, operation)
+                if plan.parameters is not None:
+                    self._coerce_parameters(request, plan)
+                # Read, validate and store the body against the operation's requestBody
+                await self._ingest_request_body(request, plan)
 
-                return JSONResponse(content=mock_data, status_code=status_code)
+                return self._mock_response(plan, request)
         else:
 
-            async def handler():
-                # Generate appropriate response based on status codes
-                status_code, mock_data = self._generate_mock_response(method, operation)
-
-                return JSONResponse(content=mock_data, status_code=status_code)
+            async def handler(request: Request):
+                if plan.parameters is not None:
+                    self._coerce_parameters(request, plan)
+                return self._mock_response(plan, request)
 
         return handler
 
-    def _generate_mock_response(self, method: str, operation) -> tuple[int, Any]:
-        """Generate mock response data based on operation's response schemas."""
-        # Determine which response to use based on method and available responses
+    def _mock_response(self, plan: RoutePlan, request: Request) -> Response:
+        """Build the mock response, serving pre-encoded bytes when the route is pooled."""
+        if plan.examples:
+            example = self._selected_example(plan, request)
+            if example is not None:
+                body, raw_headers = example
+                return EncodedResponse(body, plan.status_code, raw_headers)
+        if plan.chunks is not None and (
+            plan.stream or wants_ndjson(request.headers.get("accept", ""))
+        ):
+            return self._streaming_response(plan, request)
+        if plan.pool:
+            body, raw_headers = plan.pool.next_body()
+            return EncodedResponse(body, plan.status_code, raw_headers)
+        content = plan.generate(self._request_rng(plan, request))
+        if plan.echo_params and isinstance(content, dict):
+            # Keep generated identifiers consistent with the requested path
+            path_params = parsed_parameters(request).get("path", {})
+            for name in plan.echo_params:
+                if name in path_params:
+                    content[name] = path_params[name]
+        return MsgspecJSONResponse(
+            content, status_code=plan.status_code, content_type=plan.content_type
+        )
+
+    @staticmethod
+    def _coerce_parameters(request: Request, plan: RoutePlan) -> None:
+        """Coerce the request's parameters and store them in the request scope."""
+        try:
+            request.scope[PARAMS_SCOPE_KEY] = plan.parameters.coerce(request)
+        except ParameterError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    @staticmethod
+    def _selected_example(plan: RoutePlan, request: Request):
+        """Return the example picked by ``Prefer: example=name``, or the default one."""
+        name = requested_example(
+            request.headers.get("prefer", ""),
+            request.query_params.get(EXAMPLE_QUERY_PARAM),
+        )
+        if name is None:
+            return plan.example
+        example = plan.examples.get(name)
+        if example is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No example named '{name}' for operation {plan.operation_id}",
+            )
+        return example
+
+    def _streaming_response(self, plan: RoutePlan, request: Request) -> Response:
+        """Stream an array response chunk by chunk, as a JSON array or NDJSON."""
+        chunks = plan.chunks(self._request_rng(plan, request))
+        if plan.media_type == NDJSON_MEDIA_TYPE or wants_ndjson(
+            request.headers.get("accept", "")
+        ):
+            return StreamingResponse(
+                stream_ndjson(chunks),
+                status_code=plan.status_code,
+                media_type=NDJSON_MEDIA_TYPE,
+            )
+        return StreamingResponse(
+            stream_json_array(chunks),
+            status_code=plan.status_code,
+            media_type="application/json",
+        )
+
+    def _request_rng(self, plan: RoutePlan, request: Request) -> random.Random:
+        """Return the random source for a request, seeded by its identity if deterministic."""
+        if self._seed is None:
+            return self._data_generator.random
+        return random.Random(self._request_seed(plan, request))
+
+    def _request_seed(self, plan: RoutePlan, request: Request) -> int:
+        """Derive a stable seed from the global seed, operation and request parameters.
+
+        A cryptographic hash is used rather than ``hash()`` so the seed is the
+        same across processes, workers and runs.
+        """
+        query = request.query_params.multi_items()
+        if self._seed_query_params is not None:
+            query = [item for item in query if item[0] in self._seed_query_params]
+        identity = msgspec.json.encode(
+            [
+                self._seed,
+                plan.operation_id,
+                sorted(request.path_params.items()),
+                sorted(query),
+            ]
+        )
+        return int.from_bytes(hashlib.blake2b(identity, digest_size=8).digest(), "big")
+
+    def _build_route_plan(
+        self, method: str, path: str, operation, path_parameters=()
+    ) -> RoutePlan:
+        """Select the response and compile its schema into a generator once."""
         status_code, response_obj = self._select_response(method, operation)
+        media_type, media = self._response_media(response_obj)
+        schema = media.schema if media is not None else None
+        count = self._item_count(operation)
+
+        chunks = None
+        if schema is not None:
+            chunks = self._data_generator.compile_chunks(schema, count=count)
+        if chunks is not None and count is not None:
+            # x-dymock-count fixes the array length, also for materialized bodies
+            generate = partial(self._collect_chunks, chunks)
+        else:
+            generate = self._compile_mock_response(operation, response_obj, schema)
+
+        plan = RoutePlan(method, path, operation, status_code, generate)
+        plan.media_type = media_type
+        plan.chunks = chunks
+        plan.stream = chunks is not None and (
+            self._stream
+            or media_type == NDJSON_MEDIA_TYPE
+            or (count or 0) >= STREAM_THRESHOLD
+        )
+        self._encode_examples(plan, media)
+        self._compile_body_validator(plan)
+        self._compile_parameters(plan, path_parameters, schema)
+        plan.validation = self._validation_policy(operation)
+
+        pool_size, pool_refresh = ResponsePool.settings_from_extension(
+            operation.extensions.get("x-dymock-pool"),
+            self._pool_size,
+            self._pool_refresh,
+        )
+        if plan.example is not None or not has_body(plan.status_code):
+            # Answered with the pre-encoded example or without a body, nothing to pool
+            pool_size = 0
+        if pool_size and (self._seed is not None or plan.stream):
+            print(
+                f"Warning: Pooling disabled for {method.upper()} {path}, "
+                "responses are deterministic or streamed."
+            )
+        elif pool_size:
+            rng = self._data_generator.random
+            plan.pool = ResponsePool(partial(generate, rng), pool_size, pool_refresh)
+            self._pools.append(plan.pool)
+        return plan
+
+    def _validation_policy(self, operation) -> ValidationPolicy:
+        """Pick the operation's policy: its extension, then its tags, then the global one."""
+        extension = operation.extensions.get("x-dymock-validation")
+        if extension is not None:
+            return ValidationPolicy.parse(extension)
+        for tag in operation.tags or ():
+            if tag in self._tag_validation:
+                return self._tag_validation[tag]
+        return self._validation
+
+    def _compile_parameters(self, plan: RoutePlan, path_parameters, schema) -> None:
+        """Compile the coercion of the operation's and path item's parameters."""
+        # Operation parameters override path item ones with the same name and location
+        parameters = {}
+        for parameter in [*path_parameters, *(plan.operation.parameters or ())]:
+            parameter = self._resolver.resolve(parameter)
+            if parameter is not None and parameter.name:
+                parameters[(parameter.name, parameter.param_in)] = parameter
+        coercer = ParameterCoercer(
+            parameters.values(), resolver=self._resolver, validators=self._validators
+        )
+        if not coercer:
+            return
+        plan.parameters = coercer
+
+        response_schema = self._resolver.resolve(schema)
+        properties = getattr(response_schema, "properties", None) or {}
+        plan.echo_params = [
+            name
+            for name, location in parameters
+            if location == "path" and name in properties
+        ]
+
+    @staticmethod
+    def _collect_chunks(chunks: ChunkFn, rng: random.Random) -> list:
+        return [item for chunk in chunks(rng) for item in chunk]
+
+    @staticmethod
+    def _item_count(operation) -> Optional[int]:
+        """Read the array length fixed by an operation's x-dymock-count extension."""
+        count = operation.extensions.get("x-dymock-count")
+        if count is not None and (
+            isinstance(count, bool) or not isinstance(count, int) or count < 0
+        ):
+            raise ValueError("x-dymock-count must be a non-negative integer")
+        return count
+
+    def _response_media(self, response_obj) -> tuple[str, Any]:
+        """Return the media type and MediaTypeObject of the response's JSON content."""
+        if response_obj and getattr(response_obj, "content", None):
+            for media_type in ("application/json", NDJSON_MEDIA_TYPE):
+                media = response_obj.content.get(media_type)
+                if media is not None:
+                    return media_type, media
+        return "application/json", None
+
+    def _encode_examples(self, plan: RoutePlan, media) -> None:
+        """Encode the response's examples once, ready to be served as-is."""
+        for name, value in collect_examples(media, self._resolver).items():
+            body = encoder.encode(value)
+            plan.examples[name] = (
+                body,
+                encoded_headers(body, plan.status_code, plan.content_type),
+            )
+        if self._example_first and plan.examples:
+            plan.example = next(iter(plan.examples.values()))
 
+    def _compile_mock_response(
+        self, operation, response_obj, schema: Optional[Any]
+    ) -> GeneratorFn:
+        """Compile the mock response generator for the operation's response schema."""
         if not response_obj:
             # Fallback to basic mock response
-            return 200, {
+            fallback = {
                 "mock": True,
                 "description": operation.summary or "No description provided",
             }
+            return lambda rng: dict(fallback)
 
-        # Try to get JSON content
-        if hasattr(response_obj, "content") and response_obj.content:
-            json_media = response_obj.content.get("application/json")
-            if json_media and hasattr(json_media, "schema") and json_media.schema:
-                # Generate data from schema
-                mock_data = self._data_generator.generate_from_schema(json_media.schema)
-                return status_code, mock_data
+        if schema is not None:
+            # Compile the schema once, generate on every request
+            return self._data_generator.compile(schema)
 
         # Fallback if no schema available
-        return status_code, {
+        fallback = {
             "mock": True,
             "description": operation.summary or "No description provided",
             "message": f"Mock response for {operation.operationId or 'operation'}",
         }
+        return lambda rng: dict(fallback)
 
     def _select_response(self, method: str, operation) -> tuple[int, Any]:
         """Select appropriate response based on operation method and available responses."""
@@ -107,12 +478,12 @@ class MockServer:
             status_code = 200
 
         if response_obj:
-            return status_code, response_obj
+            return status_code, self._resolver.resolve(response_obj)
 
         # Fallback: use first available response
         for status_str, resp in operation.responses.items():
-            if resp:
-                return int(status_str), resp
+            if resp and status_str.isdigit():
+                return int(status_str), self._resolver.resolve(resp)
 
         return 200, None
 
@@ -121,146 +492,323 @@ class MockServer:
         if not spec or not spec.paths:
             raise ValueError("OpenAPI specification must contain paths")
 
-        # HTTP methods that should be registered
-        http_methods = {
-            "get",
-            "post",
-            "put",
-            "delete",
-            "patch",
-            "options",
-            "head",
-            "trace",
-        }
-        registered_routes = 0
+        # The server's own endpoints come first, so spec paths cannot shadow them
+        self._register_introspection_routes()
+        if self._spec_router is not None:
+            self._app.router.routes.append(self._spec_router)
 
-        for path, path_item in spec.paths.items():
+        registered_routes = 0
+        index = self._index
+        for path in index.paths:
             if not path.startswith("/"):
                 # Warn about invalid paths but continue
                 print(f"Warning: Path '{path}' does not start with '/'. Skipping.")
                 continue
+            for method in index.methods(path):
+                registered_routes += self._register_operation(index, method, path)
 
-            fast_api_path = Config.convert_openapi_path_to_fastapi(openapi_path=path)
-
-            for method in http_methods:
-                operation = getattr(path_item, method, None)
-                if not operation:
-                    continue
+        if registered_routes == 0:
+            raise ValueError(
+                "No valid routes could be registered from the OpenAPI specification"
+            )
 
-                # Validate operation has required fields
-                if not hasattr(operation, "responses") or not operation.responses:
-                    print(
-                        f"Warning: Operation {method.upper()} {path} has no responses defined. Skipping."
-                    )
-                    continue
+        print(f"Successfully registered {registered_routes} routes")
 
-                operation_id = operation.operationId or f"{method}_{path}".replace(
-                    "/", "_"
+    def _register_operation(self, index: SpecIndex, method: str, path: str) -> bool:
+        """Compile one operation and register its route, replacing any previous one."""
+        paths = index.paths
+        if isinstance(paths, LazyPaths):
+            raw_operation = paths.raw_operation(path, method)
+            if not isinstance(raw_operation, dict) or not raw_operation.get(
+                "responses"
+            ):
+                print(
+                    f"Warning: Operation {method.upper()} {path} has no responses defined. Skipping."
                 )
+                return False
+            self._add_route(
+                method,
+                path,
+                self._create_lazy_handler(paths, path, method),
+                operation_name(method, path, index.routes[(method, path)]),
+            )
+            return True
+
+        operation = index.operation(method, path)
+        # Validate operation has required fields
+        if not hasattr(operation, "responses") or not operation.responses:
+            print(
+                f"Warning: Operation {method.upper()} {path} has no responses defined. Skipping."
+            )
+            return False
 
+        try:
+            plan = self._build_route_plan(
+                method, path, operation, paths[path].parameters
+            )
+            handler = self._create_handler(plan)
+            self._add_route(method, path, handler, plan.operation_id)
+        except Exception as e:
+            print(f"Warning: Failed to register route {method.upper()} {path}: {e}")
+            return False
+        self._plans[(method, path)] = plan
+        return True
+
+    def _add_route(self, method: str, path: str, handler, name: str) -> None:
+        """Register a spec route, in place of the previous one for the same operation.
+
+        Replaced routes keep their position, so matching order does not
+        change; requests already dispatched finish on the old handler.
+        """
+        if self._spec_router is not None:
+            self._spec_router.add(method, path, handler)
+            return
+        fast_api_path = Config.convert_openapi_path_to_fastapi(openapi_path=path)
+        self._app.add_api_route(
+            fast_api_path, handler, methods=[method.upper()], name=name
+        )
+        routes = self._app.router.routes
+        route = routes.pop()
+        previous = self._routes.get((method, path))
+        if previous in routes:
+            routes[routes.index(previous)] = route
+        else:
+            routes.append(route)
+        self._routes[(method, path)] = route
+
+    def _remove_route(self, key: RouteKey) -> None:
+        if self._spec_router is not None:
+            self._spec_router.remove(*key)
+        route = self._routes.pop(key, None)
+        if route is not None and route in self._app.router.routes:
+            self._app.router.routes.remove(route)
+        self._drop_plan(key)
+
+    def _drop_plan(self, key: RouteKey) -> None:
+        """Forget the compiled plan of an operation and stop its pool refresh."""
+        plan = self._plans.pop(key, None)
+        if plan is None or plan.pool is None:
+            return
+        self._pools.remove(plan.pool)
+        task = self._refresh_tasks.pop(plan.pool, None)
+        if task is not None:
+            task.cancel()
+
+    async def reload(self) -> Optional[RouteDiff]:
+        """Load the spec again and update only the routes that changed.
+
+        An invalid spec is reported and the current routes are kept.
+        """
+        try:
+            spec, watched_files = await asyncio.to_thread(self._load_spec)
+        except (FileNotFoundError, PermissionError, ValueError) as e:
+            print(f"Warning: Not reloading {self._spec_path}: {e}")
+            return None
+        if not spec.paths:
+            print(f"Warning: Not reloading {self._spec_path}: it defines no paths")
+            return None
+        self._watched_files = watched_files
+        return self._apply_spec(spec)
+
+    def _apply_spec(self, spec: OpenAPIObject) -> RouteDiff:
+        previous = self._index
+        self._mock_spec = spec
+        self._init_compilers(spec)
+        diff = diff_routes(previous, self._index, self._resolver)
+        if self._spec_router is not None:
+            # Nothing below awaits, so no request sees a half-updated router
+            self._spec_router.index = self._index
+
+        for key in diff.removed:
+            self._remove_route(key)
+        for method, path in diff.replaced + diff.added:
+            self._drop_plan((method, path))
+            if path.startswith("/") and not self._register_operation(
+                self._index, method, path
+            ):
+                # The new definition cannot be served, do not keep the old one
+                self._remove_route((method, path))
+        self._start_pending_refreshes()
+        # Regenerated on the next request for the docs
+        self._app.openapi_schema = None
+
+        print(
+            f"Reloaded {self._spec_path}: {len(diff.added)} added, "
+            f"{len(diff.removed)} removed, {len(diff.replaced)} replaced routes"
+        )
+        return diff
+
+    def _compile_body_validator(self, plan: RoutePlan) -> None:
+        """Compile the checks of the operation's JSON request body once."""
+        request_body = self._resolver.resolve(plan.operation.requestBody)
+        if request_body is None:
+            # No body, or an unresolvable reference: nothing to validate against
+            return
+
+        plan.has_body = True
+        plan.body_required = bool(request_body.required)
+        json_media = (request_body.content or {}).get("application/json")
+        plan.body_is_json = json_media is not None
+        if json_media is None or json_media.schema is None:
+            return
+        # Decode and validate in one native call when msgspec can express the schema
+        plan.body_decoder = self._structs.decoder_for(
+            json_media.schema, name=f"{plan.operation_id}Body"
+        )
+        if plan.body_decoder is None:
+            plan.validate_body = self._validators.compile(json_media.schema)
+
+    def _create_lazy_handler(self, paths: LazyPaths, path: str, method: str):
+        """Handler decoding and compiling its operation on the first request, then memoized."""
+        handler = None
+
+        async def lazy_handler(request: Request):
+            nonlocal handler
+            if handler is None:
                 try:
-                    handler = self._create_handler(method, path, operation)
-                    self._app.add_api_route(
-                        fast_api_path,
-                        handler,
-                        methods=[method.upper()],
-                        name=operation_id,
+                    path_item = paths[path]
+                    plan = self._build_route_plan(
+                        method, path, getattr(path_item, method), path_item.parameters
                     )
-                    registered_routes += 1
                 except Exception as e:
                     print(
-                        f"Warning: Failed to register route {method.upper()} {path}: {e}"
+                        f"Warning: Failed to build route {method.upper()} {path}: {e}"
                     )
-                    continue
+                    raise HTTPException(
+                        status_code=500,
+                        detail=f"Operation {method.upper()} {path} could not be loaded",
+                    )
+                self._plans[(method, path)] = plan
+                self._start_pending_refreshes()
+                handler = self._create_handler(plan)
+            return await handler(request)
 
-        if registered_routes == 0:
-            raise ValueError(
-                "No valid routes could be registered from the OpenAPI specification"
-            )
+        return lazy_handler
 
-        print(f"Successfully registered {registered_routes} routes")
+    def _register_introspection_routes(self):
+        """Register the endpoints reporting and tuning the mock server itself."""
 
-    async def _validate_request_body(self, request: Request, operation):
-        """Validate request body against operation's requestBody schema."""
-        if not hasattr(operation, "requestBody") or not operation.requestBody:
-            return
+        async def stats():
+            return route_stats(self._plans.values())
+
+        async def set_validation(operation_id: str, request: Request):
+            try:
+                return update_validation(
+                    self._plans,
+                    self._index,
+                    operation_id,
+                    msgspec.json.decode(await request.body()),
+                )
+            except KeyError:
+                raise HTTPException(
+                    status_code=404, detail=f"Unknown operation: {operation_id}"
+                )
+            except (ValueError, msgspec.DecodeError) as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+        self._app.add_api_route(STATS_PATH, stats, methods=["GET"])
+        self._app.add_api_route(VALIDATION_PATH, set_validation, methods=["PUT"])
 
-        # Handle ReferenceObject case
-        from src.models.reference_object import ReferenceObject
+    async def _ingest_request_body(self, request: Request, plan: RoutePlan):
+        """Read the body once within the size limit, then validate and store it.
 
-        if isinstance(operation.requestBody, ReferenceObject):
-            # For now, skip validation of referenced request bodies
+        The route's validation policy decides whether this request is
+        validated and whether a failure rejects it or is only reported.
+        """
+        if not plan.has_body:
             return
 
-        request_body = operation.requestBody
+        body = await read_body(request, self._max_body_size)
+        policy = plan.validation
+        stats = plan.validation_stats
+        if not policy.should_validate():
+            stats.skipped += 1
+            store_body(request, body, raw=plan.body_is_json and bool(body))
+            return
 
-        # Check if request body is required
-        if getattr(request_body, "required", False):
-            try:
-                body_data = await request.json()
-                if not body_data:
-                    raise HTTPException(
-                        status_code=400, detail="Request body is required but empty"
-                    )
-            except Exception:
+        stats.validated += 1
+        try:
+            self._validate_request_body(request, plan, body)
+        except HTTPException as e:
+            stats.failed += 1
+            if policy.enforced:
+                raise
+            print(
+                f"Warning: {plan.method.upper()} {plan.path} got an invalid request "
+                f"body: {e.detail}"
+            )
+            store_body(request, body, raw=plan.body_is_json and bool(body))
+
+    def _validate_request_body(self, request: Request, plan: RoutePlan, body: bytes):
+        """Validate a body with the operation's compiled decoder or validator, and store it."""
+        if not body:
+            if plan.body_required:
                 raise HTTPException(
-                    status_code=400,
-                    detail="Request body is required but not provided or invalid JSON",
+                    status_code=400, detail="Request body is required but empty"
                 )
+            return
+        if not plan.body_is_json:
+            store_body(request, body)
+            return
 
-        # Try to validate against schema if available
-        if hasattr(request_body, "content") and request_body.content:
-            json_media = request_body.content.get("application/json")
-            if json_media and hasattr(json_media, "schema") and json_media.schema:
-                try:
-                    body_data = await request.json()
-                    self._validate_data_against_schema(body_data, json_media.schema)
-                except Exception as e:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Request body validation failed: {str(e)}",
-                    )
-
-    def _validate_data_against_schema(self, data: Any, schema) -> None:
-        """Basic validation of data against schema."""
-        from src.models.reference_object import ReferenceObject
-
-        # Handle ReferenceObject
-        if isinstance(schema, ReferenceObject):
-            # Skip validation for referenced schemas for now
+        if plan.body_decoder is not None:
+            try:
+                plan.body_decoder.decode(body)
+            except msgspec.ValidationError as e:
+                raise HTTPException(
+                    status_code=400, detail=f"Request body validation failed: {e}"
+                )
+            except msgspec.DecodeError:
+                raise HTTPException(
+                    status_code=400, detail="Request body is not valid JSON"
+                )
+            # Typed values are not plain JSON, decode again only if someone asks
+            store_body(request, body, raw=True)
             return
 
-        # Basic type validation
-        if hasattr(schema, "type") and schema.type:
-            expected_type = schema.type
-            if expected_type == "object" and not isinstance(data, dict):
-                raise ValueError(f"Expected object, got {type(data).__name__}")
-            elif expected_type == "array" and not isinstance(data, list):
-                raise ValueError(f"Expected array, got {type(data).__name__}")
-            elif expected_type == "string" and not isinstance(data, str):
-                raise ValueError(f"Expected string, got {type(data).__name__}")
-            elif expected_type == "integer" and not isinstance(data, int):
-                raise ValueError(f"Expected integer, got {type(data).__name__}")
-            elif expected_type == "boolean" and not isinstance(data, bool):
-                raise ValueError(f"Expected boolean, got {type(data).__name__}")
-
-        # For objects, check required properties
-        if hasattr(schema, "required") and schema.required and isinstance(data, dict):
-            for required_prop in schema.required:
-                if required_prop not in data:
-                    raise ValueError(f"Missing required property: {required_prop}")
-
-        # For arrays, validate items if schema provided
-        if hasattr(schema, "items") and schema.items and isinstance(data, list):
-            for item in data:
-                try:
-                    self._validate_data_against_schema(item, schema.items)
-                except ValueError as e:
-                    raise ValueError(f"Array item validation failed: {e}")
+        try:
+            body_data = msgspec.json.decode(body)
+        except msgspec.DecodeError:
+            raise HTTPException(
+                status_code=400, detail="Request body is not valid JSON"
+            )
+
+        if plan.validate_body is not None:
+            try:
+                plan.validate_body(body_data)
+            except ValidationError as e:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Request body validation failed: {e}",
+                )
+        store_body(request, body_data)
 
     @asynccontextmanager
     async def _lifespan(self, app: FastAPI) -> AsyncGenerator[None, None]:
         """Initializes the mock server by loading the spec and registering routes."""
         if self._mock_spec:
             self._register_routes(self._mock_spec)
-        yield
+
+        self._start_pending_refreshes()
+        watch_task = None
+        if self._watch:
+            watcher = SpecWatcher(
+                lambda: self._watched_files, self.reload, self._watch_interval
+            )
+            watch_task = asyncio.create_task(watcher.run())
+        try:
+            yield
+        finally:
+            tasks = list(self._refresh_tasks.values())
+            if watch_task is not None:
+                tasks.append(watch_task)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._refresh_tasks.clear()
+
+    def _start_pending_refreshes(self) -> None:
+        """Keep pooled responses varied without touching the request path."""
+        for pool in self._pools:
+            if pool.refresh_interval > 0 and pool not in self._refresh_tasks:
+                self._refresh_tasks[pool] = asyncio.create_task(pool.refresh_forever())
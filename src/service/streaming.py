@@ -0,0 +1,35 @@
+from typing import Any, Iterable, Iterator, List
+
+from src.service.responses import encoder
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Top-level arrays with at least this many items are streamed instead of materialized
+STREAM_THRESHOLD = 10_000
+
+
+def stream_json_array(chunks: Iterable[List[Any]]) -> Iterator[bytes]:
+    """Encode chunks of items as one JSON array, one chunk at a time."""
+    encode = encoder.encode
+    yield b"["
+    separator = b""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        # Drop the brackets of the encoded chunk and splice it into the array
+        yield separator + encode(chunk)[1:-1]
+        separator = b","
+    yield b"]"
+
+
+def stream_ndjson(chunks: Iterable[List[Any]]) -> Iterator[bytes]:
+    """Encode chunks of items as newline-delimited JSON, one item per line."""
+    encode = encoder.encode
+    for chunk in chunks:
+        if chunk:
+            yield b"\n".join([encode(item) for item in chunk]) + b"\n"
+
+
+def wants_ndjson(accept: str) -> bool:
+    """Whether an Accept header asks for newline-delimited JSON."""
+    return NDJSON_MEDIA_TYPE in accept
@@ -0,0 +1,86 @@
+import random
+from typing import Any, Dict
+
+
+class ValidationPolicy:
+    """How much of an operation's request validation actually runs.
+
+    ``strict`` validates every request and rejects invalid ones, ``sampled``
+    does the same for a random fraction ``rate`` of requests, ``log-only``
+    validates every request but only reports failures, and ``off`` skips
+    validation entirely.
+    """
+
+    STRICT = "strict"
+    SAMPLED = "sampled"
+    LOG_ONLY = "log-only"
+    OFF = "off"
+    MODES = (STRICT, SAMPLED, LOG_ONLY, OFF)
+
+    def __init__(self, mode: str = STRICT, rate: float = 1.0):
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Unknown validation mode '{mode}', expected one of {', '.join(self.MODES)}"
+            )
+        if isinstance(rate, bool) or not isinstance(rate, (int, float)):
+            raise ValueError("Validation sampling rate must be a number")
+        if not 0 <= rate <= 1:
+            raise ValueError("Validation sampling rate must be between 0 and 1")
+        self.mode = mode
+        self.rate = float(rate) if mode == self.SAMPLED else 1.0
+        # Failures are rejected, except in log-only mode where they are only reported
+        self.enforced = mode != self.LOG_ONLY
+
+    def should_validate(self) -> bool:
+        """Whether the current request gets validated."""
+        if self.mode == self.SAMPLED:
+            # Sampling uses its own randomness, so it never disturbs seeded data
+            return random.random() < self.rate
+        return self.mode != self.OFF
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self.mode == self.SAMPLED:
+            return {"mode": self.mode, "rate": self.rate}
+        return {"mode": self.mode}
+
+    @classmethod
+    def parse(cls, value: Any) -> "ValidationPolicy":
+        """Build a policy from ``"strict"``, ``"sampled:0.01"`` or ``{"mode", "rate"}``.
+
+        This is the format of the ``x-dymock-validation`` extension, of
+        per-tag settings and of the global setting.
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            mode, _, rate = value.partition(":")
+            if not rate:
+                return cls(mode)
+            try:
+                return cls(mode, float(rate))
+            except ValueError:
+                raise ValueError(f"Invalid validation sampling rate '{rate}'") from None
+        if isinstance(value, dict):
+            return cls(value.get("mode", cls.STRICT), value.get("rate", 1.0))
+        raise ValueError(
+            "Validation policy must be a mode such as 'strict' or 'sampled:0.01', "
+            "or an object with 'mode' and 'rate'"
+        )
+
+
+class ValidationStats:
+    """Per-route counts of validated, skipped and failed requests."""
+
+    __slots__ = ("validated", "skipped", "failed")
+
+    def __init__(self):
+        self.validated = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "validated": self.validated,
+            "skipped": self.skipped,
+            "failed": self.failed,
+        }
@@ -0,0 +1,197 @@
+from datetime import date
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
+import random
+import string
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, arrays then fall back to per-item generation
+    np = None
+
+from src.models.schema_object import SchemaObject
+from src.models.reference_object import ReferenceObject
+from src.utils.format_registry import LATEST_DATE
+
+if TYPE_CHECKING:
+    from src.utils.schema_compiler import SchemaCompiler
+
+# Generates ``n`` array items at once from the caller's rng
+BatchFn = Callable[[random.Random, int], List[Any]]
+# Generates one column of ``n`` values; gets the numpy generator and the caller's rng
+ColumnFn = Callable[[random.Random, "np.random.Generator", int], List[Any]]
+
+# Days in the range of generated dates, fixed so seeded columns are reproducible
+_DAYS = (LATEST_DATE - date(1970, 1, 1)).days
+
+
+class BulkCompiler:
+    """Compiles array item schemas into column-wise batch generators backed by NumPy.
+
+    Items that are primitives, or objects made only of primitive properties,
+    are generated a whole column at a time and then assembled into rows, so
+    large arrays do not pay per-element Python dispatch.
+    """
+
+    def __init__(self, compiler: "SchemaCompiler"):
+        self._compiler = compiler
+
+    def compile_batch(
+        self, schema: SchemaObject | ReferenceObject
+    ) -> Optional[BatchFn]:
+        """Compile a batch generator for array items, or None if they are not flat."""
+        if np is None:
+            return None
+        schema = self._resolve(schema)
+        if schema is None:
+            return None
+        if schema.type == "object" and not schema.enum:
+            return self._compile_rows(schema)
+
+        column = self._compile_column(schema)
+        if column is None:
+            return None
+
+        def generate_batch(rng: random.Random, count: int) -> List[Any]:
+            return column(rng, np.random.default_rng(rng.getrandbits(64)), count)
+
+        return generate_batch
+
+    def _resolve(
+        self, schema: SchemaObject | ReferenceObject
+    ) -> Optional[SchemaObject]:
+        resolver = self._compiler.resolver
+        if isinstance(schema, ReferenceObject):
+            schema = resolver.resolve(schema) if resolver else None
+        return schema if isinstance(schema, SchemaObject) else None
+
+    def _compile_rows(self, schema: SchemaObject) -> Optional[BatchFn]:
+        """Compile an object batch generator from one column per property."""
+        if not schema.properties:
+            return None
+
+        required = set(schema.required or ())
+        names: List[str] = []
+        columns: List[ColumnFn] = []
+        optional: List[int] = []
+        for index, (name, prop_schema) in enumerate(schema.properties.items()):
+            prop_schema = self._resolve(prop_schema)
+            column = self._compile_column(prop_schema) if prop_schema else None
+            if column is None:
+                return None
+            names.append(name)
+            columns.append(column)
+            if name not in required:
+                optional.append(index)
+
+        def generate_rows(rng: random.Random, count: int) -> List[Any]:
+            generator = np.random.default_rng(rng.getrandbits(64))
+            values = [column(rng, generator, count) for column in columns]
+            if not optional:
+                return [dict(zip(names, row)) for row in zip(*values)]
+
+            # 50% chance for optional properties, like the per-item generator
+            present = np.ones((len(names), count), dtype=bool)
+            present[optional] = generator.integers(0, 2, (len(optional), count)) == 1
+            if len(optional) == len(names):
+                # Make sure every row has some data when all properties were skipped
+                empty = np.flatnonzero(~present.any(axis=0))
+                present[generator.integers(0, len(names), empty.size), empty] = True
+            return [
+                {name: value for name, value, keep in zip(names, row, mask) if keep}
+                for row, mask in zip(zip(*values), zip(*present.tolist()))
+            ]
+
+        return generate_rows
+
+    def _compile_column(self, schema: SchemaObject) -> Optional[ColumnFn]:
+        """Compile a column generator for a primitive schema, or None if not primitive."""
+        if schema.enum:
+            values = np.empty(len(schema.enum), dtype=object)
+            values[:] = schema.enum
+            return lambda rng, generator, count: values[
+                generator.integers(0, len(values), count)
+            ].tolist()
+
+        if schema.type == "integer":
+            low, high = self._compiler.integer_bounds(schema)
+            if not -(2**63) <= low <= high < 2**63:
+                return None
+            return lambda rng, generator, count: generator.integers(
+                low, high, count, endpoint=True
+            ).tolist()
+        elif schema.type == "number":
+            low, high = self._compiler.number_bounds(schema)
+            return lambda rng, generator, count: generator.uniform(
+                low, high, count
+            ).tolist()
+        elif schema.type == "boolean":
+            return lambda rng, generator, count: (
+                generator.integers(0, 2, count, dtype=np.uint8) == 1
+            ).tolist()
+        elif schema.type == "null":
+            return lambda rng, generator, count: [None] * count
+        elif schema.type == "string":
+            return self._compile_string_column(schema)
+        return None
+
+    def _compile_string_column(self, schema: SchemaObject) -> ColumnFn:
+        # Patterns and user formats replace the vectorized built-ins too
+        if not schema.pattern and not self._compiler.formats.is_custom(schema.format):
+            if schema.format == "uuid":
+                return _uuid_column
+            elif schema.format == "date":
+                return _date_column
+            elif schema.format == "date-time":
+                return _date_time_column
+        if schema.pattern or schema.format in self._compiler.formats:
+            # Patterns and formats without a vectorized generator keep their scalar one
+            generate = self._compiler.compile(schema)
+            return lambda rng, generator, count: [generate(rng) for _ in range(count)]
+
+        min_len, max_len = self._compiler.string_lengths(schema)
+        table = np.frombuffer(string.ascii_letters.encode("ascii"), dtype=np.uint8)
+
+        def generate_strings(
+            rng: random.Random, generator: "np.random.Generator", count: int
+        ) -> List[str]:
+            if not count:
+                return []
+            ends = np.cumsum(generator.integers(min_len, max_len, count, endpoint=True))
+            text = table[generator.integers(0, len(table), int(ends[-1]))].tobytes()
+            text = text.decode("ascii")
+            ends = ends.tolist()
+            return [text[start:end] for start, end in zip([0] + ends[:-1], ends)]
+
+        return generate_strings
+
+
+def _uuid_column(
+    rng: random.Random, generator: "np.random.Generator", count: int
+) -> List[str]:
+    """Version 4 UUIDs built from one block of random bytes."""
+    raw = np.frombuffer(generator.bytes(16 * count), dtype=np.uint8).reshape(count, 16)
+    raw = raw.copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    hexed = raw.tobytes().hex()
+    return [
+        f"{hexed[i : i + 8]}-{hexed[i + 8 : i + 12]}-{hexed[i + 12 : i + 16]}-"
+        f"{hexed[i + 16 : i + 20]}-{hexed[i + 20 : i + 32]}"
+        for i in range(0, 32 * count, 32)
+    ]
+
+
+def _date_column(
+    rng: random.Random, generator: "np.random.Generator", count: int
+) -> List[str]:
+    """ISO dates between the epoch and ``LATEST_DATE``."""
+    days = generator.integers(0, _DAYS, count)
+    return (np.datetime64("1970-01-01", "D") + days).astype(str).tolist()
+
+
+def _date_time_column(
+    rng: random.Random, generator: "np.random.Generator", count: int
+) -> List[str]:
+    """ISO date-times between the epoch and ``LATEST_DATE``."""
+    seconds = generator.integers(0, _DAYS * 86400, count)
+    return (np.datetime64("1970-01-01T00:00:00", "s") + seconds).astype(str).tolist()
@@ -0,0 +1,266 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+from urllib.parse import unquote
+import os
+import re
+import threading
+
+import msgspec
+
+from src.utils.mapped_file import mapped_file
+
+# Components section receiving the targets of external references, by the
+# key holding the reference (or the key of the mapping/list holding it)
+_PARENT_SECTIONS = {
+    "schema": "schemas",
+    "items": "schemas",
+    "additionalProperties": "schemas",
+    "not": "schemas",
+    "requestBody": "requestBodies",
+}
+_CONTAINER_SECTIONS = {
+    "properties": "schemas",
+    "allOf": "schemas",
+    "anyOf": "schemas",
+    "oneOf": "schemas",
+    "schemas": "schemas",
+    "responses": "responses",
+    "parameters": "parameters",
+    "examples": "examples",
+    "requestBodies": "requestBodies",
+    "headers": "headers",
+}
+
+# Threads loading referenced documents, mostly waiting on file reads
+MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+class DocumentCache:
+    """Parsed documents by absolute path, reused while their mtime is unchanged.
+
+    Shared by every load of a process, so files referenced from several
+    places, or unchanged between two loads of a spec, are parsed once.
+    """
+
+    def __init__(self):
+        self._documents: Dict[Path, Tuple[int, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: Path) -> Tuple[int, Any]:
+        """Return the (mtime_ns, parsed document) of an absolute path."""
+        mtime = path.stat().st_mtime_ns
+        with self._lock:
+            cached = self._documents.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached
+        document = _parse_file(path)
+        with self._lock:
+            self._documents[path] = (mtime, document)
+        return mtime, document
+
+
+def _parse_file(path: Path) -> Any:
+    with mapped_file(path) as data:
+        if path.suffix.lower() in (".yaml", ".yml"):
+            return msgspec.yaml.decode(data)
+        return msgspec.json.decode(data)
+
+
+DOCUMENT_CACHE = DocumentCache()
+
+
+def _split_ref(ref: str) -> Tuple[str, str]:
+    """Split a reference into its file part and its JSON pointer."""
+    file_part, _, pointer = ref.partition("#")
+    return file_part, pointer
+
+
+def _is_file_ref(file_part: str) -> bool:
+    return bool(file_part) and "://" not in file_part
+
+
+class Bundler:
+    """Inlines the relative-file ``$ref`` targets of a spec into the spec itself.
+
+    Referenced files are found from the root document, then loaded and
+    parsed concurrently in a thread pool, each file once. External targets
+    are copied into the ``components`` section matching where they are
+    referenced from (schemas, responses, parameters, ...) and references are
+    rewritten to point there, so the rest of dymock only sees local refs.
+    Targets referenced from anywhere else, such as path items, are inlined.
+    """
+
+    def __init__(
+        self, spec_path: str | Path, documents: Optional[DocumentCache] = None
+    ):
+        self.root_path = Path(spec_path).resolve()
+        self._documents = documents or DOCUMENT_CACHE
+        # Absolute path -> parsed document, and the mtimes they were loaded at
+        self._loaded: Dict[Path, Any] = {}
+        self.dependencies: Dict[str, int] = {}
+        # (file, pointer) -> local reference of a target already copied
+        self._bundled: Dict[Tuple[Path, str], str] = {}
+        self._inlining: Set[Tuple[Path, str]] = set()
+        self._components: Dict[str, Dict[str, Any]] = {}
+        # Component names of the root document, never reused for copied targets
+        self._root_names: Dict[str, Set[str]] = {}
+
+    def bundle(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the root document with every external reference made local."""
+        self._load_all(document)
+        if not self._loaded:
+            return document
+
+        root_components = document.get("components")
+        if isinstance(root_components, dict):
+            self._root_names = {
+                section: set(entries)
+                for section, entries in root_components.items()
+                if isinstance(entries, dict)
+            }
+        bundled = self._rewrite(document, self.root_path, None)
+        components = dict(bundled.get("components") or {})
+        for section, entries in self._components.items():
+            components[section] = {**(components.get(section) or {}), **entries}
+        return {**bundled, "components": components}
+
+    def _load_all(self, document: Any) -> None:
+        """Load every document reachable through file references, concurrently."""
+        pending = self._file_refs(document, self.root_path)
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            while pending:
+                futures = {
+                    path: pool.submit(self._documents.load, path) for path in pending
+                }
+                pending = set()
+                for path, future in futures.items():
+                    try:
+                        mtime, loaded = future.result()
+                    except (OSError, UnicodeError, msgspec.DecodeError) as e:
+                        raise ValueError(
+                            f"Cannot load referenced document {path}: {e}"
+                        ) from e
+                    self._loaded[path] = loaded
+                    self.dependencies[str(path)] = mtime
+                for path in futures:
+                    pending |= self._file_refs(self._loaded[path], path)
+
+    def _file_refs(self, document: Any, base: Path) -> Set[Path]:
+        """Referenced files of a document that are not loaded yet."""
+        files = set()
+        stack = [document]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                ref = node.get("$ref")
+                if isinstance(ref, str):
+                    file_part, _ = _split_ref(ref)
+                    if _is_file_ref(file_part):
+                        path = (base.parent / unquote(file_part)).resolve()
+                        if path != self.root_path and path not in self._loaded:
+                            files.add(path)
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
+        return files
+
+    def _rewrite(self, node: Any, base: Path, section: Optional[str]) -> Any:
+        """Copy a node of the document at ``base`` with its references made local.
+
+        ``section`` is the components section a reference found at this
+        position would target, or None where it cannot be told.
+        """
+        if isinstance(node, list):
+            return [self._rewrite(item, base, section) for item in node]
+        if not isinstance(node, dict):
+            return node
+
+        ref = node.get("$ref")
+        if isinstance(ref, str):
+            return self._rewrite_ref(node, ref, base, section)
+
+        rewritten = {}
+        for key, value in node.items():
+            if section == "schemas":
+                # Everything nested in a schema is a schema
+                value = self._rewrite(value, base, "schemas")
+            elif key in _CONTAINER_SECTIONS and isinstance(value, dict):
+                child = _CONTAINER_SECTIONS[key]
+                value = {
+                    name: self._rewrite(item, base, child)
+                    for name, item in value.items()
+                }
+            elif key in _CONTAINER_SECTIONS and isinstance(value, list):
+                child = _CONTAINER_SECTIONS[key]
+                value = [self._rewrite(item, base, child) for item in value]
+            else:
+                value = self._rewrite(value, base, _PARENT_SECTIONS.get(key))
+            rewritten[key] = value
+        return rewritten
+
+    def _rewrite_ref(
+        self, node: Dict[str, Any], ref: str, base: Path, section: Optional[str]
+    ) -> Any:
+        file_part, pointer = _split_ref(ref)
+        if file_part and not _is_file_ref(file_part):
+            # Remote references are left for the resolver to report
+            return node
+        path = (base.parent / unquote(file_part)).resolve() if file_part else base
+        if path == self.root_path:
+            # Local to the root document: unchanged
+            return {**node, "$ref": f"#{pointer}"} if file_part else node
+
+        key = (path, pointer)
+        if key in self._bundled:
+            return {**node, "$ref": self._bundled[key]}
+
+        target = _follow_pointer(self._loaded[path], pointer, ref)
+        if section is None:
+            # No components section for this position, the target is copied in place
+            if key in self._inlining:
+                raise ValueError(f"Circular reference through {ref} cannot be inlined")
+            self._inlining.add(key)
+            try:
+                return self._rewrite(target, path, None)
+            finally:
+                self._inlining.discard(key)
+
+        name = self._component_name(section, path, pointer)
+        local_ref = (
+            f"#/components/{section}/{name.replace('~', '~0').replace('/', '~1')}"
+        )
+        # Registered before rewriting the target, so cycles end at this reference
+        self._bundled[key] = local_ref
+        entries = self._components.setdefault(section, {})
+        entries[name] = None
+        entries[name] = self._rewrite(target, path, section)
+        return {**node, "$ref": local_ref}
+
+    def _component_name(self, section: str, path: Path, pointer: str) -> str:
+        """A name for a copied target, unique in its section, root components included."""
+        tokens = [token for token in pointer.split("/") if token]
+        base_name = unquote(tokens[-1]) if tokens else path.stem
+        base_name = re.sub(r"[^\w.-]", "_", base_name) or path.stem
+        taken = self._components.get(section, {})
+        root_names = self._root_names.get(section, ())
+        name, counter = base_name, 2
+        while name in taken or name in root_names:
+            name = f"{base_name}_{counter}"
+            counter += 1
+        return name
+
+
+def _follow_pointer(document: Any, pointer: str, ref: str) -> Any:
+    node = document
+    for token in pointer.split("/")[1:] if pointer else []:
+        token = unquote(token).replace("~1", "/").replace("~0", "~")
+        if isinstance(node, dict) and token in node:
+            node = node[token]
+        elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+            node = node[int(token)]
+        else:
+            raise ValueError(f"Cannot resolve reference '{ref}': '{token}' not found")
+    return node
@@ -1,8 +1,12 @@
 import re
 from pathlib import Path
+from typing import Optional
 
 from src.models.open_api_object import OpenAPIObject
+from src.utils.bundler import Bundler
+from src.utils.mapped_file import is_blank, mapped_file
 from src.utils.open_api_parser import OpenAPIParser
+from src.utils.spec_cache import SpecCache
 
 
 class Config:
@@ -18,11 +22,20 @@ class Config:
         return Path(spec_path).suffix.replace(".", "")
 
     @classmethod
-    def get_spec(cls, spec_path: str | Path) -> OpenAPIObject:
+    def get_spec(
+        cls,
+        spec_path: str | Path,
+        cache: Optional[SpecCache] = None,
+        lazy: bool = False,
+        bundler: Optional[Bundler] = None,
+    ) -> OpenAPIObject:
         """Load and parse the OpenAPI specification from a file.
 
         Args:
             spec_path: Path to the OpenAPI specification file
+            cache: Cache of decoded specs, skipping parsing for known contents
+            lazy: Decode path items on first access instead of up front
+            bundler: Bundler of external references, recording the files loaded
 
         Returns:
             Parsed OpenAPIObject
@@ -46,20 +59,40 @@ class Config:
             format = cls.identify_spec_type(spec_path=spec_path)
             format = format.lower()
 
-            with open(spec_path, "r", encoding="utf-8") as file:
-                spec_str = file.read()
-
-            if not spec_str.strip():
-                raise ValueError(f"OpenAPI specification file is empty: {spec_path}")
-
-            parser = OpenAPIParser()
-            return parser.parse(data=spec_str, format=format)
+            # References to other files are loaded relative to the spec
+            bundler = bundler or Bundler(spec_path)
+            # Decoded straight from the mapped file: no str copy of the document
+            with mapped_file(spec_path) as spec_bytes:
+                key = None
+                if cache is not None:
+                    key = cache.key(spec_bytes, lazy=lazy, path=spec_path)
+                    spec = cache.load(key, dependencies=bundler.dependencies)
+                    if spec is not None:
+                        return spec
+
+                if is_blank(spec_bytes):
+                    raise ValueError(
+                        f"OpenAPI specification file is empty: {spec_path}"
+                    )
+
+                parser = OpenAPIParser()
+                spec = parser.parse(
+                    data=spec_bytes, format=format, lazy=lazy, bundler=bundler
+                )
+            if cache is not None:
+                cache.store(key, spec, dependencies=bundler.dependencies)
+            return spec
 
         except (IOError, OSError) as e:
             raise PermissionError(
                 f"Cannot read OpenAPI specification file: {spec_path}. {e}"
             ) from e
-        except UnicodeDecodeError as e:
+        except (UnicodeError, ValueError) as e:
+            # Invalid UTF-8 is only found while decoding, reported by the parser
+            if not isinstance(e, UnicodeError) and not isinstance(
+                e.__cause__, UnicodeError
+            ):
+                raise
             raise ValueError(
                 f"OpenAPI specification file encoding error: {spec_path}. File must be UTF-8 encoded."
             ) from e
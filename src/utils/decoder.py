@@ -26,7 +26,10 @@ from src.models.encoding_object import EncodingObject
 
 
 class CustomDecoder:
-    """As msgspec have limitation to work we union type, this custom decoder will help us handle the union type."""
+    """As msgspec have limitation to work we union type, this custom decoder will help us handle the union type.
+
+    Whole documents are decoded by ``SpecDecoder``; this keeps decoding single objects.
+    """
 
     def __init__(self):
         self._decoders = {
@@ -99,6 +102,11 @@ class CustomDecoder:
         kwargs = dict(obj)
         if "schema" in obj:
             kwargs["schema"] = self.decode_schema(obj["schema"])
+        if "examples" in obj:
+            kwargs["examples"] = {
+                k: self.decode_example_or_reference(v)
+                for k, v in obj["examples"].items()
+            }
         if "encoding" in obj:
             kwargs["encoding"] = {
                 k: self.decode_encoding(v) for k, v in obj["encoding"].items()
@@ -207,21 +215,26 @@ class CustomDecoder:
             requestBody=self.decode_request_body(obj["requestBody"])
             if "requestBody" in obj
             else None,
+            extensions={k: v for k, v in obj.items() if k.startswith("x-")},
             **{
                 k: v
                 for k, v in obj.items()
                 if k not in ("requestBody", "responses", "parameters")
+                and not k.startswith("x-")
             },
         )
 
     def decode_path_item(self, obj: Dict[str, Any]) -> PathItemObject:
         """Decode PathItem object."""
+        methods = ("get", "put", "post", "delete", "patch", "options", "head", "trace")
         return PathItemObject(
+            parameters=[self.decode_parameter(p) for p in obj.get("parameters", [])],
             **{
                 method: self.decode_operation(obj[method])
-                for method in {"get", "put", "post", "delete", "patch"}
+                for method in methods
                 if method in obj
-            }
+            },
+            **{k: obj[k] for k in ("summary", "description") if k in obj},
         )
 
     def decode_components(self, obj: Dict[str, Any]) -> ComponentsObject:
@@ -237,6 +250,10 @@ class CustomDecoder:
                 k: self.decode_parameter(v)
                 for k, v in obj.get("parameters", {}).items()
             },
+            examples={
+                k: self.decode_example_or_reference(v)
+                for k, v in obj.get("examples", {}).items()
+            },
             requestBodies={
                 k: self.decode_request_body(v)
                 for k, v in obj.get("requestBodies", {}).items()
@@ -244,7 +261,14 @@ class CustomDecoder:
             **{
                 k: v
                 for k, v in obj.items()
-                if k not in ("schemas", "responses", "parameters", "requestBodies")
+                if k
+                not in (
+                    "schemas",
+                    "responses",
+                    "parameters",
+                    "examples",
+                    "requestBodies",
+                )
             },
         )
 
@@ -275,6 +299,14 @@ class CustomDecoder:
         """Decode Example object."""
         return msgspec.json.decode(msgspec.json.encode(obj), type=ExampleObject)
 
+    def decode_example_or_reference(
+        self, obj: Dict[str, Any]
+    ) -> Union[ExampleObject, ReferenceObject]:
+        """Decode Example object or Reference."""
+        if "$ref" in obj:
+            return ReferenceObject(ref=obj["$ref"])
+        return self.decode_example(obj)
+
     def decode_openapi(self, obj: Dict[str, Any]) -> OpenAPIObject:
         try:
             return OpenAPIObject(
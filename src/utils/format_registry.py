@@ -0,0 +1,206 @@
+from datetime import date, datetime, timezone
+from functools import cache
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+import base64
+import ipaddress
+import random
+import string
+import threading
+import uuid
+
+# Generates one value of a string format from the caller's rng
+FormatFn = Callable[[random.Random], Any]
+# Builds a format generator, loading whatever data the format needs
+FormatFactory = Callable[[], FormatFn]
+
+# Dates and date-times are drawn before this fixed day rather than today,
+# so seeded values do not depend on when the server was started
+LATEST_DATE = date(2025, 1, 1)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_DAYS = LATEST_DATE.toordinal() - _EPOCH_ORDINAL
+
+
+class FormatRegistry:
+    """Maps string formats to generators, built only when a schema uses them.
+
+    Built-in formats draw from the caller's rng directly and load the Faker
+    data tables they need (names, domains, words) on first use, so a spec
+    only pays for the formats it actually contains. Custom formats take
+    either a generator callable or the name of a Faker provider method.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, FormatFactory] = dict(BUILTIN_FORMATS)
+        self._generators: Dict[str, FormatFn] = {}
+        self._custom: Set[str] = set()
+        # Faker instances are stateful, each thread reseeds its own from the caller's rng
+        self._local = threading.local()
+
+    def register(self, name: str, generator: FormatFn | str) -> None:
+        """Register a custom format, replacing any existing generator for it.
+
+        ``generator`` is either a callable taking a ``random.Random``, or the
+        name of a Faker provider method such as ``"phone_number"``.
+        """
+        if isinstance(generator, str):
+            provider = generator
+            factory: FormatFactory = lambda: self._compile_faker(provider)
+        elif callable(generator):
+            factory = lambda: generator
+        else:
+            raise TypeError(
+                f"Format '{name}' needs a callable or a Faker provider name, "
+                f"got {type(generator).__name__}"
+            )
+        self._factories[name] = factory
+        self._generators.pop(name, None)
+        self._custom.add(name)
+
+    def get(self, name: Optional[str]) -> Optional[FormatFn]:
+        """Return the generator of a format, building it on first use, or None."""
+        generator = self._generators.get(name)
+        if generator is None:
+            factory = self._factories.get(name)
+            if factory is None:
+                return None
+            generator = self._generators[name] = factory()
+        return generator
+
+    def is_custom(self, name: Optional[str]) -> bool:
+        """Whether a format was registered by the user rather than built in."""
+        return name in self._custom
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._factories
+
+    def _compile_faker(self, provider: str) -> FormatFn:
+        """Compile a generator calling a Faker provider seeded from the caller's rng."""
+        if not hasattr(self._seeded_faker(random.Random(0)), provider):
+            raise ValueError(f"Unknown Faker provider: {provider}")
+        seeded_faker = self._seeded_faker
+        return lambda rng: _plain(getattr(seeded_faker(rng), provider)())
+
+    def _seeded_faker(self, rng: random.Random):
+        faker = getattr(self._local, "faker", None)
+        if faker is None:
+            from faker import Faker
+
+            faker = self._local.faker = Faker()
+        faker.seed_instance(rng.getrandbits(64))
+        return faker
+
+
+def _plain(value: Any) -> Any:
+    """Convert dates and times returned by Faker to ISO strings."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+@cache
+def _names() -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    from faker.providers.person.en_US import Provider
+
+    return (
+        tuple(name.lower() for name in Provider.first_names),
+        tuple(name.lower() for name in Provider.last_names),
+    )
+
+
+@cache
+def _domains() -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    from faker.providers.internet.en_US import Provider
+
+    return tuple(Provider.free_email_domains), tuple(Provider.tlds)
+
+
+@cache
+def _words() -> Tuple[str, ...]:
+    from faker.providers.lorem.en_US import Provider
+
+    return tuple(Provider.word_list)
+
+
+def _date() -> FormatFn:
+    return lambda rng: date.fromordinal(
+        _EPOCH_ORDINAL + rng.randrange(_DAYS)
+    ).isoformat()
+
+
+def _date_time() -> FormatFn:
+    return lambda rng: (
+        datetime.fromtimestamp(rng.randrange(_DAYS * 86400), timezone.utc)
+        .replace(tzinfo=None)
+        .isoformat()
+    )
+
+
+def _time() -> FormatFn:
+    return lambda rng: "{:02}:{:02}:{:02}".format(
+        *divmod(rng.randrange(3600 * 24) // 60, 60), rng.randrange(60)
+    )
+
+
+def _uuid() -> FormatFn:
+    return lambda rng: str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _ipv4() -> FormatFn:
+    return lambda rng: ".".join(map(str, rng.getrandbits(32).to_bytes(4, "big")))
+
+
+def _ipv6() -> FormatFn:
+    return lambda rng: str(ipaddress.IPv6Address(rng.getrandbits(128)))
+
+
+def _byte() -> FormatFn:
+    return lambda rng: base64.b64encode(rng.randbytes(rng.randint(4, 32))).decode()
+
+
+def _password() -> FormatFn:
+    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
+    return lambda rng: "".join(rng.choices(alphabet, k=rng.randint(10, 16)))
+
+
+def _email() -> FormatFn:
+    first_names, last_names = _names()
+    domains, _ = _domains()
+
+    def generate_email(rng: random.Random) -> str:
+        first, last = rng.choice(first_names), rng.choice(last_names)
+        return f"{first}.{last}@{rng.choice(domains)}"
+
+    return generate_email
+
+
+def _hostname() -> FormatFn:
+    _, last_names = _names()
+    _, tlds = _domains()
+    return lambda rng: f"{rng.choice(last_names)}.{rng.choice(tlds)}"
+
+
+def _uri() -> FormatFn:
+    hostname = _hostname()
+    words = _words()
+    return lambda rng: f"https://www.{hostname(rng)}/{rng.choice(words)}"
+
+
+def _word() -> FormatFn:
+    words = _words()
+    return lambda rng: rng.choice(words)
+
+
+BUILTIN_FORMATS: Dict[str, FormatFactory] = {
+    "date": _date,
+    "date-time": _date_time,
+    "time": _time,
+    "uuid": _uuid,
+    "ipv4": _ipv4,
+    "ipv6": _ipv6,
+    "byte": _byte,
+    "password": _password,
+    "email": _email,
+    "hostname": _hostname,
+    "uri": _uri,
+    "word": _word,
+}
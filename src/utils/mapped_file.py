@@ -0,0 +1,50 @@
+import codecs
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+# Any byte that is not JSON/YAML whitespace
+_NON_BLANK = re.compile(rb"[^ \t\r\n]")
+
+# Byte order marks of encodings other than UTF-8
+_FOREIGN_BOMS = (
+    codecs.BOM_UTF32_LE,
+    codecs.BOM_UTF32_BE,
+    codecs.BOM_UTF16_LE,
+    codecs.BOM_UTF16_BE,
+)
+
+
+@contextmanager
+def mapped_file(path: str | Path) -> Iterator[memoryview]:
+    """Zero-copy, read-only view of a UTF-8 file's contents, valid inside the block.
+
+    The file is memory-mapped rather than read, so the bytes are only ever
+    held by the page cache; a leading UTF-8 byte order mark is skipped.
+
+    Raises:
+        UnicodeError: If the file starts with the byte order mark of another encoding
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            yield memoryview(b"")
+            return
+        with (
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping,
+            memoryview(mapping) as view,
+        ):
+            head = bytes(view[:4])
+            if head.startswith(_FOREIGN_BOMS):
+                raise UnicodeError(f"{path} is not UTF-8 encoded")
+            start = len(codecs.BOM_UTF8) if head.startswith(codecs.BOM_UTF8) else 0
+            with view[start:] as contents:
+                yield contents
+
+
+def is_blank(data: bytes | memoryview) -> bool:
+    """Whether a document holds nothing but whitespace, scanning only up to its first content."""
+    return _NON_BLANK.search(data) is None
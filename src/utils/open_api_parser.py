@@ -1,25 +1,31 @@
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
-import msgspec
 
 from src.models.open_api_object import OpenAPIObject
-from src.utils.decoder import CustomDecoder
+from src.utils.bundler import Bundler
+from src.utils.spec_decoder import SpecDecoder
 
 
 class OpenAPIParser:
     """Parser for OpenAPI Specification with improved interface."""
 
     def __init__(self):
-        self.decoder = CustomDecoder()
-        self.encoder = msgspec.json.Encoder()
-        self.json_decoder = msgspec.json.Decoder()
+        self.decoder = SpecDecoder()
 
     def parse(
-        self, data: Union[str, bytes, Dict], format: str = "json"
+        self,
+        data: Union[str, bytes, memoryview, Dict],
+        format: str = "json",
+        lazy: bool = False,
+        bundler: Optional[Bundler] = None,
     ) -> OpenAPIObject:
-        """Parse OpenAPI specification with proper type handling."""
+        """Parse OpenAPI specification with proper type handling.
+
+        With ``lazy``, path items are decoded on first access (see ``LazyPaths``).
+        With a ``bundler``, references to other files are loaded and made local.
+        """
         try:
-            if isinstance(data, (str, bytes)):
+            if isinstance(data, (str, bytes, memoryview)):
                 data = self._decode(data=data, format=format)
             if not isinstance(data, dict):
                 raise TypeError(
@@ -28,8 +34,10 @@ class OpenAPIParser:
 
             # Validate basic OpenAPI structure
             self._validate_openapi_structure(data)
+            if bundler is not None:
+                data = bundler.bundle(data)
 
-            return self.decoder.decode_openapi(data)
+            return self.decoder.convert(data, lazy=lazy)
         except Exception as e:
             raise ValueError(f"Failed to parse OpenAPI specification: {str(e)}") from e
 
@@ -69,14 +77,6 @@ class OpenAPIParser:
             raise TypeError(f"Expected OpenAPIObject, got {type(spec).__name__}")
         return spec.to_dict()
 
-    def _decode(self, data: Union[str, bytes], format: str) -> Any:
-        if format == "json":
-            return self.json_decoder.decode(data)
-        elif format == "yaml":
-            if not hasattr(msgspec, "yaml"):
-                raise ValueError("YAML support is not available in msgspec.")
-            ydata = msgspec.yaml.decode(data)
-            jdata = msgspec.json.encode(ydata)
-            return msgspec.json.decode(jdata)
-        else:
-            raise ValueError(f"Unsupported format: {format}. Use 'json' or 'yaml'.")
+    def _decode(self, data: Union[str, bytes, memoryview], format: str) -> Any:
+        # YAML is loaded once, without a round trip through JSON
+        return self.decoder.parse(data, format=format)
@@ -0,0 +1,237 @@
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+import math
+import random
+import re
+import string
+
+try:
+    import re._constants as _constants
+    import re._parser as _parser
+except ImportError:  # Python < 3.11
+    import sre_constants as _constants
+    import sre_parse as _parser
+
+# Characters that "." and negated classes such as [^a-z] or \D draw from
+PRINTABLE = string.ascii_letters + string.digits + string.punctuation + " "
+
+# Repetitions allowed past the minimum of unbounded quantifiers (*, +, {n,})
+UNBOUNDED_REPEAT = 8
+
+# Samples tried for patterns with approximated constructs or length bounds
+# before giving up; samples are cheap, and length bounds may reject most of them
+MAX_ATTEMPTS = 100
+
+# Compiled patterns kept in the LRU cache, specs reuse a handful of ID/code patterns
+PATTERN_CACHE_SIZE = 512
+
+# Appends the pieces of one sampled string to ``out``; ``groups`` holds captured groups
+Emit = Callable[[random.Random, List[str], Dict[int, str]], None]
+
+_WORD = string.ascii_letters + string.digits + "_"
+_CATEGORIES = {
+    _constants.CATEGORY_DIGIT: string.digits,
+    _constants.CATEGORY_NOT_DIGIT: PRINTABLE.translate(
+        {ord(c): None for c in string.digits}
+    ),
+    _constants.CATEGORY_SPACE: " ",
+    _constants.CATEGORY_NOT_SPACE: PRINTABLE.replace(" ", ""),
+    _constants.CATEGORY_WORD: _WORD,
+    _constants.CATEGORY_NOT_WORD: PRINTABLE.translate({ord(c): None for c in _WORD}),
+}
+
+# ECMA-262 named groups and backreferences, (?<name>...) and \k<name>, for Python
+_ECMA_NAMED_GROUP = re.compile(r"\(\?<(?![=!])")
+_ECMA_NAMED_BACKREF = re.compile(r"\\k<(\w+)>")
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(
+    pattern: str, min_length: int = 0, max_length: Optional[int] = None
+) -> Callable[[random.Random], str]:
+    """Compile a schema ``pattern`` into a generator of strings matching it.
+
+    The pattern is parsed once into a tree of sampling closures, so a call
+    only draws from the caller's rng and joins the pieces. Lookarounds and
+    word boundaries are not generated directly; patterns using them check
+    each sample with the regex and retry a bounded number of times, as do
+    patterns with a ``min_length`` or ``max_length`` for the sample's length.
+    Unbounded quantifiers repeat at most ``max_length`` times.
+    Raises ``re.error`` for invalid patterns.
+    """
+    pattern = _ECMA_NAMED_GROUP.sub("(?P<", pattern)
+    pattern = _ECMA_NAMED_BACKREF.sub(r"(?P=\1)", pattern)
+    plan = _SamplingPlan(min_length, max_length)
+    emit = plan.sequence(_parser.parse(pattern))
+
+    def generate_pattern(rng: random.Random) -> str:
+        out: List[str] = []
+        emit(rng, out, {})
+        return "".join(out)
+
+    bounded = min_length > 0 or max_length is not None
+    if plan.exact and not bounded:
+        return generate_pattern
+
+    search = None if plan.exact else re.compile(pattern).search
+    longest = max_length if max_length is not None else math.inf
+
+    def generate_checked(rng: random.Random) -> str:
+        for _ in range(MAX_ATTEMPTS):
+            value = generate_pattern(rng)
+            if min_length <= len(value) <= longest and (
+                search is None or search(value)
+            ):
+                break
+        return value
+
+    return generate_checked
+
+
+class _SamplingPlan:
+    """Builds the sampling closures of a parsed pattern."""
+
+    def __init__(self, min_length: int = 0, max_length: Optional[int] = None):
+        # False once a construct is approximated and samples need checking
+        self.exact = True
+        # Length bounds of the whole string, which unbounded quantifiers respect
+        self.min_length = min_length
+        self.max_length = max_length
+
+    def sequence(self, items) -> Emit:
+        """Compile a sequence of parsed items, merging runs of literals."""
+        emitters: List[Emit] = []
+        literal: List[str] = []
+        for op, av in items:
+            if op is _constants.LITERAL:
+                literal.append(chr(av))
+                continue
+            if literal:
+                emitters.append(_literal("".join(literal)))
+                literal = []
+            emitter = self.item(op, av)
+            if emitter is not None:
+                emitters.append(emitter)
+        if literal:
+            emitters.append(_literal("".join(literal)))
+
+        if len(emitters) == 1:
+            return emitters[0]
+
+        def emit_sequence(rng, out, groups):
+            for emit in emitters:
+                emit(rng, out, groups)
+
+        return emit_sequence
+
+    def item(self, op, av) -> Optional[Emit]:
+        chars = self.chars(op, av)
+        if chars is not None:
+            return lambda rng, out, groups: out.append(rng.choice(chars))
+
+        if op in _REPEATS:
+            return self.repeat(*av)
+        elif op is _constants.SUBPATTERN:
+            return self.group(av[0], self.sequence(av[-1]))
+        elif op is _ATOMIC_GROUP:
+            return self.sequence(av)
+        elif op is _constants.BRANCH:
+            branches = [self.sequence(branch) for branch in av[1]]
+            return lambda rng, out, groups: rng.choice(branches)(rng, out, groups)
+        elif op is _constants.GROUPREF:
+            return lambda rng, out, groups: out.append(groups.get(av, ""))
+        elif op is _constants.GROUPREF_EXISTS:
+            group, yes, no = av
+            yes = self.sequence(yes)
+            no = self.sequence(no) if no else None
+
+            def emit_conditional(rng, out, groups):
+                if group in groups:
+                    yes(rng, out, groups)
+                elif no is not None:
+                    no(rng, out, groups)
+
+            return emit_conditional
+        elif op is _constants.AT:
+            # Start/end anchors hold for the generated string, boundaries may not
+            if av in (_constants.AT_BOUNDARY, _constants.AT_NON_BOUNDARY):
+                self.exact = False
+            return None
+        elif op in (_constants.ASSERT, _constants.ASSERT_NOT):
+            self.exact = False
+            return None
+        raise ValueError(f"Unsupported pattern construct: {op}")
+
+    def chars(self, op, av) -> Optional[str]:
+        """Characters a single-character item draws from, or None for other items."""
+        if op is _constants.ANY:
+            return PRINTABLE
+        elif op is _constants.NOT_LITERAL:
+            return PRINTABLE.replace(chr(av), "")
+        elif op is _constants.IN:
+            return self.char_class(av)
+        return None
+
+    def char_class(self, items) -> str:
+        chars = set()
+        negate = False
+        for op, av in items:
+            if op is _constants.NEGATE:
+                negate = True
+            elif op is _constants.LITERAL:
+                chars.add(chr(av))
+            elif op is _constants.RANGE:
+                chars.update(map(chr, range(av[0], av[1] + 1)))
+            elif op is _constants.CATEGORY:
+                chars.update(_CATEGORIES.get(av, ""))
+        if negate:
+            chars = set(PRINTABLE) - chars
+        if not chars:
+            raise ValueError("Pattern character class matches no printable character")
+        return "".join(sorted(chars))
+
+    def repeat(self, low: int, high: int, items) -> Emit:
+        if high == _constants.MAXREPEAT:
+            high = max(low + UNBOUNDED_REPEAT, self.min_length)
+            if self.max_length is not None:
+                high = max(low, min(high, self.max_length))
+
+        if len(items) == 1:
+            chars = self.chars(*items[0])
+            if chars is not None:
+                # A repeated character class is drawn in one call
+                return lambda rng, out, groups: out.append(
+                    "".join(rng.choices(chars, k=rng.randint(low, high)))
+                )
+
+        emit = self.sequence(items)
+
+        def emit_repeat(rng, out, groups):
+            for _ in range(rng.randint(low, high)):
+                emit(rng, out, groups)
+
+        return emit_repeat
+
+    @staticmethod
+    def group(group: Optional[int], emit: Emit) -> Emit:
+        if group is None:
+            return emit
+
+        def emit_group(rng, out, groups):
+            start = len(out)
+            emit(rng, out, groups)
+            groups[group] = "".join(out[start:])
+
+        return emit_group
+
+
+def _literal(text: str) -> Emit:
+    return lambda rng, out, groups: out.append(text)
+
+
+_REPEATS = tuple(
+    getattr(_constants, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(_constants, name)
+)
+_ATOMIC_GROUP = getattr(_constants, "ATOMIC_GROUP", None)
@@ -0,0 +1,174 @@
+from typing import Any, Dict, List, Mapping, Optional, Set
+from urllib.parse import unquote
+
+import msgspec
+
+from src.models.open_api_object import OpenAPIObject
+from src.models.reference_object import ReferenceObject
+from src.utils.spec_index import SpecIndex, component_ref
+
+
+class RefResolver:
+    """Resolves local ``#/...`` references of a loaded OpenAPI document.
+
+    Every reference found in the document is linked to its target once, when
+    the resolver is built, so lookups on the request path are a dict access.
+    Chains of references are followed to their final target and reference
+    cycles are reported instead of looping forever.
+    """
+
+    COMPONENT_SECTIONS = (
+        "schemas",
+        "responses",
+        "parameters",
+        "examples",
+        "requestBodies",
+    )
+
+    def __init__(
+        self,
+        spec: OpenAPIObject,
+        max_depth: int = 3,
+        index: Optional[SpecIndex] = None,
+    ):
+        if max_depth < 0:
+            raise ValueError("max_depth must be a non-negative integer")
+        self._spec = spec
+        # Component references are looked up in the index, other pointers walked
+        self.index = index if index is not None else SpecIndex(spec)
+        # Bound on how many times a recursive schema is expanded when generating data
+        self.max_depth = max_depth
+        self._targets: Dict[str, Any] = {}
+        self.unresolved: Set[str] = set()
+        self._link(spec)
+
+    def resolve(self, obj: Any) -> Any:
+        """Return the target of a reference, or the object itself if it is inline.
+
+        Returns None for references that could not be resolved.
+        """
+        if isinstance(obj, ReferenceObject):
+            return self.resolve_ref(obj.ref)
+        return obj
+
+    def resolve_ref(self, ref: str) -> Any:
+        """Return the target of a ``$ref`` string, or None if it is unresolved."""
+        target = self._targets.get(ref)
+        if target is None and ref not in self.unresolved:
+            # Not used by the document itself, resolve and memoize on first use
+            try:
+                target = self._follow(ref, [])
+            except ValueError:
+                self.unresolved.add(ref)
+        return target
+
+    def reachable_refs(self, node: Any) -> Set[str]:
+        """Every reference a node uses, directly or through the targets of its references.
+
+        Raw (undecoded) mappings are walked too, reading their ``$ref`` keys.
+        """
+        refs: Set[str] = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            ref = None
+            if isinstance(current, ReferenceObject):
+                ref = current.ref
+            elif isinstance(current, dict) and isinstance(current.get("$ref"), str):
+                ref = current["$ref"]
+            if ref is not None:
+                if ref not in refs:
+                    refs.add(ref)
+                    target = self.resolve_ref(ref)
+                    if target is not None:
+                        stack.append(target)
+            elif isinstance(current, msgspec.Struct):
+                stack.extend(
+                    getattr(current, name) for name in current.__struct_fields__
+                )
+            elif isinstance(current, dict):
+                stack.extend(current.values())
+            elif isinstance(current, (list, tuple)):
+                stack.extend(current)
+        return refs
+
+    def _link(self, spec: OpenAPIObject) -> None:
+        """Walk the document once and link every reference to its target."""
+        refs = self._collect_refs(spec)
+        for section in self.COMPONENT_SECTIONS:
+            refs.extend(
+                component_ref(section, name) for name in self.index.components[section]
+            )
+
+        for ref in refs:
+            if ref in self._targets or ref in self.unresolved:
+                continue
+            try:
+                self._targets[ref] = self._follow(ref, [])
+            except ValueError as e:
+                print(f"Warning: Cannot resolve reference '{ref}': {e}")
+                self.unresolved.add(ref)
+
+    def _follow(self, ref: str, chain: List[str]) -> Any:
+        """Resolve a reference, following chains of references to the final target."""
+        if ref in self._targets:
+            return self._targets[ref]
+        if ref in chain:
+            raise ValueError(f"circular reference chain {' -> '.join(chain + [ref])}")
+
+        target = self._lookup(ref)
+        if isinstance(target, ReferenceObject):
+            target = self._follow(target.ref, chain + [ref])
+        self._targets[ref] = target
+        return target
+
+    def _lookup(self, ref: str) -> Any:
+        """Walk a local JSON pointer through the decoded document."""
+        if not ref.startswith("#/"):
+            raise ValueError("only local '#/' references are supported")
+        component = self.index.component(ref)
+        if component is not None:
+            return component
+
+        node: Any = self._spec
+        for token in ref[2:].split("/"):
+            token = unquote(token).replace("~1", "/").replace("~0", "~")
+            if isinstance(node, msgspec.Struct):
+                node = self._struct_child(node, token)
+            elif isinstance(node, Mapping):
+                # Dicts, and lazily decoded paths
+                node = node.get(token)
+            elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+                node = node[int(token)]
+            else:
+                node = None
+            if node is None:
+                raise ValueError(f"'{token}' not found")
+        return node
+
+    @staticmethod
+    def _struct_child(node: msgspec.Struct, token: str) -> Optional[Any]:
+        """Return a struct field by its document name or attribute name."""
+        for name, encoded in zip(node.__struct_fields__, node.__struct_encode_fields__):
+            if token in (name, encoded):
+                return getattr(node, name)
+        return None
+
+    def _collect_refs(self, node: Any) -> List[str]:
+        """Collect every ``$ref`` string used anywhere in the document."""
+        refs: List[str] = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, ReferenceObject):
+                refs.append(current.ref)
+            elif isinstance(current, msgspec.Struct):
+                stack.extend(
+                    getattr(current, name) for name in current.__struct_fields__
+                )
+            elif isinstance(current, dict):
+                stack.extend(current.values())
+            elif isinstance(current, list):
+                stack.extend(current)
+            # Lazily decoded paths are skipped, their references resolve on first use
+        return refs
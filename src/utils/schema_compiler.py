@@ -0,0 +1,301 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import math
+import random
+import re
+import string
+import threading
+
+from src.models.schema_object import SchemaObject
+from src.models.reference_object import ReferenceObject
+from src.utils.bulk_generator import BulkCompiler
+from src.utils.format_registry import FormatRegistry
+from src.utils.pattern_generator import compile_pattern
+from src.utils.ref_resolver import RefResolver
+
+# Compiled generators draw every random choice from the Random instance they are given
+GeneratorFn = Callable[[random.Random], Any]
+
+# Returned by recursive references once the depth bound is reached; containers drop it.
+PRUNED = object()
+
+# Yields the items of a top-level array in chunks, so only one chunk is in memory
+ChunkFn = Callable[[random.Random], Iterator[List[Any]]]
+
+# Arrays with at least this many items are generated column-wise when possible
+BULK_THRESHOLD = 64
+
+
+class SchemaCompiler:
+    """Compiles schemas into trees of pre-bound generator closures.
+
+    Reference, enum, type and format dispatch is resolved once per schema node
+    at compile time, so calling a compiled generator only generates values.
+    Generators take the ``random.Random`` to draw from, so the same seed
+    always produces the same data and concurrent calls never share state.
+    """
+
+    def __init__(
+        self,
+        formats: Optional[FormatRegistry] = None,
+        resolver: Optional[RefResolver] = None,
+    ):
+        self.formats = formats if formats is not None else FormatRegistry()
+        self.resolver = resolver
+        # Compiled generators memoized by $ref, shared by every schema using them
+        self._compiled_refs: Dict[str, GeneratorFn] = {}
+        self._compiling: List[str] = []
+        self._recursive_targets: Dict[str, Optional[GeneratorFn]] = {}
+        self._recursion_guards: Dict[str, GeneratorFn] = {}
+        self._bulk = BulkCompiler(self)
+
+    def compile(self, schema: SchemaObject | ReferenceObject) -> GeneratorFn:
+        """Compile a schema into a generator callable taking a ``random.Random``."""
+        if isinstance(schema, ReferenceObject):
+            return self._compile_reference(schema)
+
+        if schema.enum:
+            return self._compile_enum(schema)
+
+        if schema.type == "string":
+            return self._compile_string(schema)
+        elif schema.type == "integer":
+            return self._compile_integer(schema)
+        elif schema.type == "number":
+            return self._compile_number(schema)
+        elif schema.type == "boolean":
+            return self._compile_boolean(schema)
+        elif schema.type == "object":
+            return self._compile_object(schema)
+        elif schema.type == "array":
+            return self._compile_array(schema)
+        elif schema.type == "null":
+            return lambda rng: None
+        else:
+            # Default fallback
+            return self.formats.get("word")
+
+    def compile_chunks(
+        self,
+        schema: SchemaObject | ReferenceObject,
+        count: Optional[int] = None,
+        chunk_size: int = 1024,
+    ) -> Optional[ChunkFn]:
+        """Compile an array schema into a generator of item chunks.
+
+        ``count`` fixes the number of items instead of drawing it from
+        minItems/maxItems. Returns None when the schema is not an array.
+        """
+        if isinstance(schema, ReferenceObject):
+            schema = self.resolver.resolve(schema) if self.resolver else None
+        if not isinstance(schema, SchemaObject) or schema.type != "array":
+            return None
+        if not schema.items:
+            return lambda rng: iter(())
+
+        min_items, max_items = (
+            (count, count) if count is not None else self.item_counts(schema)
+        )
+        generate_item = self.compile(schema.items)
+        generate_batch = self._bulk.compile_batch(schema.items)
+
+        def generate_chunks(rng: random.Random) -> Iterator[List[Any]]:
+            remaining = rng.randint(min_items, max_items)
+            while remaining > 0:
+                size = min(chunk_size, remaining)
+                remaining -= size
+                if generate_batch is not None and size >= BULK_THRESHOLD:
+                    yield generate_batch(rng, size)
+                    continue
+                items = [generate_item(rng) for _ in range(size)]
+                yield [item for item in items if item is not PRUNED]
+
+        return generate_chunks
+
+    def _compile_reference(self, schema: ReferenceObject) -> GeneratorFn:
+        """Compile a generator for the target of a reference, memoized by $ref."""
+        ref = schema.ref
+        target = self.resolver.resolve(schema) if self.resolver else None
+        if isinstance(target, (SchemaObject, ReferenceObject)):
+            if ref in self._compiled_refs:
+                return self._compiled_refs[ref]
+            if ref in self._compiling:
+                # A cycle: link back to the depth-guarded generator compiled below
+                self._recursive_targets.setdefault(ref, None)
+                return self._recursion_guard(ref)
+            self._compiling.append(ref)
+            try:
+                generate = self.compile(target)
+            finally:
+                self._compiling.pop()
+            if ref in self._recursive_targets:
+                self._recursive_targets[ref] = generate
+                generate = self._recursion_guard(ref)
+            self._compiled_refs[ref] = generate
+            return generate
+
+        return self._compile_placeholder(ref)
+
+    def _recursion_guard(self, ref: str) -> GeneratorFn:
+        """Wrap the generator of a recursive reference with a runtime depth bound."""
+        if ref in self._recursion_guards:
+            return self._recursion_guards[ref]
+
+        targets = self._recursive_targets
+        max_depth = self.resolver.max_depth
+        state = threading.local()
+
+        def generate_recursive(rng: random.Random) -> Any:
+            # The outermost expansion is level 0; nested ones beyond the bound are pruned
+            level = getattr(state, "level", 0)
+            if level > max_depth:
+                return PRUNED
+            state.level = level + 1
+            try:
+                return targets[ref](rng)
+            finally:
+                state.level = level
+
+        self._recursion_guards[ref] = generate_recursive
+        return generate_recursive
+
+    def _compile_placeholder(self, ref: str) -> GeneratorFn:
+        """Compile a placeholder generator for a reference that cannot be resolved."""
+        if "#/components/schemas/" in ref:
+            schema_name = ref.split("/")[-1]
+            placeholder = {
+                "$ref": schema_name,
+                "placeholder": True,
+                "description": f"Referenced schema: {schema_name}",
+            }
+        else:
+            placeholder = {"$ref": ref, "placeholder": True}
+        return lambda rng: dict(placeholder)
+
+    def _compile_enum(self, schema: SchemaObject) -> GeneratorFn:
+        values = list(schema.enum)
+        return lambda rng: rng.choice(values)
+
+    def _compile_string(self, schema: SchemaObject) -> GeneratorFn:
+        """Compile a string generator with the format branch already selected."""
+        if schema.pattern:
+            # The pattern is the stricter constraint, it wins over the format
+            try:
+                return compile_pattern(
+                    schema.pattern, schema.minLength or 0, schema.maxLength
+                )
+            except (re.error, ValueError) as e:
+                print(f"Warning: Ignoring pattern {schema.pattern!r}: {e}")
+
+        generate_format = self.formats.get(schema.format)
+        if generate_format is not None:
+            return generate_format
+
+        min_len, max_len = self.string_lengths(schema)
+        letters = string.ascii_letters
+
+        def generate_string(rng: random.Random) -> str:
+            length = rng.randint(min_len, max_len)
+            return "".join(rng.choices(letters, k=length))
+
+        return generate_string
+
+    def _compile_integer(self, schema: SchemaObject) -> GeneratorFn:
+        min_val, max_val = self.integer_bounds(schema)
+        return lambda rng: rng.randint(min_val, max_val)
+
+    def _compile_number(self, schema: SchemaObject) -> GeneratorFn:
+        min_val, max_val = self.number_bounds(schema)
+        return lambda rng: rng.uniform(min_val, max_val)
+
+    def _compile_boolean(self, schema: SchemaObject) -> GeneratorFn:
+        return lambda rng: bool(rng.getrandbits(1))
+
+    def _compile_object(self, schema: SchemaObject) -> GeneratorFn:
+        """Compile an object generator from its pre-compiled properties."""
+        required = set(schema.required or ())
+        properties: List[Tuple[str, GeneratorFn, bool]] = [
+            (name, self.compile(prop_schema), name in required)
+            for name, prop_schema in (schema.properties or {}).items()
+        ]
+        if not properties:
+            return lambda rng: {}
+
+        def generate_object(rng: random.Random) -> dict:
+            result = {}
+            for name, generate, is_required in properties:
+                # 50% chance for optional properties
+                if is_required or rng.getrandbits(1):
+                    value = generate(rng)
+                    if value is not PRUNED:
+                        result[name] = value
+
+            # Make sure we have some data when every property was skipped
+            if not result:
+                name, generate, _ = rng.choice(properties)
+                value = generate(rng)
+                if value is not PRUNED:
+                    result[name] = value
+            return result
+
+        return generate_object
+
+    def _compile_array(self, schema: SchemaObject) -> GeneratorFn:
+        if not schema.items:
+            return lambda rng: []
+
+        min_items, max_items = self.item_counts(schema)
+        generate_item = self.compile(schema.items)
+        generate_batch = (
+            self._bulk.compile_batch(schema.items)
+            if max_items >= BULK_THRESHOLD
+            else None
+        )
+
+        def generate_array(rng: random.Random) -> list:
+            count = rng.randint(min_items, max_items)
+            if generate_batch is not None and count >= BULK_THRESHOLD:
+                return generate_batch(rng, count)
+            items = [generate_item(rng) for _ in range(count)]
+            return [item for item in items if item is not PRUNED]
+
+        return generate_array
+
+    @staticmethod
+    def integer_bounds(schema: SchemaObject) -> Tuple[int, int]:
+        """Inclusive integer range, defaulting to a span of 1000 around the bounds given."""
+        low, high = SchemaCompiler.number_bounds(schema)
+        # Exclusive bounds step to the next integer inside the range
+        if schema.exclusiveMinimum is not None and schema.exclusiveMinimum is not False:
+            low = math.floor(low) + 1
+        if schema.exclusiveMaximum is not None and schema.exclusiveMaximum is not False:
+            high = math.ceil(high) - 1
+        low, high = math.ceil(low), math.floor(high)
+        return low, max(low, high)
+
+    @staticmethod
+    def number_bounds(schema: SchemaObject) -> Tuple[float, float]:
+        """Numeric range from minimum/maximum, defaulting to 0-1000."""
+        low, high = schema.minimum, schema.maximum
+        # OpenAPI 3.1 gives exclusive bounds as numbers of their own
+        if low is None and not isinstance(schema.exclusiveMinimum, (bool, type(None))):
+            low = schema.exclusiveMinimum
+        if high is None and not isinstance(schema.exclusiveMaximum, (bool, type(None))):
+            high = schema.exclusiveMaximum
+        if low is None:
+            low = 0 if high is None else min(0, high)
+        if high is None:
+            high = low + 1000
+        return low, max(low, high)
+
+    @staticmethod
+    def string_lengths(schema: SchemaObject) -> Tuple[int, int]:
+        """Length range of plain strings, capped at 100 chars."""
+        min_len = schema.minLength or 1
+        return min_len, max(min_len, min(schema.maxLength or 50, 100))
+
+    @staticmethod
+    def item_counts(schema: SchemaObject) -> Tuple[int, int]:
+        """Array length range from minItems/maxItems, 1-5 items by default."""
+        min_items = schema.minItems if schema.minItems is not None else 1
+        max_items = schema.maxItems if schema.maxItems is not None else 5
+        return min_items, max(min_items, max_items)
@@ -0,0 +1,417 @@
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import ipaddress
+import math
+import re
+
+import msgspec
+
+from src.models.schema_object import SchemaObject
+from src.models.reference_object import ReferenceObject
+from src.utils.ref_resolver import RefResolver
+
+# Compiled validators raise ValidationError for values that do not match
+ValidateFn = Callable[[Any], None]
+
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    # Like the typed decoders, 29.0 is a number and not an integer
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: (
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+    ),
+    "boolean": lambda value: isinstance(value, bool),
+    "array": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+    "null": lambda value: value is None,
+}
+
+_JSON_TYPE_NAMES = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+    type(None): "null",
+}
+
+_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_UUID = re.compile(r"^[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}$")
+_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Canonical encoding of JSON values, so uniqueItems ignores object key order
+_canonical = msgspec.json.Encoder(order="sorted").encode
+
+
+def _is_date(value: str) -> bool:
+    try:
+        return bool(_DATE.match(value)) and bool(date.fromisoformat(value))
+    except ValueError:
+        return False
+
+
+def _is_date_time(value: str) -> bool:
+    try:
+        return "T" in value.upper() and bool(datetime.fromisoformat(value))
+    except ValueError:
+        return False
+
+
+def _is_ip(version: int) -> Callable[[str], bool]:
+    def is_ip(value: str) -> bool:
+        try:
+            return ipaddress.ip_address(value).version == version
+        except ValueError:
+            return False
+
+    return is_ip
+
+
+# Formats asserted by request validation, other formats are annotations only
+FORMAT_CHECKERS: Dict[str, Callable[[str], bool]] = {
+    "date": _is_date,
+    "date-time": _is_date_time,
+    "uuid": lambda value: bool(_UUID.match(value)),
+    "email": lambda value: bool(_EMAIL.match(value)),
+    "ipv4": _is_ip(4),
+    "ipv6": _is_ip(6),
+}
+
+
+class ValidationError(ValueError):
+    """A value that does not match its schema, with the location of the mismatch."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+        self.path: List[str | int] = []
+
+    def at(self, key: str | int) -> "ValidationError":
+        """Prefix the error location with the key of the enclosing container."""
+        self.path.insert(0, key)
+        return self
+
+    def __str__(self) -> str:
+        if not self.path:
+            return self.message
+        location = "".join(
+            f"[{key}]" if isinstance(key, int) else f".{key}" for key in self.path
+        )
+        return f"{location.lstrip('.')}: {self.message}"
+
+
+def _accept(value: Any) -> None:
+    pass
+
+
+def _type_name(value: Any) -> str:
+    return _JSON_TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+class ValidatorCompiler:
+    """Compiles schemas into trees of pre-bound validation closures.
+
+    Each keyword of a schema node becomes one check, built once, so
+    validating a value only runs the checks that node actually has.
+    Error locations are only assembled when a check fails.
+    """
+
+    def __init__(self, resolver: Optional[RefResolver] = None):
+        self.resolver = resolver
+        # Compiled validators memoized by $ref, recursive schemas link back to them
+        self._compiled_refs: Dict[str, ValidateFn] = {}
+
+    def compile(self, schema: SchemaObject | ReferenceObject) -> ValidateFn:
+        """Compile a schema into a validator raising ValidationError on mismatch."""
+        if isinstance(schema, ReferenceObject):
+            return self._compile_reference(schema)
+
+        checks: List[ValidateFn] = []
+        if schema.type:
+            checks.append(self._compile_type(schema.type))
+        if schema.enum is not None:
+            checks.append(self._compile_enum(schema.enum))
+        checks.extend(self._compile_string(schema))
+        checks.extend(self._compile_number(schema))
+        checks.extend(self._compile_array(schema))
+        checks.extend(self._compile_object(schema))
+        checks.extend(self._compile_composition(schema))
+
+        validate = _all_of(checks)
+        # OpenAPI 3.1 lists "null" among the types instead of setting nullable
+        if schema.nullable or (isinstance(schema.type, list) and "null" in schema.type):
+            return lambda value: None if value is None else validate(value)
+        return validate
+
+    def _compile_reference(self, schema: ReferenceObject) -> ValidateFn:
+        ref = schema.ref
+        if ref in self._compiled_refs:
+            return self._compiled_refs[ref]
+
+        target = self.resolver.resolve(schema) if self.resolver else None
+        if not isinstance(target, (SchemaObject, ReferenceObject)):
+            # Nothing to validate against for unresolved references
+            return _accept
+
+        # Registered before compiling the target, so cycles link to this indirection
+        compiled: List[ValidateFn] = []
+        self._compiled_refs[ref] = lambda value: compiled[0](value)
+        compiled.append(self.compile(target))
+        self._compiled_refs[ref] = compiled[0]
+        return compiled[0]
+
+    @staticmethod
+    def _compile_type(schema_type: str | List[str]) -> ValidateFn:
+        """Check a type, or one of the types of an OpenAPI 3.1 type list."""
+        type_names = schema_type if isinstance(schema_type, list) else [schema_type]
+        if any(name not in _TYPES for name in type_names):
+            # Unknown types are not checked
+            return _accept
+        checkers = [_TYPES[name] for name in type_names]
+        if len(checkers) == 1:
+            is_type = checkers[0]
+        else:
+
+            def is_type(value: Any) -> bool:
+                return any(check(value) for check in checkers)
+
+        expected = " or ".join(type_names)
+
+        def validate_type(value: Any) -> None:
+            if not is_type(value):
+                raise ValidationError(f"Expected {expected}, got {_type_name(value)}")
+
+        return validate_type
+
+    @staticmethod
+    def _compile_enum(enum: List[Any]) -> ValidateFn:
+        values = list(enum)
+
+        def validate_enum(value: Any) -> None:
+            if value not in values:
+                raise ValidationError(f"{value!r} is not one of {values!r}")
+
+        return validate_enum
+
+    def _compile_string(self, schema: SchemaObject) -> List[ValidateFn]:
+        checks: List[ValidateFn] = []
+        min_len, max_len = schema.minLength, schema.maxLength
+        if min_len is not None or max_len is not None:
+            low = min_len or 0
+            high = max_len if max_len is not None else math.inf
+
+            def validate_length(value: Any) -> None:
+                if isinstance(value, str) and not low <= len(value) <= high:
+                    raise ValidationError(
+                        f"Length {len(value)} is outside {low}..{high}"
+                    )
+
+            checks.append(validate_length)
+
+        if schema.pattern:
+            try:
+                search = re.compile(schema.pattern).search
+            except re.error as e:
+                print(f"Warning: Ignoring pattern {schema.pattern!r}: {e}")
+            else:
+                pattern = schema.pattern
+
+                def validate_pattern(value: Any) -> None:
+                    if isinstance(value, str) and not search(value):
+                        raise ValidationError(
+                            f"{value!r} does not match pattern {pattern!r}"
+                        )
+
+                checks.append(validate_pattern)
+
+        is_format = FORMAT_CHECKERS.get(schema.format)
+        if is_format is not None:
+            format_type = schema.format
+
+            def validate_format(value: Any) -> None:
+                if isinstance(value, str) and not is_format(value):
+                    raise ValidationError(f"{value!r} is not a valid {format_type}")
+
+            checks.append(validate_format)
+        return checks
+
+    def _compile_number(self, schema: SchemaObject) -> List[ValidateFn]:
+        checks: List[ValidateFn] = []
+        low, low_exclusive = self._bound(schema.minimum, schema.exclusiveMinimum)
+        high, high_exclusive = self._bound(schema.maximum, schema.exclusiveMaximum)
+        if low is not None or high is not None:
+            low = -math.inf if low is None else low
+            high = math.inf if high is None else high
+
+            def validate_bounds(value: Any) -> None:
+                if not isinstance(value, (int, float)) or isinstance(value, bool):
+                    return
+                if value < low or (low_exclusive and value == low):
+                    bound = "greater than" if low_exclusive else "at least"
+                    raise ValidationError(f"{value} is not {bound} {low}")
+                if value > high or (high_exclusive and value == high):
+                    bound = "less than" if high_exclusive else "at most"
+                    raise ValidationError(f"{value} is not {bound} {high}")
+
+            checks.append(validate_bounds)
+
+        if schema.multipleOf:
+            multiple = schema.multipleOf
+
+            def validate_multiple(value: Any) -> None:
+                if not isinstance(value, (int, float)) or isinstance(value, bool):
+                    return
+                quotient = value / multiple
+                if not math.isclose(quotient, round(quotient), abs_tol=1e-9):
+                    raise ValidationError(f"{value} is not a multiple of {multiple}")
+
+            checks.append(validate_multiple)
+        return checks
+
+    @staticmethod
+    def _bound(
+        limit: Optional[float], exclusive: Optional[bool | float]
+    ) -> Tuple[Optional[float], bool]:
+        """Combine an OpenAPI 3.0 boolean or 3.1 numeric exclusive bound with its limit."""
+        if isinstance(exclusive, bool) or exclusive is None:
+            return limit, bool(exclusive) and limit is not None
+        return exclusive, True
+
+    def _compile_array(self, schema: SchemaObject) -> List[ValidateFn]:
+        checks: List[ValidateFn] = []
+        if schema.minItems is not None or schema.maxItems is not None:
+            low = schema.minItems or 0
+            high = schema.maxItems if schema.maxItems is not None else math.inf
+
+            def validate_count(value: Any) -> None:
+                if isinstance(value, list) and not low <= len(value) <= high:
+                    raise ValidationError(
+                        f"Array has {len(value)} items, expected {low}..{high}"
+                    )
+
+            checks.append(validate_count)
+
+        if schema.uniqueItems:
+
+            def validate_unique(value: Any) -> None:
+                if isinstance(value, list) and len(
+                    {_canonical(item) for item in value}
+                ) != len(value):
+                    raise ValidationError("Array items are not unique")
+
+            checks.append(validate_unique)
+
+        if schema.items:
+            validate_item = self.compile(schema.items)
+            if validate_item is not _accept:
+
+                def validate_items(value: Any) -> None:
+                    if not isinstance(value, list):
+                        return
+                    for index, item in enumerate(value):
+                        try:
+                            validate_item(item)
+                        except ValidationError as e:
+                            raise e.at(index)
+
+                checks.append(validate_items)
+        return checks
+
+    def _compile_object(self, schema: SchemaObject) -> List[ValidateFn]:
+        checks: List[ValidateFn] = []
+        if schema.required:
+            required = list(schema.required)
+
+            def validate_required(value: Any) -> None:
+                if isinstance(value, dict):
+                    for name in required:
+                        if name not in value:
+                            raise ValidationError(f"Missing required property: {name}")
+
+            checks.append(validate_required)
+
+        properties = [
+            (name, self.compile(prop_schema))
+            for name, prop_schema in (schema.properties or {}).items()
+        ]
+        properties = [
+            (name, check) for name, check in properties if check is not _accept
+        ]
+        if properties:
+
+            def validate_properties(value: Any) -> None:
+                if not isinstance(value, dict):
+                    return
+                for name, validate in properties:
+                    if name in value:
+                        try:
+                            validate(value[name])
+                        except ValidationError as e:
+                            raise e.at(name)
+
+            checks.append(validate_properties)
+
+        if schema.additionalProperties is False:
+            names = frozenset(schema.properties or ())
+
+            def validate_additional(value: Any) -> None:
+                if isinstance(value, dict):
+                    for name in value:
+                        if name not in names:
+                            raise ValidationError(f"Unexpected property: {name}")
+
+            checks.append(validate_additional)
+        return checks
+
+    def _compile_composition(self, schema: SchemaObject) -> List[ValidateFn]:
+        checks: List[ValidateFn] = []
+        if schema.allOf:
+            checks.extend(self.compile(sub_schema) for sub_schema in schema.allOf)
+
+        if schema.anyOf:
+            options = [self.compile(sub_schema) for sub_schema in schema.anyOf]
+
+            def validate_any_of(value: Any) -> None:
+                for validate in options:
+                    try:
+                        validate(value)
+                        return
+                    except ValidationError:
+                        continue
+                raise ValidationError("Value does not match any schema of anyOf")
+
+            checks.append(validate_any_of)
+
+        if schema.oneOf:
+            choices = [self.compile(sub_schema) for sub_schema in schema.oneOf]
+
+            def validate_one_of(value: Any) -> None:
+                matches = 0
+                for validate in choices:
+                    try:
+                        validate(value)
+                    except ValidationError:
+                        continue
+                    matches += 1
+                if matches != 1:
+                    raise ValidationError(
+                        f"Value matches {matches} schemas of oneOf, expected exactly 1"
+                    )
+
+            checks.append(validate_one_of)
+        return checks
+
+
+def _all_of(checks: List[ValidateFn]) -> ValidateFn:
+    checks = [check for check in checks if check is not _accept]
+    if not checks:
+        return _accept
+    if len(checks) == 1:
+        return checks[0]
+
+    def validate_all(value: Any) -> None:
+        for check in checks:
+            check(value)
+
+    return validate_all
@@ -0,0 +1,256 @@
+from importlib import import_module, metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+import hashlib
+import os
+import pkgutil
+import tempfile
+
+import msgspec
+
+import src.models
+from src.models.open_api_object import OpenAPIObject
+from src.utils.spec_decoder import LazyPaths, SpecDecoder
+
+# Bump when the cache layout changes, so old entries are never misread
+CACHE_FORMAT = 2
+# Entries kept in a cache directory, the least recently used are removed
+MAX_ENTRIES = 32
+
+
+def _model_types() -> List[Type[msgspec.Struct]]:
+    """Every Struct type of the spec models, in a stable order."""
+    types = set()
+    for module in pkgutil.iter_modules(src.models.__path__):
+        namespace = vars(import_module(f"{src.models.__name__}.{module.name}"))
+        for value in namespace.values():
+            if (
+                isinstance(value, type)
+                and issubclass(value, msgspec.Struct)
+                and value.__module__.startswith(src.models.__name__)
+            ):
+                types.add(value)
+    return sorted(types, key=lambda cls: f"{cls.__module__}.{cls.__qualname__}")
+
+
+def _dymock_version() -> str:
+    try:
+        return metadata.version("dymock")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _positional(cls: Type[msgspec.Struct]) -> Callable[..., msgspec.Struct]:
+    """Constructor of a Struct from its field values, in declaration order."""
+    names = cls.__struct_fields__
+    try:
+        cls(*[None] * len(names))
+        return cls
+    except (TypeError, ValueError):
+        # Keyword-only fields (or a picky __post_init__) need keyword arguments
+        return lambda *values: cls(**dict(zip(names, values)))
+
+
+class SpecCodec:
+    """Encodes a decoded spec to msgpack and back, without parsing it again.
+
+    The models hold references where their annotations name inline objects
+    (a schema's properties may be ``ReferenceObject``), so a typed msgpack
+    decode cannot rebuild them. Each Struct is instead written as a msgpack
+    extension whose code names its type and whose data holds its field
+    values; decoding rebuilds every Struct from msgspec's ext hook.
+    """
+
+    def __init__(self):
+        self._types = _model_types()
+        self._codes = {cls: code for code, cls in enumerate(self._types)}
+        # Fields without a default, which are always written
+        self._required = {
+            cls: len(cls.__struct_fields__) - len(cls.__struct_defaults__)
+            for cls in self._types
+        }
+        self._builders = [_positional(cls) for cls in self._types]
+        # Lazy paths are stored as their raw sub-documents, decoded on access again
+        self._lazy_code = len(self._types)
+        self._spec_decoder = SpecDecoder()
+        self._encoder = msgspec.msgpack.Encoder()
+        self._decoder = msgspec.msgpack.Decoder(ext_hook=self._ext_hook)
+
+    @property
+    def fingerprint(self) -> str:
+        """Identifies the model layout the codes and fields were taken from."""
+        return ";".join(
+            f"{cls.__qualname__}({','.join(cls.__struct_fields__)})"
+            for cls in self._types
+        )
+
+    def encode(self, spec: OpenAPIObject) -> bytes:
+        return self._encoder.encode(self._pack(spec))
+
+    def decode(self, data: bytes) -> OpenAPIObject:
+        spec = self._decoder.decode(data)
+        if not isinstance(spec, OpenAPIObject):
+            raise ValueError("Cached document is not an OpenAPI specification")
+        return spec
+
+    def _pack(self, value: Any) -> Any:
+        if isinstance(value, LazyPaths):
+            return msgspec.msgpack.Ext(self._lazy_code, self._encoder.encode(value.raw))
+        if isinstance(value, msgspec.Struct):
+            cls = type(value)
+            values = [
+                self._pack(getattr(value, name)) for name in cls.__struct_fields__
+            ]
+            # Trailing fields left at None are restored from their defaults
+            end = len(values)
+            while end > self._required[cls] and values[end - 1] is None:
+                end -= 1
+            return msgspec.msgpack.Ext(
+                self._codes[cls], self._encoder.encode(values[:end])
+            )
+        if isinstance(value, dict):
+            return {key: self._pack(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._pack(item) for item in value]
+        return value
+
+    def _ext_hook(self, code: int, data: memoryview) -> Any:
+        if code == self._lazy_code:
+            return self._spec_decoder.lazy_paths(self._decoder.decode(data))
+        return self._builders[code](*self._decoder.decode(data))
+
+
+class SpecCache:
+    """On-disk cache of decoded specs, keyed by the spec's content.
+
+    Entries are keyed by a hash of the spec's location and bytes, the
+    dymock version and the layout of the models, so any change to one of
+    them misses the cache and the spec is parsed again. The location
+    matters because relative ``$ref`` files are bundled from it. Unreadable
+    entries are treated as misses.
+
+    Storing an entry removes the older entries of the same spec file, so
+    editing a watched spec does not pile up entries, and only the
+    ``max_entries`` most recently used entries are kept.
+    """
+
+    def __init__(self, directory: str | Path, max_entries: int = MAX_ENTRIES):
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self._codec = SpecCodec()
+        self._salt = (
+            f"{CACHE_FORMAT}\0{_dymock_version()}\0{self._codec.fingerprint}\0"
+        ).encode()
+
+    def key(
+        self,
+        data: bytes | memoryview,
+        lazy: bool = False,
+        path: Optional[str | Path] = None,
+    ) -> str:
+        """Cache key of a spec document's raw bytes, decoded eagerly or lazily.
+
+        ``path`` is the spec file the bytes were read from; keys of the same
+        file share their prefix.
+        """
+        source = str(Path(path).resolve()) if path is not None else ""
+        digest = hashlib.sha256(self._salt + (b"lazy\0" if lazy else b""))
+        # Hashed in place, the document is never copied
+        digest.update(data)
+        source_digest = hashlib.sha256(source.encode()).hexdigest()[:16]
+        return f"{source_digest}-{digest.hexdigest()}"
+
+    def load(
+        self, key: str, dependencies: Optional[Dict[str, int]] = None
+    ) -> Optional[OpenAPIObject]:
+        """Return a cached spec, unless a file it was bundled from has changed.
+
+        On a hit, the files the spec was bundled from are added to ``dependencies``.
+        """
+        entry_path = self.directory / f"{key}.msgpack"
+        try:
+            data = entry_path.read_bytes()
+        except OSError:
+            return None
+        try:
+            bundled_from, spec = msgspec.msgpack.decode(
+                data, type=Tuple[Dict[str, int], bytes]
+            )
+            if not _unchanged(bundled_from):
+                return None
+            spec = self._codec.decode(spec)
+        except (msgspec.DecodeError, ValueError, TypeError, IndexError):
+            return None
+        try:
+            # Marks the entry as recently used for pruning
+            os.utime(entry_path)
+        except OSError:
+            pass
+        if dependencies is not None:
+            dependencies.update(bundled_from)
+        return spec
+
+    def store(
+        self,
+        key: str,
+        spec: OpenAPIObject,
+        dependencies: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """Write an entry atomically; a cache that cannot be written is skipped.
+
+        ``dependencies`` maps the files a spec was bundled from to their
+        mtime in nanoseconds; the entry is stale once one of them changes.
+        """
+        entry = msgspec.msgpack.encode((dependencies or {}, self._codec.encode(spec)))
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(entry)
+                os.replace(tmp_path, self.directory / f"{key}.msgpack")
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            print(f"Warning: Could not write the spec cache in {self.directory}: {e}")
+            return
+        self._prune(key)
+
+    def _prune(self, key: str) -> None:
+        """Remove older entries of the same spec, then the least recently used."""
+        source = key.partition("-")[0]
+        entries = []
+        for entry in self.directory.glob("*.msgpack"):
+            if entry.stem == key:
+                continue
+            try:
+                if entry.stem.partition("-")[0] == source:
+                    entry.unlink()
+                else:
+                    entries.append((entry.stat().st_mtime_ns, entry))
+            except OSError:
+                pass
+        # The entry just stored counts towards the limit
+        entries.sort(reverse=True)
+        for _, entry in entries[max(self.max_entries - 1, 0) :]:
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+
+
+def _unchanged(dependencies: Dict[str, int]) -> bool:
+    for path, mtime in dependencies.items():
+        try:
+            if os.stat(path).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def default_cache_dir() -> Path:
+    """Per-user cache directory, honouring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "dymock"
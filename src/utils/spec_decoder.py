@@ -0,0 +1,377 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import msgspec
+
+from src.models.component_object import ComponentsObject
+from src.models.encoding_object import EncodingObject
+from src.models.example_object import ExampleObject
+from src.models.external_documentation_object import ExternalDocumentationObject
+from src.models.header_object import HeaderObject
+from src.models.info_object import InfoObject
+from src.models.media_type_object import MediaTypeObject
+from src.models.open_api_object import OpenAPIObject
+from src.models.operation_object import OperationObject
+from src.models.parameter_object import ParameterObject
+from src.models.path_item_object import PathItemObject
+from src.models.reference_object import ReferenceObject
+from src.models.request_body_object import RequestBodyObject
+from src.models.response_object import ResponseObject
+from src.models.schema_object import SchemaObject
+from src.models.security_scheme_object import SecuritySchemeObject
+from src.models.server_object import ServerObject
+from src.models.tag_object import TagObject
+
+# Turns one node of the parsed document into its model object
+DecodeFn = Callable[[Any], Any]
+
+HTTP_METHODS = ("get", "put", "post", "delete", "patch", "options", "head", "trace")
+
+
+class ModelDecoder:
+    """Builds one model Struct from a parsed mapping, without copying plain nodes.
+
+    Keys are matched against the Struct's field names (after ``renames``).
+    A mapping holding only plain fields is passed to the Struct as is, the
+    others are rebuilt key by key: nested values go through their own
+    decoder, ``x-`` keys are gathered into ``extensions`` when the model
+    keeps them, and keys the model does not know are dropped instead of
+    failing the whole document.
+    """
+
+    def __init__(
+        self,
+        cls: type,
+        nested: Optional[Dict[str, DecodeFn]] = None,
+        renames: Optional[Mapping[str, str]] = None,
+        defaults: Optional[Mapping[str, Callable[[], Any]]] = None,
+        required: Iterable[str] = (),
+        extensions: bool = False,
+    ):
+        self.cls = cls
+        self.nested = nested if nested is not None else {}
+        self.names = dict(zip(cls.__struct_encode_fields__, cls.__struct_fields__))
+        if extensions:
+            # Extensions are only read from x- keys
+            self.names.pop("extensions", None)
+        self.names.update(renames or {})
+        # Keys that cannot be passed to the Struct unchanged
+        self.rewritten = frozenset(self.nested).union(
+            key for key, name in self.names.items() if key != name
+        )
+        if extensions:
+            self.rewritten |= {"extensions"}
+        self.known = frozenset(self.names)
+        self.defaults = tuple((defaults or {}).items())
+        self.required = tuple(required)
+        self.extensions = extensions
+
+    def __call__(self, obj: Any) -> Any:
+        if type(obj) is not dict:
+            raise TypeError(
+                f"Expected object for {self.cls.__name__}, got {type(obj).__name__}"
+            )
+        for key in self.required:
+            if key not in obj:
+                raise ValueError(
+                    f"Missing required field '{key}' in {self.cls.__name__}"
+                )
+
+        if not self.defaults and self.rewritten.isdisjoint(obj):
+            try:
+                return self.cls(**obj)
+            except TypeError:
+                # Extensions or unknown keys, filtered below
+                pass
+
+        if self.known.issuperset(obj):
+            kwargs = dict(obj)
+            for key in self.rewritten.intersection(obj):
+                value = kwargs.pop(key)
+                decode = self.nested.get(key)
+                kwargs[self.names[key]] = value if decode is None else decode(value)
+        else:
+            kwargs = self._filter(obj)
+
+        for name, factory in self.defaults:
+            if name not in kwargs:
+                kwargs[name] = factory()
+        return self.cls(**kwargs)
+
+    def _filter(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Keyword arguments of a mapping holding extensions or unknown keys."""
+        kwargs = {}
+        extensions = {}
+        for key, value in obj.items():
+            name = self.names.get(key)
+            if name is not None:
+                decode = self.nested.get(key)
+                kwargs[name] = value if decode is None else decode(value)
+            elif self.extensions and key.startswith("x-"):
+                extensions[key] = value
+        if extensions:
+            kwargs["extensions"] = extensions
+        return kwargs
+
+
+def converter(cls: type) -> DecodeFn:
+    """Decoder of a model without references, converted natively by msgspec."""
+    return lambda obj: msgspec.convert(obj, type=cls)
+
+
+def ref_or(decode: DecodeFn) -> DecodeFn:
+    """Decoder of a node that is either a Reference Object or an inline object."""
+    decode_reference = converter(ReferenceObject)
+
+    def decode_ref_or_inline(obj: Any) -> Any:
+        if isinstance(obj, dict) and "$ref" in obj:
+            return decode_reference(obj)
+        return decode(obj)
+
+    return decode_ref_or_inline
+
+
+def map_of(decode: DecodeFn) -> DecodeFn:
+    # YAML may load keys such as status codes as integers
+    return lambda obj: {str(key): decode(value) for key, value in obj.items()}
+
+
+def list_of(decode: DecodeFn) -> DecodeFn:
+    return lambda obj: [decode(item) for item in obj]
+
+
+class LazyPaths(Mapping[str, PathItemObject]):
+    """Paths of a spec whose path items are decoded on first access.
+
+    The raw sub-document of every path is kept as parsed; the route table
+    is built from path keys and method names alone, and a path item is
+    decoded once, when one of its operations is first needed.
+    """
+
+    def __init__(self, raw: Dict[Any, Any], decode: DecodeFn):
+        self.raw = {str(path): item for path, item in raw.items()}
+        self._decode = decode
+        self._decoded: Dict[str, PathItemObject] = {}
+
+    def __getitem__(self, path: str) -> PathItemObject:
+        path_item = self._decoded.get(path)
+        if path_item is None:
+            path_item = self._decoded[path] = self._decode(self.raw[path])
+        return path_item
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def methods(self, path: str) -> Tuple[str, ...]:
+        """HTTP methods of a path that define an operation, without decoding it."""
+        raw = self.raw[path]
+        if not isinstance(raw, dict):
+            return ()
+        return tuple(method for method in HTTP_METHODS if method in raw)
+
+    def raw_operation(self, path: str, method: str) -> Dict[str, Any]:
+        """The undecoded operation of a path and method."""
+        return self.raw[path][method]
+
+    @property
+    def decoded(self) -> int:
+        """How many path items were decoded so far."""
+        return len(self._decoded)
+
+
+def _build_decoders() -> Tuple[DecodeFn, Dict[str, DecodeFn]]:
+    """Wire the decoders of every model, recursive ones included."""
+    decode_reference = converter(ReferenceObject)
+
+    def decode_schema(obj: Any) -> Union[SchemaObject, ReferenceObject]:
+        if "$ref" in obj:
+            return decode_reference(obj)
+        if schema_object.rewritten.isdisjoint(obj):
+            # Leaf schemas, by far the most common nodes, skip the decoder call
+            try:
+                schema = SchemaObject(**obj)
+            except TypeError:
+                schema = schema_object(obj)
+        else:
+            schema = schema_object(obj)
+        # Object schemas always carry a list of required properties
+        if schema.type == "object" and schema.required is None:
+            schema.required = []
+        return schema
+
+    schema_object = ModelDecoder(
+        SchemaObject,
+        {
+            "properties": map_of(decode_schema),
+            "items": decode_schema,
+            "allOf": list_of(decode_schema),
+            "anyOf": list_of(decode_schema),
+            "oneOf": list_of(decode_schema),
+        },
+    )
+
+    example = ref_or(converter(ExampleObject))
+    # Headers and media types nest each other, hence the late-bound lookup
+    header = ref_or(lambda obj: header_object(obj))
+    media_type = ModelDecoder(
+        MediaTypeObject,
+        {
+            "schema": decode_schema,
+            "examples": map_of(example),
+            "encoding": map_of(
+                ModelDecoder(EncodingObject, {"headers": map_of(header)})
+            ),
+        },
+    )
+    header_object = ModelDecoder(
+        HeaderObject,
+        {"schema": decode_schema, "content": map_of(media_type)},
+        extensions=True,
+    )
+    parameter = ref_or(
+        ModelDecoder(
+            ParameterObject,
+            {"schema": decode_schema, "content": map_of(media_type)},
+            renames={"in": "param_in"},
+            defaults={"content": dict},
+            required=("in",),
+        )
+    )
+    response = ref_or(
+        ModelDecoder(
+            ResponseObject,
+            {"content": map_of(media_type), "headers": map_of(header)},
+            required=("description",),
+        )
+    )
+    request_body = ref_or(
+        ModelDecoder(
+            RequestBodyObject,
+            {"content": map_of(media_type)},
+            defaults={"content": dict},
+        )
+    )
+    operation = ModelDecoder(
+        OperationObject,
+        {
+            "parameters": list_of(parameter),
+            "responses": map_of(response),
+            "requestBody": request_body,
+        },
+        defaults={"parameters": list},
+        extensions=True,
+    )
+    path_item = ModelDecoder(
+        PathItemObject,
+        {
+            "parameters": list_of(parameter),
+            "servers": list_of(converter(ServerObject)),
+            **{method: operation for method in HTTP_METHODS},
+        },
+        renames={"$ref": "ref"},
+    )
+    components = ModelDecoder(
+        ComponentsObject,
+        {
+            "schemas": map_of(decode_schema),
+            "responses": map_of(response),
+            "parameters": map_of(parameter),
+            "examples": map_of(example),
+            "requestBodies": map_of(request_body),
+            "headers": map_of(header),
+        },
+        defaults={
+            "schemas": dict,
+            "responses": dict,
+            "parameters": dict,
+            "examples": dict,
+            "requestBodies": dict,
+        },
+    )
+    openapi = ModelDecoder(
+        OpenAPIObject,
+        {
+            "info": converter(InfoObject),
+            "servers": list_of(converter(ServerObject)),
+            "paths": map_of(path_item),
+            "components": components,
+            "security": list_of(converter(SecuritySchemeObject)),
+            "tags": list_of(converter(TagObject)),
+            "externalDocs": converter(ExternalDocumentationObject),
+        },
+        defaults={"servers": list, "security": list, "tags": list},
+        required=("info", "paths"),
+    )
+    return openapi, {
+        "schema": decode_schema,
+        "media_type": media_type,
+        "parameter": parameter,
+        "response": response,
+        "request_body": request_body,
+        "operation": operation,
+        "path_item": path_item,
+        "components": components,
+    }
+
+
+class SpecDecoder:
+    """Decodes OpenAPI documents from raw bytes into the model Structs.
+
+    The document is parsed once (JSON natively by msgspec, YAML with the
+    C loader when available), then every node is turned into its model in
+    one pass: no intermediate dict copies and no encode/decode round trips.
+    """
+
+    def __init__(self):
+        self._openapi, self._decoders = _build_decoders()
+        self._json = msgspec.json.Decoder()
+
+    def parse(self, data: Union[str, bytes, memoryview], format: str = "json") -> Any:
+        """Parse a JSON or YAML document into plain Python objects.
+
+        Bytes-like documents, memory-mapped files included, are read in place.
+        """
+        if format == "json":
+            return self._json.decode(data)
+        if format == "yaml":
+            return msgspec.yaml.decode(data)
+        raise ValueError(f"Unsupported format: {format}. Use 'json' or 'yaml'.")
+
+    def decode(
+        self,
+        data: Union[str, bytes, memoryview],
+        format: str = "json",
+        lazy: bool = False,
+    ) -> OpenAPIObject:
+        return self.convert(self.parse(data, format), lazy=lazy)
+
+    def convert(self, obj: Dict[str, Any], lazy: bool = False) -> OpenAPIObject:
+        """Turn an already parsed document into an OpenAPIObject.
+
+        With ``lazy``, the paths become a ``LazyPaths`` mapping and only the
+        rest of the document is decoded up front.
+        """
+        if not lazy or not isinstance(obj.get("paths"), dict):
+            return self._openapi(obj)
+        spec = self._openapi({**obj, "paths": {}})
+        spec.paths = self.lazy_paths(obj["paths"])
+        return spec
+
+    def lazy_paths(self, raw: Dict[Any, Any]) -> LazyPaths:
+        return LazyPaths(raw, self._decoders["path_item"])
+
+    def convert_node(self, kind: str, obj: Any) -> Any:
+        """Turn one parsed node (``"schema"``, ``"operation"``, ...) into its model."""
+        return self._decoders[kind](obj)
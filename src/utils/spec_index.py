@@ -0,0 +1,204 @@
+import re
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from src.models.component_object import ComponentsObject
+from src.models.open_api_object import OpenAPIObject
+from src.utils.spec_decoder import HTTP_METHODS, LazyPaths
+
+# One operation of a spec: (method, OpenAPI path)
+RouteKey = Tuple[str, str]
+
+# Every kind of component, by its name in the document
+COMPONENT_SECTIONS = ComponentsObject.__struct_encode_fields__
+
+_PARAMETER = re.compile(r"\{([^{}/]+)\}")
+
+
+def component_ref(section: str, name: str) -> str:
+    """The local ``$ref`` of a component."""
+    return f"#/components/{section}/{name.replace('~', '~0').replace('/', '~1')}"
+
+
+def operation_name(method: str, path: str, operation_id: Optional[str]) -> str:
+    """The operationId of an operation, or the name it goes by without one."""
+    return operation_id or f"{method}_{path}".replace("/", "_")
+
+
+def _segment_pattern(segment: str) -> str:
+    """Regular expression of a segment mixing text and parameters."""
+    return "".join(
+        "([^/]+?)" if index % 2 else re.escape(part)
+        for index, part in enumerate(_PARAMETER.split(segment))
+    )
+
+
+class _TrieNode:
+    __slots__ = ("static", "patterns", "param", "template", "names")
+
+    def __init__(self):
+        self.static: Dict[str, "_TrieNode"] = {}
+        # Segments mixing text and parameters, such as "{name}.json"
+        self.patterns: Dict[str, Tuple[re.Pattern, "_TrieNode"]] = {}
+        # Segments that are a single parameter, whatever its name
+        self.param: Optional["_TrieNode"] = None
+        # Set on the node ending a template, with its parameter names in order
+        self.template: Optional[str] = None
+        self.names: Tuple[str, ...] = ()
+
+
+class PathTrie:
+    """Path templates by segment, matching a concrete path in O(segments).
+
+    Static segments are tried first, then segments mixing text and
+    parameters, then single-parameter segments, backtracking when a branch
+    dead-ends, so ``/pets/mine`` wins over ``/pets/{petId}``.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+
+    def insert(self, template: str) -> None:
+        node = self._root
+        names: List[str] = []
+        for segment in template.split("/")[1:]:
+            params = _PARAMETER.findall(segment)
+            if not params:
+                node = node.static.setdefault(segment, _TrieNode())
+            elif _PARAMETER.fullmatch(segment):
+                node.param = node.param or _TrieNode()
+                node = node.param
+            else:
+                source = _segment_pattern(segment)
+                if source not in node.patterns:
+                    node.patterns[source] = (re.compile(source), _TrieNode())
+                node = node.patterns[source][1]
+            names.extend(params)
+        if node.template is None:
+            node.template = template
+            node.names = tuple(names)
+
+    def match(self, path: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        """The template matching a concrete path, with its parameter values."""
+        values: List[str] = []
+        node = self._match(self._root, path.split("/")[1:], 0, values)
+        if node is None:
+            return None
+        return node.template, dict(zip(node.names, values))
+
+    def _match(
+        self, node: _TrieNode, segments: List[str], position: int, values: List[str]
+    ) -> Optional[_TrieNode]:
+        if position == len(segments):
+            return node if node.template is not None else None
+        segment = segments[position]
+        child = node.static.get(segment)
+        if child is not None:
+            found = self._match(child, segments, position + 1, values)
+            if found is not None:
+                return found
+        if not segment:
+            # Parameters never match an empty segment
+            return None
+        for pattern, child in node.patterns.values():
+            matched = pattern.fullmatch(segment)
+            if matched is None:
+                continue
+            values.extend(matched.groups())
+            found = self._match(child, segments, position + 1, values)
+            if found is not None:
+                return found
+            del values[len(values) - len(matched.groups()) :]
+        if node.param is not None:
+            values.append(segment)
+            found = self._match(node.param, segments, position + 1, values)
+            if found is not None:
+                return found
+            values.pop()
+        return None
+
+
+class SpecIndex:
+    """Lookup tables of a spec, built once after parsing.
+
+    Operations are found by ``(method, path)`` or by operationId, concrete
+    paths are matched to their template through a ``PathTrie``, and
+    components are found by kind and name or by their local ``$ref``.
+    Lazily decoded paths are indexed from their raw documents, so building
+    the index decodes nothing.
+    """
+
+    def __init__(self, spec: OpenAPIObject):
+        self.spec = spec
+        self.paths: Mapping[str, Any] = spec.paths or {}
+        # (method, path) -> operationId, in document order
+        self.routes: Dict[RouteKey, Optional[str]] = {}
+        # operationId, or generated name without one -> (method, path)
+        self.operation_ids: Dict[str, RouteKey] = {}
+        self.trie = PathTrie()
+        self._methods: Dict[str, Tuple[str, ...]] = {}
+        for path in self.paths:
+            methods = self._index_path(path)
+            if methods and path.startswith("/"):
+                self._methods[path] = methods
+                self.trie.insert(path)
+
+        # Kind -> name -> component, and local $ref -> component
+        self.components: Dict[str, Mapping[str, Any]] = {}
+        self.refs: Dict[str, Any] = {}
+        for section in COMPONENT_SECTIONS:
+            entries = getattr(spec.components, section, None) or {}
+            self.components[section] = entries
+            for name, component in entries.items():
+                self.refs[component_ref(section, name)] = component
+
+    def _index_path(self, path: str) -> Tuple[str, ...]:
+        if isinstance(self.paths, LazyPaths):
+            methods = self.paths.methods(path)
+            raw = self.paths.raw[path]
+            operation_ids = [
+                raw[method].get("operationId")
+                if isinstance(raw[method], dict)
+                else None
+                for method in methods
+            ]
+        else:
+            path_item = self.paths[path]
+            operations = [getattr(path_item, method, None) for method in HTTP_METHODS]
+            methods = tuple(
+                method
+                for method, operation in zip(HTTP_METHODS, operations)
+                if operation
+            )
+            operation_ids = [
+                operation.operationId for operation in operations if operation
+            ]
+        for method, operation_id in zip(methods, operation_ids):
+            self.routes[(method, path)] = operation_id
+            # The first of duplicated operationIds wins, like the document order
+            self.operation_ids.setdefault(
+                operation_name(method, path, operation_id), (method, path)
+            )
+        return methods
+
+    def methods(self, path: str) -> Tuple[str, ...]:
+        """HTTP methods a path defines operations for."""
+        return self._methods.get(path, ())
+
+    def operation(self, method: str, path: str) -> Any:
+        """The decoded operation of a route; lazy paths are decoded on this call."""
+        return getattr(self.paths[path], method)
+
+    def by_operation_id(self, operation_id: str) -> Optional[Tuple[str, str, Any]]:
+        """The (method, path, operation) of an operationId, or None."""
+        key = self.operation_ids.get(operation_id)
+        if key is None:
+            return None
+        return key[0], key[1], self.operation(*key)
+
+    def match(self, path: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        """The template of a concrete request path, with its parameter values."""
+        return self.trie.match(path)
+
+    def component(self, ref: str) -> Any:
+        """The component a local ``#/components/...`` reference names, or None."""
+        return self.refs.get(ref)
@@ -0,0 +1,229 @@
+from datetime import date, datetime
+from typing import Annotated, Any, Dict, List, Literal, Optional, Set, Union
+import re
+import uuid
+
+import msgspec
+
+from src.models.schema_object import SchemaObject
+from src.models.reference_object import ReferenceObject
+from src.utils.ref_resolver import RefResolver
+
+# Same loose check as request validation, expressed as a msgspec pattern
+_EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+# Formats msgspec decodes and checks natively
+_FORMAT_TYPES = {"date": date, "date-time": datetime, "uuid": uuid.UUID}
+
+# Formats that are only annotations, decoded as plain strings
+_ANNOTATION_FORMATS = {None, "byte", "binary", "password", "hostname", "uri"}
+
+
+class UnsupportedSchema(Exception):
+    """A schema keyword that msgspec types cannot express."""
+
+
+class StructBuilder:
+    """Builds msgspec types from schemas, for decoding and validating in one call.
+
+    Object schemas become ``msgspec.Struct`` types created at runtime, and
+    constraints become ``msgspec.Meta`` annotations, so a typed decoder checks
+    a request body while parsing it. Schemas using keywords msgspec cannot
+    express (compositions, uniqueItems, recursive references, ...) have no
+    typed decoder and are left to the compiled Python validators.
+    """
+
+    def __init__(self, resolver: Optional[RefResolver] = None):
+        self.resolver = resolver
+        # Types memoized by $ref, so components become one Struct type each
+        self._ref_types: Dict[str, Any] = {}
+        self._building: Set[str] = set()
+
+    def decoder_for(
+        self, schema: SchemaObject | ReferenceObject, name: str = "Body"
+    ) -> Optional[msgspec.json.Decoder]:
+        """Return a typed JSON decoder for a schema, or None if it is not expressible."""
+        try:
+            return msgspec.json.Decoder(self.type_for(schema, name))
+        except (UnsupportedSchema, TypeError, re.error):
+            return None
+
+    def type_for(self, schema: SchemaObject | ReferenceObject, name: str) -> Any:
+        """Translate a schema into a msgspec-compatible type annotation."""
+        if isinstance(schema, ReferenceObject):
+            return self._reference_type(schema)
+
+        if schema.allOf or schema.anyOf or schema.oneOf:
+            raise UnsupportedSchema("allOf/anyOf/oneOf")
+
+        if schema.enum:
+            schema_type = self._enum_type(schema.enum)
+        elif schema.type == "string":
+            schema_type = self._string_type(schema)
+        elif schema.type == "integer":
+            schema_type = Annotated[int, self._number_meta(schema)]
+        elif schema.type == "number":
+            schema_type = Annotated[float, self._number_meta(schema)]
+        elif schema.type == "boolean":
+            schema_type = bool
+        elif schema.type == "null":
+            schema_type = None
+        elif schema.type == "array":
+            schema_type = self._array_type(schema, name)
+        elif schema.type == "object" or schema.properties:
+            schema_type = self._object_type(schema, name)
+        elif schema.type is None and not _has_constraints(schema):
+            schema_type = Any
+        else:
+            raise UnsupportedSchema(f"type {schema.type}")
+
+        if schema.nullable:
+            return Optional[schema_type]
+        return schema_type
+
+    def _reference_type(self, schema: ReferenceObject) -> Any:
+        ref = schema.ref
+        if ref in self._ref_types:
+            return self._ref_types[ref]
+        if ref in self._building:
+            raise UnsupportedSchema(f"recursive reference {ref}")
+
+        target = self.resolver.resolve(schema) if self.resolver else None
+        if not isinstance(target, (SchemaObject, ReferenceObject)):
+            # Unresolved references accept anything, like the Python validators
+            return Any
+
+        self._building.add(ref)
+        try:
+            schema_type = self.type_for(target, ref.rsplit("/", 1)[-1])
+        finally:
+            self._building.discard(ref)
+        self._ref_types[ref] = schema_type
+        return schema_type
+
+    @staticmethod
+    def _enum_type(enum: List[Any]) -> Any:
+        if not all(
+            value is None
+            or isinstance(value, str)
+            or (isinstance(value, int) and not isinstance(value, bool))
+            for value in enum
+        ):
+            raise UnsupportedSchema("enum of non string/integer values")
+        return Literal[tuple(enum)]
+
+    @staticmethod
+    def _string_type(schema: SchemaObject) -> Any:
+        if schema.format in _FORMAT_TYPES:
+            if schema.pattern or schema.minLength or schema.maxLength is not None:
+                raise UnsupportedSchema(f"constrained {schema.format} string")
+            return _FORMAT_TYPES[schema.format]
+
+        pattern = schema.pattern
+        if schema.format == "email":
+            if pattern:
+                raise UnsupportedSchema("email string with a pattern")
+            pattern = _EMAIL_PATTERN
+        elif schema.format not in _ANNOTATION_FORMATS:
+            raise UnsupportedSchema(f"format {schema.format}")
+
+        meta = msgspec.Meta(
+            pattern=pattern,
+            min_length=schema.minLength,
+            max_length=schema.maxLength,
+        )
+        return Annotated[str, meta]
+
+    @staticmethod
+    def _number_meta(schema: SchemaObject) -> msgspec.Meta:
+        bounds: Dict[str, Any] = {}
+        for limit, exclusive, inclusive_key, exclusive_key in (
+            (schema.minimum, schema.exclusiveMinimum, "ge", "gt"),
+            (schema.maximum, schema.exclusiveMaximum, "le", "lt"),
+        ):
+            if exclusive is not None and not isinstance(exclusive, bool):
+                # OpenAPI 3.1 numeric exclusive bound
+                bounds[exclusive_key] = exclusive
+            elif limit is not None:
+                bounds[exclusive_key if exclusive else inclusive_key] = limit
+        if schema.type == "integer":
+            bounds = {key: _integral(value) for key, value in bounds.items()}
+        if schema.multipleOf:
+            bounds["multiple_of"] = (
+                _integral(schema.multipleOf)
+                if schema.type == "integer"
+                else schema.multipleOf
+            )
+        return msgspec.Meta(**bounds)
+
+    def _array_type(self, schema: SchemaObject, name: str) -> Any:
+        if schema.uniqueItems:
+            raise UnsupportedSchema("uniqueItems")
+        item_type = self.type_for(schema.items, f"{name}Item") if schema.items else Any
+        meta = msgspec.Meta(min_length=schema.minItems, max_length=schema.maxItems)
+        return Annotated[List[item_type], meta]
+
+    def _object_type(self, schema: SchemaObject, name: str) -> Any:
+        if not schema.properties:
+            if schema.additionalProperties is False or schema.required:
+                raise UnsupportedSchema("constrained object without properties")
+            return Dict[str, Any]
+
+        required = set(schema.required or ())
+        fields = []
+        rename = {}
+        # Positional field names stay valid identifiers whatever the property names
+        for index, (prop_name, prop_schema) in enumerate(schema.properties.items()):
+            field = f"f{index}"
+            rename[field] = prop_name
+            prop_type = self.type_for(prop_schema, f"{name}{prop_name.title()}")
+            if prop_name in required:
+                fields.append((field, prop_type))
+            else:
+                fields.append(
+                    (field, Union[prop_type, msgspec.UnsetType], msgspec.UNSET)
+                )
+        if not required.issubset(schema.properties):
+            raise UnsupportedSchema("required property without a schema")
+
+        # Required fields come first, Structs cannot have them after defaults
+        fields.sort(key=len)
+        return msgspec.defstruct(
+            _struct_name(name),
+            fields,
+            rename=rename,
+            forbid_unknown_fields=schema.additionalProperties is False,
+        )
+
+
+def _has_constraints(schema: SchemaObject) -> bool:
+    """Whether a schema without a type still constrains values of some types."""
+    return any(
+        getattr(schema, keyword) is not None
+        for keyword in (
+            "items",
+            "pattern",
+            "minLength",
+            "maxLength",
+            "format",
+            "minimum",
+            "maximum",
+            "exclusiveMinimum",
+            "exclusiveMaximum",
+            "multipleOf",
+            "minItems",
+            "maxItems",
+            "uniqueItems",
+            "required",
+        )
+    )
+
+
+def _integral(value: float) -> int:
+    if value != int(value):
+        raise UnsupportedSchema(f"non-integral bound {value} on an integer")
+    return int(value)
+
+
+def _struct_name(name: str) -> str:
+    return re.sub(r"\W", "_", name) or "Body"
@@ -0,0 +1,41 @@
+import json
+
+from benchmarks.load import regressions, run_benchmarks
+from benchmarks.synthetic_spec import SpecShape, synthetic_spec
+from src.utils.open_api_parser import OpenAPIParser
+from src.utils.spec_index import SpecIndex
+
+
+def test_synthetic_specs_follow_their_shape():
+    shape = SpecShape(paths=6, operations_per_path=3, schema_depth=3, components=4)
+    document = synthetic_spec(shape)
+    assert synthetic_spec(shape) == document
+
+    index = SpecIndex(OpenAPIParser().parse(document))
+    assert len(index.routes) == 18
+    assert index.match("/resources3/9") == ("/resources3/{id}", {"id": "9"})
+    assert len(index.components["schemas"]) == 4
+
+    inline = synthetic_spec(shape._replace(ref_density=0))
+    assert "$ref" not in json.dumps(inline["paths"])
+
+
+def test_benchmarks_report_every_stage_and_flag_regressions():
+    results = run_benchmarks(SpecShape(paths=4, components=2), repeat=1)
+
+    assert set(results["stages"]) >= {"open_api_parser", "register_routes"}
+    for stage in results["stages"].values():
+        assert stage["wall_seconds"]["min"] <= stage["wall_seconds"]["median"]
+        assert stage["peak_bytes"] > 0
+
+    slower = {
+        "stages": {
+            name: {
+                **stage,
+                "wall_seconds": {"median": stage["wall_seconds"]["median"] / 2},
+            }
+            for name, stage in results["stages"].items()
+        }
+    }
+    assert regressions(results, results, tolerance=0) == []
+    assert len(regressions(results, slower, tolerance=0.5)) == len(results["stages"])
@@ -0,0 +1,243 @@
+import random
+
+import pytest
+
+from src.models.schema_object import SchemaObject
+from src.utils.mock_data_generator import MockDataGenerator
+
+
+def test_compiled_generator_is_reusable():
+    generator = MockDataGenerator()
+    schema = SchemaObject(
+        type="object",
+        properties={
+            "id": SchemaObject(type="integer"),
+            "email": SchemaObject(type="string", format="email"),
+            "tags": SchemaObject(type="array", items=SchemaObject(type="string")),
+        },
+        required=["id", "email", "tags"],
+    )
+
+    generate = generator.compile(schema)
+    for _ in range(10):
+        result = generate(generator.random)
+        assert isinstance(result["id"], int)
+        assert "@" in result["email"]
+        assert 1 <= len(result["tags"]) <= 5
+        assert all(isinstance(tag, str) for tag in result["tags"])
+
+
+def test_compiled_enum_and_string_formats():
+    generator = MockDataGenerator()
+
+    generate = generator.generate_from_schema
+    assert generate(SchemaObject(type="string", enum=["a", "b"])) in {"a", "b"}
+    assert len(generate(SchemaObject(type="string", format="date"))) == 10
+    assert generate(SchemaObject(type="null")) is None
+    assert generate(SchemaObject(type="object")) == {}
+
+
+def _spec_with_components(schemas):
+    from src.utils.decoder import CustomDecoder
+
+    return CustomDecoder().decode_openapi(
+        {
+            "openapi": "3.0.0",
+            "info": {"title": "Test API", "version": "1.0.0"},
+            "paths": {},
+            "components": {"schemas": schemas},
+        }
+    )
+
+
+def test_references_are_resolved_to_their_target():
+    from src.models.reference_object import ReferenceObject
+    from src.utils.ref_resolver import RefResolver
+
+    spec = _spec_with_components(
+        {
+            "Pet": {
+                "type": "object",
+                "required": ["id", "owner"],
+                "properties": {
+                    "id": {"type": "integer"},
+                    "owner": {"$ref": "#/components/schemas/Owner"},
+                },
+            },
+            "Owner": {"$ref": "#/components/schemas/Person"},
+            "Person": {
+                "type": "object",
+                "required": ["name"],
+                "properties": {"name": {"type": "string"}},
+            },
+        }
+    )
+    resolver = RefResolver(spec)
+    owner = resolver.resolve_ref("#/components/schemas/Owner")
+    assert owner is spec.components.schemas["Person"]
+
+    pet = MockDataGenerator(resolver=resolver).generate_from_schema(
+        ReferenceObject(ref="#/components/schemas/Pet")
+    )
+    assert isinstance(pet["id"], int)
+    assert isinstance(pet["owner"]["name"], str)
+
+
+def test_recursive_references_respect_depth_bound():
+    from src.models.reference_object import ReferenceObject
+    from src.utils.ref_resolver import RefResolver
+
+    spec = _spec_with_components(
+        {
+            "Node": {
+                "type": "object",
+                "required": ["value", "child"],
+                "properties": {
+                    "value": {"type": "integer"},
+                    "child": {"$ref": "#/components/schemas/Node"},
+                },
+            }
+        }
+    )
+    generator = MockDataGenerator(resolver=RefResolver(spec, max_depth=2))
+    node = generator.generate_from_schema(
+        ReferenceObject(ref="#/components/schemas/Node")
+    )
+
+    depth = 0
+    while "child" in node:
+        node = node["child"]
+        depth += 1
+    assert depth == 2
+    assert isinstance(node["value"], int)
+
+
+def test_large_arrays_are_generated_column_wise():
+    pytest.importorskip("numpy")
+    import random
+
+    item = SchemaObject(
+        type="object",
+        properties={
+            "id": SchemaObject(type="integer", minimum=10, maximum=20),
+            "uuid": SchemaObject(type="string", format="uuid"),
+            "name": SchemaObject(type="string", minLength=3, maxLength=8),
+            "active": SchemaObject(type="boolean"),
+        },
+        required=["id", "uuid"],
+    )
+    schema = SchemaObject(type="array", items=item, minItems=500, maxItems=500)
+
+    generate = MockDataGenerator().compile(schema)
+    rows = generate(random.Random(3))
+
+    assert len(rows) == 500
+    assert all(10 <= row["id"] <= 20 for row in rows)
+    assert all(len(row["uuid"]) == 36 and row["uuid"][14] == "4" for row in rows)
+    assert all(3 <= len(row["name"]) <= 8 for row in rows if "name" in row)
+    assert any("active" in row for row in rows)
+    assert generate(random.Random(3)) == rows
+
+
+def test_dates_do_not_depend_on_the_clock():
+    from src.utils.format_registry import LATEST_DATE
+
+    item = SchemaObject(
+        type="object",
+        properties={
+            "day": SchemaObject(type="string", format="date"),
+            "at": SchemaObject(type="string", format="date-time"),
+        },
+        required=["day", "at"],
+    )
+    for items in (item, item.properties["day"], item.properties["at"]):
+        schema = SchemaObject(type="array", items=items, minItems=500, maxItems=500)
+        values = MockDataGenerator().compile(schema)(random.Random(7))
+        if items is item:
+            values = [row["day"] for row in values] + [row["at"] for row in values]
+        assert all(value < LATEST_DATE.isoformat() for value in values)
+        assert MockDataGenerator().compile(schema)(random.Random(7)) == (
+            MockDataGenerator().compile(schema)(random.Random(7))
+        )
+
+    single = MockDataGenerator().compile(item)
+    assert all(
+        value < LATEST_DATE.isoformat() for value in single(random.Random(1)).values()
+    )
+
+
+def test_formats_are_built_only_when_compiled():
+    generator = MockDataGenerator()
+    assert generator.formats._generators == {}
+
+    email = generator.generate_from_schema(SchemaObject(type="string", format="email"))
+    assert "@" in email
+    assert list(generator.formats._generators) == ["email"]
+
+
+def test_custom_formats_override_builtins_and_bulk_columns():
+    generator = MockDataGenerator()
+    generator.register_format("uuid", lambda rng: "fixed")
+    generator.register_format("phone", "phone_number")
+
+    items = SchemaObject(
+        type="array",
+        minItems=100,
+        maxItems=100,
+        items=SchemaObject(type="string", format="uuid"),
+    )
+    assert generator.generate_from_schema(items) == ["fixed"] * 100
+
+    phone = SchemaObject(type="string", format="phone")
+    assert generator.generate_from_schema(
+        phone, random.Random(1)
+    ) == generator.generate_from_schema(phone, random.Random(1))
+
+    with pytest.raises(TypeError):
+        generator.register_format("bad", 42)
+
+
+def test_strings_match_their_pattern():
+    import re
+
+    generator = MockDataGenerator()
+    patterns = [
+        r"^[A-Z]{2}-\d{4}$",
+        r"^(?:[a-f0-9]{2}:){5}[a-f0-9]{2}$",
+        r"^(ab|cd)\1[^0-9]+$",
+        r"^(?=.*\d)[a-z\d]{8}$",
+    ]
+    for pattern in patterns:
+        schema = SchemaObject(type="string", format="uuid", pattern=pattern)
+        generate = generator.compile(schema)
+        for _ in range(50):
+            assert re.search(pattern, generate(generator.random))
+
+    items = SchemaObject(
+        type="array",
+        minItems=100,
+        maxItems=100,
+        items=SchemaObject(type="string", format="uuid", pattern=r"^ID\d{3}$"),
+    )
+    assert all(
+        re.search(r"^ID\d{3}$", v) for v in generator.generate_from_schema(items)
+    )
+
+
+def test_pattern_strings_respect_their_length_bounds():
+    import re
+
+    generator = MockDataGenerator()
+    for pattern, min_length, max_length in [
+        (r"^\d+$", None, 5),
+        (r"^[a-z]+\d*$", 12, 14),
+        (r"^(?=.*\d)[a-z\d]+$", 3, 4),
+    ]:
+        schema = SchemaObject(
+            type="string", pattern=pattern, minLength=min_length, maxLength=max_length
+        )
+        generate = generator.compile(schema)
+        for _ in range(200):
+            value = generate(generator.random)
+            assert re.search(pattern, value)
+            assert (min_length or 0) <= len(value) <= max_length
@@ -1,3 +1,7 @@
+from pathlib import Path
+import os
+
+import msgspec
 import pytest
 
 from src.models.open_api_object import OpenAPIObject
@@ -356,3 +360,310 @@ def test_request_validation():
             ]  # Either success or validation error
 
     asyncio.run(test_validation())
+
+
+def test_spec_cache_round_trips_decoded_specs(tmp_path):
+    from src.utils.config import Config
+    from src.utils.spec_cache import SpecCache
+    from src.utils.spec_decoder import LazyPaths
+
+    spec_path = tmp_path / "petstore.json"
+    spec_path.write_bytes(
+        (Path(__file__).parent.parent / "src/templates/petstore.json").read_bytes()
+    )
+    cache = SpecCache(tmp_path / "cache")
+
+    parsed = Config.get_spec(spec_path, cache=cache)
+    assert len(list((tmp_path / "cache").glob("*.msgpack"))) == 1
+    cached = Config.get_spec(spec_path, cache=cache)
+    assert cached == parsed
+    assert cached == Config.get_spec(spec_path)
+
+    # Other contents miss the cache, and a corrupt entry is parsed again
+    assert cache.load(cache.key(b"{}")) is None
+    for entry in (tmp_path / "cache").glob("*.msgpack"):
+        entry.write_bytes(b"\xc1")
+    assert Config.get_spec(spec_path, cache=cache) == parsed
+
+    # Lazy specs keep their raw paths in the cache, decoded on access
+    Config.get_spec(spec_path, cache=cache, lazy=True)
+    lazy = Config.get_spec(spec_path, cache=cache, lazy=True)
+    assert isinstance(lazy.paths, LazyPaths) and lazy.paths.decoded == 0
+    assert dict(lazy.paths) == parsed.paths
+
+
+def test_spec_cache_keys_by_path_and_prunes_old_entries(tmp_path):
+    from src.utils.config import Config
+    from src.utils.spec_cache import SpecCache
+
+    cache = SpecCache(tmp_path / "cache", max_entries=2)
+
+    def entries():
+        return sorted(entry.stem for entry in cache.directory.glob("*.msgpack"))
+
+    # Identical bytes at two locations bundle relative refs differently
+    document = (
+        b'{"openapi": "3.0.3", "info": {"title": "A", "version": "1"}, "paths": {}}'
+    )
+    first, second = tmp_path / "a" / "spec.json", tmp_path / "b" / "spec.json"
+    for spec_path in (first, second):
+        spec_path.parent.mkdir()
+        spec_path.write_bytes(document)
+    assert cache.key(document, path=first) != cache.key(document, path=second)
+
+    # Editing a spec replaces its entry instead of adding one
+    Config.get_spec(first, cache=cache)
+    for title in ("B", "C"):
+        first.write_bytes(document.replace(b'"A"', f'"{title}"'.encode()))
+        Config.get_spec(first, cache=cache)
+    assert entries() == [cache.key(first.read_bytes(), path=first)]
+
+    # Past the limit, the least recently used entries are removed
+    Config.get_spec(second, cache=cache)
+    third = tmp_path / "c.json"
+    third.write_bytes(document)
+    Config.get_spec(third, cache=cache)
+    assert len(entries()) == 2
+    assert cache.key(third.read_bytes(), path=third) in entries()
+
+
+def test_spec_decoder_builds_models_in_one_pass():
+    from src.utils.spec_decoder import SpecDecoder
+
+    templates = Path(__file__).parent.parent / "src/templates"
+    decoder = SpecDecoder()
+    data = (templates / "test.json").read_bytes()
+    assert decoder.decode(data) == CustomDecoder().decode_openapi(
+        msgspec.json.decode(data)
+    )
+
+    # Schema extensions, unknown keywords and YAML integer keys are tolerated
+    spec = decoder.decode(
+        b"""
+openapi: 3.0.0
+info: {title: t, version: "1"}
+paths:
+  /pets/{id}:
+    get:
+      x-dymock-pool: 2
+      responses:
+        200:
+          description: ok
+          content:
+            application/json:
+              schema:
+                type: object
+                title: Pet
+                x-internal: true
+                properties:
+                  owner: {$ref: "#/components/schemas/Owner"}
+""",
+        format="yaml",
+    )
+    operation = spec.paths["/pets/{id}"].get
+    assert operation.extensions == {"x-dymock-pool": 2}
+    schema = operation.responses["200"].content["application/json"].schema
+    assert isinstance(schema, SchemaObject) and schema.required == []
+    assert schema.properties["owner"] == ReferenceObject(
+        ref="#/components/schemas/Owner"
+    )
+
+
+def test_external_file_references_are_bundled(tmp_path, monkeypatch):
+    from src.utils import bundler
+    from src.utils.config import Config
+    from src.utils.ref_resolver import RefResolver
+
+    (tmp_path / "schemas").mkdir()
+    (tmp_path / "schemas" / "pet.yaml").write_text(
+        """
+Pet:
+  type: object
+  properties:
+    owner: {$ref: "#/Owner"}
+    tag: {$ref: "common.json#/Tag"}
+    children: {type: array, items: {$ref: "#/Pet"}}
+Owner: {type: string}
+"""
+    )
+    (tmp_path / "schemas" / "common.json").write_text('{"Tag": {"type": "string"}}')
+    (tmp_path / "main.yaml").write_text(
+        """
+openapi: 3.0.0
+info: {title: t, version: "1"}
+paths:
+  /pets:
+    get:
+      responses:
+        200:
+          description: ok
+          content:
+            application/json:
+              schema: {$ref: "./schemas/pet.yaml#/Pet"}
+        404: {$ref: "responses.yaml#/NotFound"}
+"""
+    )
+    (tmp_path / "responses.yaml").write_text(
+        """
+NotFound:
+  description: missing
+  content:
+    application/json:
+      schema: {$ref: "schemas/common.json#/Tag"}
+"""
+    )
+    parsed = []
+    parse_file = bundler._parse_file
+    monkeypatch.setattr(
+        bundler, "_parse_file", lambda path: parsed.append(path) or parse_file(path)
+    )
+    monkeypatch.setattr(bundler, "DOCUMENT_CACHE", bundler.DocumentCache())
+
+    spec = Config.get_spec(tmp_path / "main.yaml")
+    responses = spec.paths["/pets"].get.responses
+    assert responses["200"].content["application/json"].schema.ref == (
+        "#/components/schemas/Pet"
+    )
+    assert responses["404"].ref == "#/components/responses/NotFound"
+    resolver = RefResolver(spec)
+    assert not resolver.unresolved
+    pet = spec.components.schemas["Pet"]
+    assert resolver.resolve(pet.properties["tag"]).type == "string"
+    assert pet.properties["children"].items.ref == "#/components/schemas/Pet"
+
+    # Each file is parsed once, and again only once it changes
+    assert len(parsed) == 3
+    Config.get_spec(tmp_path / "main.yaml")
+    assert len(parsed) == 3
+    common = tmp_path / "schemas" / "common.json"
+    os.utime(common, ns=(0, common.stat().st_mtime_ns + 1))
+    Config.get_spec(tmp_path / "main.yaml")
+    assert len(parsed) == 4
+
+
+def test_spec_files_are_decoded_from_a_mapped_buffer(tmp_path):
+    from src.utils.config import Config
+
+    petstore = (
+        Path(__file__).parent.parent / "src/templates/petstore.json"
+    ).read_bytes()
+    expected = Config.get_spec(
+        Path(__file__).parent.parent / "src/templates/petstore.json"
+    )
+
+    with_bom = tmp_path / "bom.json"
+    with_bom.write_bytes(b"\xef\xbb\xbf" + petstore)
+    assert Config.get_spec(with_bom) == expected
+
+    for name, data in [("empty.json", b""), ("blank.yaml", b" \n\t\n")]:
+        (tmp_path / name).write_bytes(data)
+        with pytest.raises(ValueError, match="is empty"):
+            Config.get_spec(tmp_path / name)
+
+    for name, data in [
+        ("utf16.json", petstore.decode().encode("utf-16")),
+        ("latin1.json", petstore.replace(b'"Swagger', b'"Sw\xe4gger', 1)),
+    ]:
+        (tmp_path / name).write_bytes(data)
+        with pytest.raises(ValueError, match="must be UTF-8 encoded"):
+            Config.get_spec(tmp_path / name)
+
+
+def test_spec_index_matches_templates_and_finds_operations():
+    from src.utils.spec_decoder import SpecDecoder
+    from src.utils.spec_index import SpecIndex
+
+    def operation(operation_id):
+        return {
+            "operationId": operation_id,
+            "responses": {"200": {"description": "OK"}},
+        }
+
+    document = {
+        "openapi": "3.0.0",
+        "info": {"title": "Index", "version": "1.0.0"},
+        "paths": {
+            "/pets/{petId}": {"get": operation("getPet")},
+            "/pets/mine": {"get": operation("myPets"), "post": operation("adopt")},
+            "/pets/{petId}/toys/{toyId}": {"get": operation("getToy")},
+            "/files/{name}.{ext}": {"get": operation("getFile")},
+            "/pets/mine/{name}": {"delete": operation("release")},
+            "/unnamed": {"get": operation(None)},
+        },
+        "components": {"schemas": {"Pet/Owner": {"type": "string"}}},
+    }
+
+    for lazy in (False, True):
+        spec = SpecDecoder().convert(document, lazy=lazy)
+        index = SpecIndex(spec)
+        if lazy:
+            assert spec.paths.decoded == 0
+
+        assert index.match("/pets/mine") == ("/pets/mine", {})
+        assert index.match("/pets/7") == ("/pets/{petId}", {"petId": "7"})
+        assert index.match("/pets/mine/toys/2") == (
+            "/pets/{petId}/toys/{toyId}",
+            {"petId": "mine", "toyId": "2"},
+        )
+        assert index.match("/files/report.tar.gz") == (
+            "/files/{name}.{ext}",
+            {"name": "report", "ext": "tar.gz"},
+        )
+        assert index.match("/pets") is None
+        assert index.match("/pets/") is None
+
+        assert index.methods("/pets/mine") == ("get", "post")
+        method, path, found = index.by_operation_id("getToy")
+        assert (method, path) == ("get", "/pets/{petId}/toys/{toyId}")
+        assert found.operationId == "getToy"
+        assert index.by_operation_id("missing") is None
+        # Operations without an operationId go by their generated name
+        assert index.operation_ids["get__unnamed"] == ("get", "/unnamed")
+
+        owner = index.component("#/components/schemas/Pet~1Owner")
+        assert owner is index.components["schemas"]["Pet/Owner"]
+        assert owner.type == "string"
+
+
+def test_bundled_components_never_replace_root_components(tmp_path):
+    from fastapi.testclient import TestClient
+
+    from src.service.server import MockServer
+
+    (tmp_path / "other.yaml").write_text(
+        """
+components:
+  schemas:
+    Pet: {type: string, enum: [external]}
+"""
+    )
+    (tmp_path / "main.yaml").write_text(
+        """
+openapi: 3.0.0
+info: {title: t, version: "1"}
+paths:
+  /local:
+    get:
+      responses:
+        200:
+          description: ok
+          content:
+            application/json:
+              schema: {$ref: "#/components/schemas/Pet"}
+  /ext:
+    get:
+      responses:
+        200:
+          description: ok
+          content:
+            application/json:
+              schema: {$ref: "other.yaml#/components/schemas/Pet"}
+components:
+  schemas:
+    Pet: {type: integer, enum: [42]}
+"""
+    )
+
+    with TestClient(MockServer(str(tmp_path / "main.yaml")).create_app()) as client:
+        assert client.get("/local").json() == 42
+        assert client.get("/ext").json() == "external"
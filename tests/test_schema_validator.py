@@ -0,0 +1,165 @@
+import msgspec
+import pytest
+
+from src.models.reference_object import ReferenceObject
+from src.models.schema_object import SchemaObject
+from src.utils.decoder import CustomDecoder
+from src.utils.ref_resolver import RefResolver
+from src.utils.schema_validator import ValidationError, ValidatorCompiler
+from src.utils.struct_builder import StructBuilder
+
+
+PET_SCHEMA = SchemaObject(
+    type="object",
+    required=["name", "tags"],
+    additionalProperties=False,
+    properties={
+        "name": SchemaObject(type="string", minLength=2, pattern="^[A-Z]"),
+        "age": SchemaObject(type="integer", minimum=0, exclusiveMaximum=30),
+        "kind": SchemaObject(type="string", enum=["cat", "dog"], nullable=True),
+        "tags": SchemaObject(
+            type="array",
+            uniqueItems=True,
+            maxItems=3,
+            items=SchemaObject(type="string", format="uuid"),
+        ),
+    },
+)
+
+TAG = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+
+
+def _resolver(schemas):
+    spec = CustomDecoder().decode_openapi(
+        {
+            "openapi": "3.0.0",
+            "info": {"title": "Test API", "version": "1.0.0"},
+            "paths": {},
+            "components": {"schemas": schemas},
+        }
+    )
+    return RefResolver(spec)
+
+
+def test_valid_values_pass():
+    validate = ValidatorCompiler().compile(PET_SCHEMA)
+
+    validate({"name": "Tom", "age": 3, "kind": None, "tags": [TAG]})
+    validate({"name": "Rex", "age": 29, "kind": "dog", "tags": []})
+
+
+@pytest.mark.parametrize(
+    "value, error",
+    [
+        ([], "Expected object, got array"),
+        ({"name": "Tom"}, "Missing required property: tags"),
+        ({"name": "tom", "tags": []}, "name: 'tom' does not match pattern '^[A-Z]'"),
+        ({"name": "Tom", "age": 30, "tags": []}, "age: 30 is not less than 30"),
+        (
+            {"name": "Tom", "age": True, "tags": []},
+            "age: Expected integer, got boolean",
+        ),
+        (
+            {"name": "Tom", "age": 29.0, "tags": []},
+            "age: Expected integer, got number",
+        ),
+        ({"name": "Tom", "kind": "cow", "tags": []}, "kind: 'cow' is not one of"),
+        ({"name": "Tom", "tags": ["x"]}, "tags[0]: 'x' is not a valid uuid"),
+        ({"name": "Tom", "tags": [TAG, TAG]}, "tags: Array items are not unique"),
+        ({"name": "Tom", "tags": [], "owner": 1}, "Unexpected property: owner"),
+    ],
+)
+def test_invalid_values_report_their_location(value, error):
+    validate = ValidatorCompiler().compile(PET_SCHEMA)
+
+    with pytest.raises(ValidationError) as excinfo:
+        validate(value)
+    assert str(excinfo.value).startswith(error)
+
+
+def test_recursive_references_and_compositions():
+    schemas = {
+        "Node": {
+            "type": "object",
+            "required": ["value"],
+            "properties": {
+                "value": {"oneOf": [{"type": "integer"}, {"type": "string"}]},
+                "next": {"$ref": "#/components/schemas/Node"},
+            },
+        }
+    }
+    compiler = ValidatorCompiler(_resolver(schemas))
+    validate = compiler.compile(ReferenceObject(ref="#/components/schemas/Node"))
+
+    validate({"value": 1, "next": {"value": "two", "next": {"value": 3}}})
+    with pytest.raises(ValidationError, match=r"^next\.next\.value: Value matches 0"):
+        validate({"value": 1, "next": {"value": "two", "next": {"value": 3.5}}})
+
+
+def test_struct_builder_types_component_schemas():
+    resolver = _resolver(
+        {
+            "Pet": {
+                "type": "object",
+                "required": ["pet-name"],
+                "additionalProperties": False,
+                "properties": {
+                    "pet-name": {"type": "string", "maxLength": 5},
+                    "age": {"type": "integer", "minimum": 0},
+                    "kind": {"type": "string", "enum": ["cat", "dog"]},
+                },
+            }
+        }
+    )
+    decoder = StructBuilder(resolver).decoder_for(
+        ReferenceObject(ref="#/components/schemas/Pet")
+    )
+
+    pet = decoder.decode(b'{"pet-name": "Tom", "kind": "cat"}')
+    assert type(pet).__name__ == "Pet"
+    assert msgspec.to_builtins(pet) == {"pet-name": "Tom", "kind": "cat"}
+    for body in (b'{"pet-name": "Tommy2"}', b'{"pet-name": "a", "age": -1}', b"{}"):
+        with pytest.raises(msgspec.ValidationError):
+            decoder.decode(body)
+
+
+@pytest.mark.parametrize(
+    "body, valid",
+    [(b"29", True), (b"29.0", False), (b"29.5", False), (b"true", False)],
+)
+def test_validators_and_typed_decoders_agree_on_integers(body, valid):
+    schema = SchemaObject(type="integer", minimum=0)
+    validate = ValidatorCompiler().compile(schema)
+    decoder = StructBuilder().decoder_for(schema)
+    assert decoder is not None
+
+    outcomes = []
+    for check, error in (
+        (lambda: validate(msgspec.json.decode(body)), ValidationError),
+        (lambda: decoder.decode(body), msgspec.ValidationError),
+    ):
+        try:
+            check()
+            outcomes.append(True)
+        except error:
+            outcomes.append(False)
+    assert outcomes == [valid, valid]
+
+
+def test_openapi_31_type_lists():
+    validate = ValidatorCompiler().compile(
+        SchemaObject(type=["string", "null"], minLength=2)
+    )
+
+    validate("ok")
+    validate(None)
+    with pytest.raises(ValidationError, match="Expected string or null, got integer"):
+        validate(1)
+    with pytest.raises(ValidationError, match="outside 2"):
+        validate("x")
+
+    validate = ValidatorCompiler().compile(SchemaObject(type=["integer", "string"]))
+    validate(1)
+    validate("one")
+    with pytest.raises(ValidationError):
+        validate(None)
@@ -0,0 +1,663 @@
+import json
+import os
+import tempfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.service.server import MockServer
+
+
+def _operation(schema, **extra):
+    return {
+        "operationId": "listItems",
+        "responses": {
+            "200": {
+                "description": "Success",
+                "content": {"application/json": {"schema": schema}},
+            }
+        },
+        **extra,
+    }
+
+
+ITEMS_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "required": ["id", "name"],
+        "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+    },
+}
+
+
+@pytest.fixture
+def spec_file():
+    """Write an OpenAPI document to a temporary file and yield its path."""
+    paths = []
+
+    def write(spec_paths, components=None):
+        spec = {
+            "openapi": "3.0.0",
+            "info": {"title": "Test API", "version": "1.0.0"},
+            "paths": spec_paths,
+        }
+        if components:
+            spec["components"] = components
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(spec, f)
+        paths.append(f.name)
+        return f.name
+
+    yield write
+    for path in paths:
+        os.unlink(path)
+
+
+def test_pooled_route_serves_bodies_round_robin(spec_file):
+    path = spec_file(
+        {"/items": {"get": _operation(ITEMS_SCHEMA, **{"x-dymock-pool": 2})}}
+    )
+    server = MockServer(path)
+
+    with TestClient(server.create_app()) as client:
+        bodies = [client.get("/items").content for _ in range(4)]
+
+    assert bodies[0] == bodies[2]
+    assert bodies[1] == bodies[3]
+    assert all(isinstance(item["id"], int) for item in json.loads(bodies[0]))
+
+
+def test_encoded_responses_do_not_share_their_headers():
+    from src.service.responses import EncodedResponse
+
+    raw_headers = [(b"content-type", b"application/json")]
+    first = EncodedResponse(b"[]", 200, raw_headers)
+    second = EncodedResponse(b"[]", 200, raw_headers)
+    first.headers["x-request-id"] = "1"
+
+    assert "x-request-id" not in second.headers
+    assert raw_headers == [(b"content-type", b"application/json")]
+
+
+def test_responses_without_body_have_no_content_length(spec_file):
+    no_content = {
+        "responses": {
+            "204": {
+                "description": "Deleted",
+                "content": {
+                    "application/json": {
+                        "schema": ITEMS_SCHEMA,
+                        "examples": {"one": {"value": [{"id": 1, "name": "a"}]}},
+                    }
+                },
+            }
+        }
+    }
+    path = spec_file({"/items/{itemId}": {"delete": no_content}})
+    server = MockServer(path, pool_size=4)
+
+    with TestClient(server.create_app()) as client:
+        for headers in ({}, {"prefer": "example=one"}):
+            response = client.delete("/items/3", headers=headers)
+            assert response.status_code == 204
+            assert response.content == b""
+            assert "content-length" not in response.headers
+
+    assert server._pools == []
+
+
+def test_pool_extension_can_opt_out_of_global_pooling(spec_file):
+    path = spec_file(
+        {
+            "/items": {"get": _operation(ITEMS_SCHEMA)},
+            "/fresh": {"get": _operation(ITEMS_SCHEMA, **{"x-dymock-pool": False})},
+        }
+    )
+    server = MockServer(path, pool_size=4)
+
+    with TestClient(server.create_app()) as client:
+        assert client.get("/items").status_code == 200
+        assert client.get("/fresh").status_code == 200
+
+    assert [pool.size for pool in server._pools] == [4]
+
+
+def test_seeded_responses_are_deterministic_per_request(spec_file):
+    path = spec_file({"/items/{itemId}": {"get": _operation(ITEMS_SCHEMA)}})
+
+    def fetch(seed, url):
+        with TestClient(MockServer(path, seed=seed).create_app()) as client:
+            return client.get(url).json()
+
+    first = fetch(42, "/items/1?page=2")
+    assert fetch(42, "/items/1?page=2") == first
+    assert fetch(42, "/items/2?page=2") != first
+    assert fetch(7, "/items/1?page=2") != first
+
+
+def test_large_counts_stream_json_and_ndjson(spec_file):
+    path = spec_file(
+        {"/items": {"get": _operation(ITEMS_SCHEMA, **{"x-dymock-count": 25_000})}}
+    )
+
+    with TestClient(MockServer(path).create_app()) as client:
+        response = client.get("/items")
+        assert response.headers["content-type"] == "application/json"
+        assert "content-length" not in response.headers
+        items = response.json()
+        assert len(items) == 25_000
+        assert all(isinstance(item["id"], int) for item in items)
+
+        response = client.get("/items", headers={"accept": "application/x-ndjson"})
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = response.text.splitlines()
+        assert len(lines) == 25_000
+        assert "name" in json.loads(lines[0])
+
+
+def test_small_counts_fix_array_length_without_streaming(spec_file):
+    path = spec_file(
+        {"/items": {"get": _operation(ITEMS_SCHEMA, **{"x-dymock-count": 7})}}
+    )
+
+    with TestClient(MockServer(path).create_app()) as client:
+        response = client.get("/items")
+
+    assert response.headers["content-length"]
+    assert len(response.json()) == 7
+
+
+def test_msgspec_response_uses_route_headers():
+    from src.service.responses import JSON_CONTENT_TYPE, MsgspecJSONResponse
+
+    response = MsgspecJSONResponse(
+        {"id": 1, "tags": ["a"]}, status_code=201, content_type=JSON_CONTENT_TYPE
+    )
+    assert response.body == b'{"id":1,"tags":["a"]}'
+    assert response.raw_headers == [(b"content-length", b"21"), JSON_CONTENT_TYPE]
+
+    no_content = MsgspecJSONResponse({"id": 1}, status_code=204)
+    assert no_content.body == b""
+    assert (b"content-length", b"8") not in no_content.raw_headers
+
+
+def _example_operation():
+    return {
+        "operationId": "getPet",
+        "responses": {
+            "200": {
+                "description": "Success",
+                "content": {
+                    "application/json": {
+                        "schema": {"type": "object"},
+                        "examples": {
+                            "cat": {"value": {"name": "Tom"}},
+                            "dog": {"$ref": "#/components/examples/Dog"},
+                        },
+                    }
+                },
+            }
+        },
+    }
+
+
+def test_example_first_serves_encoded_examples(spec_file):
+    path = spec_file(
+        {"/pets/{petId}": {"get": _example_operation()}},
+        components={"examples": {"Dog": {"value": {"name": "Rex"}}}},
+    )
+
+    with TestClient(MockServer(path, example_first=True).create_app()) as client:
+        assert client.get("/pets/1").content == b'{"name":"Tom"}'
+        response = client.get("/pets/1", headers={"prefer": "example=dog"})
+        assert response.json() == {"name": "Rex"}
+        assert response.headers["content-length"] == "14"
+        assert client.get("/pets/1?__example=cat").json() == {"name": "Tom"}
+        assert client.get("/pets/1?__example=bird").status_code == 404
+
+
+def test_named_examples_are_selectable_without_example_first(spec_file):
+    operation = _operation({"type": "object", "example": {"id": 1}, "properties": {}})
+    path = spec_file({"/items": {"get": operation}})
+
+    with TestClient(MockServer(path).create_app()) as client:
+        assert client.get("/items").json() != {"id": 1}
+        response = client.get("/items", headers={"prefer": "example=default"})
+        assert response.json() == {"id": 1}
+
+
+@pytest.mark.parametrize(
+    "schema, error",
+    [
+        # Expressible as msgspec types: decoded and validated natively
+        (ITEMS_SCHEMA, "Expected `str`, got `int` - at `$[0].name`"),
+        # uniqueItems is not, so the compiled Python validator is used
+        (
+            {**ITEMS_SCHEMA, "uniqueItems": True},
+            "[0].name: Expected string, got integer",
+        ),
+    ],
+)
+def test_request_bodies_are_validated_against_compiled_schema(spec_file, schema, error):
+    operation = _operation(ITEMS_SCHEMA)
+    operation["requestBody"] = {
+        "required": True,
+        "content": {"application/json": {"schema": schema}},
+    }
+    path = spec_file({"/items": {"post": operation}})
+
+    with TestClient(MockServer(path).create_app()) as client:
+        assert client.post("/items", json=[{"id": 1, "name": "a"}]).status_code == 200
+        response = client.post("/items", json=[{"id": 1, "name": 2}])
+        assert response.status_code == 400
+        assert response.json()["detail"] == f"Request body validation failed: {error}"
+        assert client.post("/items", content=b"{").status_code == 400
+        assert client.post("/items").status_code == 400
+
+
+def test_request_bodies_over_the_size_limit_are_refused(spec_file):
+    operation = _operation(ITEMS_SCHEMA)
+    operation["requestBody"] = {
+        "content": {"application/json": {"schema": ITEMS_SCHEMA}}
+    }
+    path = spec_file({"/items": {"post": operation}})
+
+    with TestClient(MockServer(path, max_body_size=32).create_app()) as client:
+        assert client.post("/items", json=[{"id": 1, "name": "a"}]).status_code == 200
+        response = client.post("/items", json=[{"id": 1, "name": "a" * 32}])
+        assert response.status_code == 413
+        chunked = client.post("/items", content=iter([b"[", b" " * 40, b"]"]))
+        assert chunked.status_code == 413
+
+
+def test_request_body_is_read_once_and_shared_through_the_scope():
+    import asyncio
+
+    from starlette.requests import Request
+
+    from src.service.request_body import parsed_body, read_body, store_body
+
+    messages = [
+        {"type": "http.request", "body": b'{"id": 1,', "more_body": True},
+        {"type": "http.request", "body": b' "extra": true}', "more_body": False},
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    request = Request({"type": "http", "method": "POST", "headers": []}, receive)
+    body = asyncio.run(read_body(request, max_size=1024))
+    store_body(request, body, raw=True)
+
+    assert parsed_body(request) == {"id": 1, "extra": True}
+    assert parsed_body(request) is parsed_body(request)
+
+
+def test_parameters_are_coerced_and_validated(spec_file):
+    pet_schema = {
+        "type": "object",
+        "required": ["petId"],
+        "properties": {"petId": {"type": "integer"}, "name": {"type": "string"}},
+    }
+    path = spec_file(
+        {
+            "/pets/{petId}": {
+                "parameters": [
+                    {"name": "petId", "in": "path", "schema": {"type": "integer"}}
+                ],
+                "get": _operation(
+                    pet_schema,
+                    parameters=[
+                        {
+                            "name": "tags",
+                            "in": "query",
+                            "schema": {"type": "array", "items": {"type": "integer"}},
+                        },
+                        {
+                            "name": "sort",
+                            "in": "query",
+                            "schema": {"type": "string", "enum": ["asc", "desc"]},
+                        },
+                        {
+                            "name": "X-Trace",
+                            "in": "header",
+                            "required": True,
+                            "schema": {"type": "boolean"},
+                        },
+                    ],
+                ),
+            }
+        }
+    )
+    headers = {"x-trace": "true"}
+
+    with TestClient(MockServer(path).create_app()) as client:
+        response = client.get("/pets/42?tags=1&tags=2&sort=asc", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["petId"] == 42
+
+        for url, request_headers, detail in [
+            ("/pets/abc", headers, "Invalid path parameter 'petId': Expected integer"),
+            ("/pets/1?tags=x", headers, "Invalid query parameter 'tags': Expected"),
+            ("/pets/1?sort=up", headers, "Invalid query parameter 'sort': 'up' is not"),
+            ("/pets/1", {}, "Missing required header parameter 'X-Trace'"),
+            ("/pets/1", {"x-trace": "yes"}, "Invalid header parameter 'X-Trace'"),
+        ]:
+            response = client.get(url, headers=request_headers)
+            assert response.status_code == 400
+            assert response.json()["detail"].startswith(detail)
+
+
+def test_openapi_31_type_lists_are_validated(spec_file):
+    operation = _operation({"type": ["string", "null"]}, operationId="create")
+    operation["requestBody"] = {
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"name": {"type": ["string", "null"]}},
+                }
+            }
+        }
+    }
+    server = MockServer(spec_file({"/pets": {"post": operation}}))
+
+    with TestClient(server.create_app()) as client:
+        assert client.post("/pets", json={"name": None}).status_code == 200
+        assert client.post("/pets", json={"name": "Rex"}).status_code == 200
+        response = client.post("/pets", json={"name": 1})
+        assert response.status_code == 400
+        assert "Expected string or null, got integer" in response.json()["detail"]
+
+
+def test_validation_policies_count_and_can_be_changed_at_runtime(spec_file):
+    def post_operation(operation_id, **extra):
+        operation = _operation(ITEMS_SCHEMA, operationId=operation_id, **extra)
+        operation["requestBody"] = {
+            "content": {"application/json": {"schema": ITEMS_SCHEMA}}
+        }
+        return operation
+
+    path = spec_file(
+        {
+            "/strict": {"post": post_operation("strict")},
+            "/search": {"post": post_operation("search", tags=["search"])},
+            "/logged": {
+                "post": post_operation("logged", **{"x-dymock-validation": "log-only"})
+            },
+        }
+    )
+    server = MockServer(path, tag_validation={"search": "off"})
+    invalid = [{"id": 1, "name": 2}]
+
+    def counters(client):
+        routes = client.get("/__dymock/stats").json()["routes"]
+        return {
+            route["operationId"]: (
+                route["validation"]["mode"],
+                route["validated"],
+                route["skipped"],
+                route["failed"],
+            )
+            for route in routes
+        }
+
+    with TestClient(server.create_app()) as client:
+        assert client.post("/strict", json=invalid).status_code == 400
+        assert client.post("/search", json=invalid).status_code == 200
+        assert client.post("/logged", json=invalid).status_code == 200
+        assert counters(client) == {
+            "strict": ("strict", 1, 0, 1),
+            "search": ("off", 0, 1, 0),
+            "logged": ("log-only", 1, 0, 1),
+        }
+
+        response = client.put("/__dymock/validation/strict", json="sampled:0")
+        assert response.status_code == 200
+        assert client.post("/strict", json=invalid).status_code == 200
+        assert counters(client)["strict"] == ("sampled", 1, 1, 1)
+
+        assert client.put("/__dymock/validation/nope", json="off").status_code == 404
+        response = client.put("/__dymock/validation/search", json="log-only")
+        assert [route["path"] for route in response.json()["routes"]] == ["/search"]
+        assert client.put("/__dymock/validation/*", json="loose").status_code == 400
+
+
+def test_log_only_failures_keep_the_body_as_json(spec_file):
+    import asyncio
+
+    from starlette.requests import Request
+
+    from src.service.request_body import parsed_body
+
+    operation = _operation(
+        ITEMS_SCHEMA, operationId="logged", **{"x-dymock-validation": "log-only"}
+    )
+    operation["requestBody"] = {
+        "content": {"application/json": {"schema": ITEMS_SCHEMA}}
+    }
+    server = MockServer(spec_file({"/logged": {"post": operation}}))
+    invalid = [{"id": 1, "name": 2}]
+
+    with TestClient(server.create_app()):
+        plan = server._plans[("post", "/logged")]
+
+    async def receive():
+        return {"type": "http.request", "body": json.dumps(invalid).encode()}
+
+    request = Request({"type": "http", "method": "POST", "headers": []}, receive)
+    asyncio.run(server._ingest_request_body(request, plan))
+    assert plan.validation_stats.failed == 1
+    assert parsed_body(request) == invalid
+
+
+def test_lazy_specs_compile_operations_on_first_request(spec_file):
+    pet_schema = {
+        "type": "object",
+        "properties": {"owner": {"$ref": "#/components/schemas/Owner"}},
+    }
+    path = spec_file(
+        {
+            "/pets/{petId}": {"get": _operation(pet_schema, operationId="getPet")},
+            "/items": {"get": _operation(ITEMS_SCHEMA)},
+        },
+        components={"schemas": {"Owner": {"type": "string", "enum": ["alex"]}}},
+    )
+    server = MockServer(path, lazy=True)
+    paths = server._mock_spec.paths
+
+    with TestClient(server.create_app()) as client:
+        assert paths.decoded == 0
+        assert client.get("/__dymock/stats").json()["routes"] == []
+
+        assert client.get("/pets/1").json() == {"owner": "alex"}
+        assert client.get("/pets/2").status_code == 200
+        assert paths.decoded == 1
+        routes = client.get("/__dymock/stats").json()["routes"]
+        assert [route["operationId"] for route in routes] == ["getPet"]
+        assert client.delete("/pets/1").status_code == 405
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_reload_only_replaces_changed_routes(spec_file, lazy):
+    def spec(owner, extra_paths):
+        return {
+            "openapi": "3.0.0",
+            "info": {"title": "Test API", "version": "1.0.0"},
+            "paths": {
+                "/pets": {
+                    "get": _operation({"type": "integer", "enum": [1]}, operationId="p")
+                },
+                "/owner": {
+                    "get": _operation(
+                        {"$ref": "#/components/schemas/Owner"}, operationId="owner"
+                    )
+                },
+                **extra_paths,
+            },
+            "components": {"schemas": {"Owner": {"type": "string", "enum": [owner]}}},
+        }
+
+    gone = {"/gone": {"get": _operation({"type": "boolean"}, operationId="gone")}}
+    path = spec_file({})
+    with open(path, "w") as f:
+        json.dump(spec("alex", gone), f)
+    server = MockServer(path, lazy=lazy, watch=True)
+
+    with TestClient(server.create_app()) as client:
+        assert client.get("/owner").json() == "alex"
+        assert client.get("/gone").status_code == 200
+        unchanged = server._routes[("get", "/pets")]
+
+        added = {"/new": {"get": _operation({"type": "string", "enum": ["hi"]})}}
+        with open(path, "w") as f:
+            json.dump(spec("sam", added), f)
+        diff = client.portal.call(server.reload)
+
+        assert diff.added == [("get", "/new")]
+        assert diff.removed == [("get", "/gone")]
+        assert diff.replaced == [("get", "/owner")]
+        assert server._routes[("get", "/pets")] is unchanged
+        assert client.get("/owner").json() == "sam"
+        assert client.get("/new").json() == "hi"
+        assert client.get("/gone").status_code == 404
+        assert client.get("/pets").json() == 1
+
+        # An invalid spec is reported and the routes are left as they were
+        with open(path, "w") as f:
+            f.write("{")
+        assert client.portal.call(server.reload) is None
+        assert client.get("/new").json() == "hi"
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_radix_router_dispatches_spec_operations(spec_file, lazy):
+    pet_schema = {
+        "type": "object",
+        "required": ["petId"],
+        "properties": {"petId": {"type": "integer"}},
+    }
+    id_parameter = {"name": "petId", "in": "path", "schema": {"type": "integer"}}
+    path = spec_file(
+        {
+            "/pets/{petId}": {
+                "parameters": [id_parameter],
+                "get": _operation(pet_schema, operationId="getPet"),
+                "delete": _operation({"type": "boolean"}, operationId="deletePet"),
+            },
+            "/pets/mine": {"get": _operation({"type": "string", "enum": ["mine"]})},
+            "/files/{name}.json": {
+                "post": _operation(
+                    {"type": "boolean"},
+                    operationId="upload",
+                    requestBody={
+                        "required": True,
+                        "content": {
+                            "application/json": {"schema": {"type": "integer"}}
+                        },
+                    },
+                )
+            },
+        }
+    )
+    server = MockServer(path, router="radix", lazy=lazy)
+
+    with TestClient(server.create_app()) as client:
+        assert client.get("/pets/mine").json() == "mine"
+        assert client.get("/pets/42").json()["petId"] == 42
+        assert client.delete("/pets/42").status_code == 200
+        assert client.get("/pets/abc").status_code == 400
+        assert client.post("/files/report.json", json=1).status_code == 200
+        assert client.post("/files/report.json", json="x").status_code == 400
+
+        response = client.put("/pets/42")
+        assert response.status_code == 405
+        assert response.headers["allow"] == "GET, DELETE"
+        assert client.get("/pets").status_code == 404
+        assert client.get("/files/report.txt").status_code == 404
+
+        assert client.get("/__dymock/stats").status_code == 200
+        assert client.get("/docs").status_code == 200
+
+    with pytest.raises(ValueError, match="Unknown router"):
+        MockServer(path, router="regex")
+
+
+def test_radix_router_follows_reloads(spec_file):
+    def spec(paths):
+        return {
+            "openapi": "3.0.0",
+            "info": {"title": "Test API", "version": "1.0.0"},
+            "paths": paths,
+        }
+
+    pet = {"get": _operation({"type": "string", "enum": ["pet"]})}
+    path = spec_file({})
+    with open(path, "w") as f:
+        json.dump(spec({"/pets/{petId}": pet}), f)
+    server = MockServer(path, router="radix", watch=True)
+
+    with TestClient(server.create_app()) as client:
+        assert client.get("/pets/mine").json() == "pet"
+
+        mine = {"get": _operation({"type": "string", "enum": ["mine"]})}
+        with open(path, "w") as f:
+            json.dump(spec({"/pets/mine": mine, "/owners/{ownerId}": pet}), f)
+        client.portal.call(server.reload)
+
+        assert client.get("/pets/mine").json() == "mine"
+        assert client.get("/pets/7").status_code == 404
+        assert client.get("/owners/7").json() == "pet"
+        assert len(server._spec_router) == 2
+
+
+def test_asgi_fast_path_serves_operations_without_fastapi(spec_file):
+    path = spec_file(
+        {
+            "/items": {
+                "get": _operation(ITEMS_SCHEMA, **{"x-dymock-pool": 2}),
+                "post": _operation(
+                    {"type": "boolean"},
+                    operationId="createItem",
+                    requestBody={
+                        "required": True,
+                        "content": {
+                            "application/json": {"schema": {"type": "integer"}}
+                        },
+                    },
+                ),
+            },
+            "/stream": {
+                "get": _operation(
+                    ITEMS_SCHEMA, operationId="stream", **{"x-dymock-count": 20_000}
+                )
+            },
+        }
+    )
+    server = MockServer(path, router="radix")
+    app = server.create_asgi_app()
+
+    with TestClient(app) as client:
+        bodies = [client.get("/items").content for _ in range(3)]
+        assert bodies[0] == bodies[2]
+        response = client.get("/items")
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["content-length"] == str(len(response.content))
+
+        assert client.post("/items", json=3).status_code == 200
+        response = client.post("/items", json="three")
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("Request body validation failed")
+
+        assert len(client.get("/stream").json()) == 20_000
+
+        # Everything but spec operations is left to the FastAPI app
+        assert client.delete("/items").status_code == 405
+        assert client.get("/missing").status_code == 404
+        stats = client.get("/__dymock/stats").json()["routes"]
+        create = next(route for route in stats if route["operationId"] == "createItem")
+        assert (create["validated"], create["failed"]) == (2, 1)
+
+    with pytest.raises(ValueError, match="router='radix'"):
+        MockServer(path).create_asgi_app()